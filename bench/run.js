@@ -0,0 +1,442 @@
+// Benchmark jalur data dashboard (App) di atas data sintetis.
+//
+//   npm run bench                                   -> ukuran 10k & 100k
+//   npm run bench -- --sizes=10000,100000,1000000
+//   npm run bench -- --save                         -> simpan sebagai baseline
+//   npm run bench -- --check                        -> exit 1 jika ada regresi
+//   npm run bench -- --runs=5                       -> median dari 5 putaran (default 3)
+//
+// Setiap ukuran menjalankan mock/api_server.js di port acak (history kamera &
+// AI masing-masing `size` record) lalu mengukur jalur yang dijalankan App:
+//   load      : direktori user (fetchAllPages), PAGE_CLICKS halaman kamera
+//               lewat page window (+ prefetch), history AI DASHBOARD_MONTHS
+//               bulan terakhir (fetchByMonth + fetchAllPages, seperti
+//               getHistoryAiRange), seed & satu sync `since` (history_sync.js)
+//   memory    : heap setelah store + index pencarian + matriks kehadiran terbentuk
+//   search    : bangun index, query dashboard (index) dan filter halaman (compileQuery)
+//   aggregate : matriks kehadiran (bangun, data modal detail, heatmap satu
+//               bulan, ukuran), update inkremental satu batch live feed
+//   chart     : series keletihan + histogram mood satu device (modal detail)
+//               dan seluruh store
+//   export    : export CSV history kamera + AI lewat streamSourcePages
+//   transport : ukuran & waktu parse satu halaman 5000 record, JSON biasa vs columnar
+//
+// Hasil dibandingkan dengan bench/baseline.json; metrik yang lebih lambat dari
+// baseline melebihi `--threshold` (default 25%) dilaporkan sebagai regresi.
+// Jalankan dengan `node --expose-gc` (sudah di script npm) agar angka memori stabil.
+
+import { readFileSync, writeFileSync, existsSync } from "node:fs";
+import { fileURLToPath } from "node:url";
+import os from "node:os";
+import { createMockApiServer } from "../mock/api_server.js";
+import { fetchAllPages } from "../src/paginate.js";
+import { createPageWindow, readPageMeta } from "../src/page_window.js";
+import { decodeHistoryBody } from "../src/columnar.js";
+import { createRecordStore, toDateKey } from "../src/record_store.js";
+import { createRecordRetention } from "../src/record_retention.js";
+import { createHistorySync } from "../src/history_sync.js";
+import { fetchByMonth, monthRange, recentMonthsRange } from "../src/time_range.js";
+import { createSearchIndex, compileQuery } from "../src/search_index.js";
+import { createAttendanceMatrix } from "../src/attendance_matrix.js";
+import { buildFatigueSeries, moodHistogram } from "../src/downsample.js";
+import { createUserRegistry } from "../src/user_registry.js";
+
+const BASELINE_PATH = fileURLToPath(new URL("./baseline.json", import.meta.url));
+
+// Perbedaan di bawah ini dianggap noise, berapa pun persentasenya
+const NOISE_FLOOR_MS = 2;
+const NOISE_FLOOR_MB = 2;
+
+// Sama dengan DASHBOARD_MONTHS di App.jsx; "sekarang" = akhir data sintetis
+const DASHBOARD_MONTHS = 3;
+const DATASET_NOW = new Date(2025, 5, 30);
+// Jumlah halaman kamera yang dibuka berurutan (seperti klik "berikutnya")
+const PAGE_CLICKS = 20;
+
+const QUERIES = ["iqbal", "bahagia", "cam-0001", "2025-03", "siti hadir", "admin netral", "tidakada"];
+const QUERY_REPEATS = 15;
+
+const parseArgs = (argv) => {
+  const args = { sizes: [10000, 100000], runs: 3, save: false, check: false, threshold: 0.25, out: null };
+  for (const arg of argv) {
+    const [name, value] = arg.replace(/^--/, "").split("=");
+    if (name === "sizes") args.sizes = value.split(",").map(Number).filter(Boolean);
+    else if (name === "runs") args.runs = Math.max(1, Number(value) || 1);
+    else if (name === "save") args.save = true;
+    else if (name === "check") args.check = true;
+    else if (name === "threshold") args.threshold = Number(value);
+    else if (name === "out") args.out = value;
+  }
+  return args;
+};
+
+const now = () => performance.now();
+
+const round = (value, digits = 2) => Number(value.toFixed(digits));
+
+const measure = async (fn) => {
+  const start = now();
+  const result = await fn();
+  return { ms: round(now() - start), result };
+};
+
+const percentiles = (samples) => {
+  const sorted = [...samples].sort((a, b) => a - b);
+  const at = (p) => sorted[Math.min(sorted.length - 1, Math.floor(p * sorted.length))];
+  return { p50: round(at(0.5)), p95: round(at(0.95)) };
+};
+
+const heapMB = () => {
+  globalThis.gc?.();
+  return round(process.memoryUsage().heapUsed / 1024 / 1024, 1);
+};
+
+const listen = (server) =>
+  new Promise((resolve) => server.listen(0, "127.0.0.1", () => resolve(`http://127.0.0.1:${server.address().port}`)));
+
+const fetchJson = async (url) => {
+  const response = await fetch(url);
+  if (!response.ok) throw new Error(`${url} -> ${response.status}`);
+  return response.json();
+};
+
+const fetchPageMeta = async (url, page) => readPageMeta(await fetchJson(url), page);
+
+const benchLoad = async (origin) => {
+  const users = await measure(async () => {
+    const registry = createUserRegistry({
+      fetchUsers: async () => {
+        const result = await fetchAllPages(
+          (page) => fetchPageMeta(`${origin}/api/v1/user/public?page=${page}&limit=500`, page),
+          { maxPages: Infinity }
+        );
+        return result.data;
+      },
+    });
+    await registry.load();
+    return registry;
+  });
+
+  // Store bersama seperti di App: halaman yang tampil dipegang retensi,
+  // record AI dashboard dimiliki sync
+  const store = createRecordStore();
+  let aiSync = null;
+  const retention = createRecordRetention({ store, isPinned: (id) => aiSync.owns(id) });
+  aiSync = createHistorySync({
+    fetchSince: async (since) => {
+      const body = await fetchJson(`${origin}/history_ai/get${since === null ? "" : `?since=${since}`}`);
+      return { items: body.data || [], deleted: body.deleted || [] };
+    },
+    store,
+    isHeld: retention.isHeld,
+  });
+
+  const cameraPages = createPageWindow({
+    fetchPage: (page) => fetchPageMeta(`${origin}/history/get?page=${page}`, page),
+  });
+  const pageSamples = [];
+  for (let page = 1; page <= PAGE_CLICKS; page++) {
+    const start = now();
+    const result = await cameraPages.load(page);
+    retention.hold("camera", result.items);
+    pageSamples.push(now() - start);
+  }
+  const pageLoad = percentiles(pageSamples);
+
+  const range = await measure(() =>
+    fetchByMonth(async (month) => {
+      const { start, end } = monthRange(month);
+      const result = await fetchAllPages(
+        (page) => fetchPageMeta(`${origin}/history_ai/get?start=${start}&end=${end}&page=${page}`, page),
+        { maxPages: 100 }
+      );
+      if (result.errors.length > 0) throw result.errors[0].error;
+      return result.data;
+    }, recentMonthsRange(DASHBOARD_MONTHS, DATASET_NOW))
+  );
+  const seed = await measure(() => aiSync.seed(range.result));
+  const sync = await measure(() => aiSync.sync());
+
+  return {
+    metrics: {
+      usersMs: users.ms,
+      pageP50Ms: pageLoad.p50,
+      pageP95Ms: pageLoad.p95,
+      rangeMs: range.ms,
+      seedMs: seed.ms,
+      syncMs: sync.ms,
+      records: store.size(),
+    },
+    store,
+    registry: users.result,
+  };
+};
+
+const benchSearch = (store) => {
+  const built = now();
+  const index = createSearchIndex({ store });
+  const indexMs = round(now() - built);
+
+  const indexSamples = [];
+  const filterSamples = [];
+  // Halaman tab kamera / AI: filter predicate di atas satu halaman (50 record)
+  const page = store.values().slice(0, 50);
+  for (let repeat = 0; repeat < QUERY_REPEATS; repeat++) {
+    for (const query of QUERIES) {
+      // Query berbeda setiap putaran agar cache hasil terakhir tidak terpakai
+      const term = repeat % 2 === 0 ? query : `${query} `;
+      let start = now();
+      index.search(term);
+      indexSamples.push(now() - start);
+      start = now();
+      page.filter(compileQuery(term));
+      filterSamples.push(now() - start);
+    }
+  }
+  const searchIndex = percentiles(indexSamples);
+  const pageFilter = percentiles(filterSamples);
+  return {
+    metrics: {
+      indexMs,
+      queryP50Ms: searchIndex.p50,
+      queryP95Ms: searchIndex.p95,
+      pageFilterP95Ms: pageFilter.p95,
+    },
+    index,
+  };
+};
+
+// Matriks kehadiran seperti readAttendance di App (series & total harian,
+// heatmap bulan record yang dibuka, sel milik device record tersebut)
+const readAttendance = (matrix, record) => {
+  const month = (toDateKey(record.datetime) || "").slice(0, 7);
+  const heatmap = matrix.monthHeatmap(month);
+  return {
+    attendanceData: matrix.daySeries(),
+    attendanceTotals: matrix.totals(),
+    userCells: heatmap.dates.map((date) => matrix.cellFor(record.guid_device, date)),
+  };
+};
+
+const benchAggregate = (store, registry) => {
+  let start = now();
+  const matrix = createAttendanceMatrix({ store, registry });
+  const matrixTotals = matrix.totals();
+  const matrixMs = round(now() - start);
+
+  const records = store.values().slice(0, 20);
+  start = now();
+  for (const record of records) readAttendance(matrix, record);
+  const detailMs = round(now() - start);
+
+  const months = matrix.months();
+  start = now();
+  matrix.monthHeatmap(months[months.length - 1]);
+  const heatmapMs = round(now() - start);
+  const matrixKB = round(matrix.byteSize() / 1024, 1);
+
+  // Satu batch live feed: 1000 record baru lalu baca ulang data modal detail
+  const template = store.values()[0];
+  const batch = Array.from({ length: 1000 }, (_, i) => ({ ...template, id: `bench-live-${i}` }));
+  start = now();
+  store.upsertMany(batch);
+  readAttendance(matrix, template);
+  const incrementalMs = round(now() - start);
+
+  start = now();
+  for (const record of store.values().slice(0, 1000)) registry.joinRecord(record);
+  const joinMs = round(now() - start);
+
+  return {
+    metrics: {
+      matrixMs,
+      detailMs,
+      heatmapMs,
+      matrixKB,
+      matrixAbsent: matrixTotals.absent,
+      incrementalMs,
+      join1000Ms: joinMs,
+    },
+    matrix,
+  };
+};
+
+// Grafik modal detail: series keletihan + histogram mood dari record satu device
+const benchChart = (store) => {
+  const chart = (records) => ({ fatigue: buildFatigueSeries(records), moods: moodHistogram(records) });
+  const device = store.devices()[0];
+  let start = now();
+  const single = chart(store.byDevice(device));
+  const deviceMs = round(now() - start);
+  start = now();
+  const all = chart(store.values());
+  const allMs = round(now() - start);
+  return { deviceMs, allMs, points: single.fatigue.points.length + all.fatigue.points.length };
+};
+
+// Export CSV lewat export_stream.js (xlsx / jspdf hanya dimuat untuk format
+// masing-masing); jika modul gagal dimuat bagian ini dilaporkan sebagai dilewati.
+const benchExport = async (origin) => {
+  let exportStream;
+  try {
+    exportStream = await import("../src/export_stream.js");
+  } catch (error) {
+    return { skipped: `export_stream.js tidak bisa dimuat: ${error.message}` };
+  }
+  const { createExportWriter, streamSourcePages, toExportRow } = exportStream;
+  const { ms, result } = await measure(async () => {
+    const writer = await createExportWriter("csv");
+    let rows = 0;
+    for (const path of ["/history/get", "/history_ai/get"]) {
+      for await (const page of streamSourcePages({ url: `${origin}${path}`, params: { limit: 1000 } })) {
+        writer.write(page.items.map(toExportRow));
+        rows += page.items.length;
+      }
+    }
+    const blob = writer.finish();
+    return { rows, bytes: blob.size };
+  });
+  return { csvMs: ms, rows: result.rows, csvMB: round(result.bytes / 1024 / 1024, 1) };
+};
+
+// Satu halaman besar dalam dua format: byte di kabel dan waktu JSON.parse
+// (+ decode ke record untuk columnar), median dari beberapa ulangan
+const benchTransport = async (origin) => {
+  const url = `${origin}/history/get?page=1&limit=5000`;
+  const [jsonText, columnarText] = await Promise.all([
+    fetch(url).then((response) => response.text()),
+    fetch(`${url}&format=columnar`).then((response) => response.text()),
+  ]);
+  const parseMs = (parse) => {
+    const samples = [];
+    for (let i = 0; i < 7; i++) {
+      const start = now();
+      parse();
+      samples.push(now() - start);
+    }
+    return percentiles(samples).p50;
+  };
+  return {
+    jsonKB: round(Buffer.byteLength(jsonText) / 1024, 1),
+    columnarKB: round(Buffer.byteLength(columnarText) / 1024, 1),
+    jsonParseMs: parseMs(() => JSON.parse(jsonText)),
+    columnarParseMs: parseMs(() => decodeHistoryBody(JSON.parse(columnarText))),
+  };
+};
+
+const runSize = async (size) => {
+  const server = createMockApiServer({ historySize: size, aiSize: size, userCount: Math.max(50, Math.round(size / 500)) });
+  const origin = await listen(server);
+  try {
+    const heapBefore = heapMB();
+    const load = await benchLoad(origin);
+    const search = benchSearch(load.store);
+    const aggregate = benchAggregate(load.store, load.registry);
+    const memory = { heapMB: round(heapMB() - heapBefore, 1), rss: round(process.memoryUsage().rss / 1024 / 1024, 1) };
+    const chart = benchChart(load.store);
+    const exported = await benchExport(origin);
+    const transport = await benchTransport(origin);
+    search.index.dispose?.();
+    aggregate.matrix.dispose();
+    return { load: load.metrics, memory, search: search.metrics, aggregate: aggregate.metrics, chart, export: exported, transport };
+  } finally {
+    server.close();
+  }
+};
+
+// Median per metrik dari beberapa putaran (angka satu putaran terlalu berisik)
+const medianOfRuns = (runs) => {
+  const merged = {};
+  for (const [group, metrics] of Object.entries(runs[0])) {
+    merged[group] = {};
+    for (const [name, value] of Object.entries(metrics)) {
+      if (typeof value !== "number") {
+        merged[group][name] = value;
+        continue;
+      }
+      const sorted = runs.map((run) => run[group][name]).sort((a, b) => a - b);
+      merged[group][name] = sorted[Math.floor(sorted.length / 2)];
+    }
+  }
+  return merged;
+};
+
+// { "10000.search.queryP95Ms": 1.2, ... } untuk metrik waktu / memori
+const flatten = (sizes) => {
+  const flat = {};
+  for (const [size, groups] of Object.entries(sizes)) {
+    for (const [group, metrics] of Object.entries(groups)) {
+      for (const [name, value] of Object.entries(metrics)) {
+        if (typeof value === "number" && /Ms$|MB$/.test(name)) flat[`${size}.${group}.${name}`] = value;
+      }
+    }
+  }
+  return flat;
+};
+
+const compare = (current, baseline, threshold) => {
+  const before = flatten(baseline.sizes || {});
+  const after = flatten(current.sizes);
+  const rows = [];
+  for (const [name, value] of Object.entries(after)) {
+    if (!(name in before)) continue;
+    const previous = before[name];
+    const floor = name.endsWith("MB") ? NOISE_FLOOR_MB : NOISE_FLOOR_MS;
+    const change = previous > 0 ? (value - previous) / previous : 0;
+    const regression = value - previous > floor && change > threshold;
+    rows.push({ name, previous, value, change: `${change >= 0 ? "+" : ""}${Math.round(change * 100)}%`, regression });
+  }
+  return rows;
+};
+
+const main = async () => {
+  const args = parseArgs(process.argv.slice(2));
+  const results = {
+    createdAt: new Date().toISOString(),
+    environment: {
+      node: process.version,
+      platform: `${os.platform()} ${os.arch()}`,
+      cpu: os.cpus()[0]?.model,
+      cpus: os.cpus().length,
+      gc: typeof globalThis.gc === "function",
+      runs: args.runs,
+    },
+    sizes: {},
+  };
+
+  for (const size of args.sizes) {
+    console.log(`\n== ${size.toLocaleString("id-ID")} record ==`);
+    const runs = [];
+    for (let run = 0; run < args.runs; run++) runs.push(await runSize(size));
+    results.sizes[size] = medianOfRuns(runs);
+    for (const [group, metrics] of Object.entries(results.sizes[size])) {
+      console.log(`${group.padEnd(10)} ${JSON.stringify(metrics)}`);
+    }
+  }
+
+  if (args.out) writeFileSync(args.out, `${JSON.stringify(results, null, 2)}\n`);
+
+  let regressions = [];
+  if (existsSync(BASELINE_PATH) && !args.save) {
+    const baseline = JSON.parse(readFileSync(BASELINE_PATH, "utf8"));
+    const rows = compare(results, baseline, args.threshold);
+    regressions = rows.filter((row) => row.regression);
+    console.log(`\nDibandingkan dengan baseline ${baseline.createdAt} (${baseline.environment?.cpu || "-"}):`);
+    console.table(rows.map(({ regression, ...row }) => ({ ...row, status: regression ? "REGRESI" : "ok" })));
+  }
+
+  if (args.save) {
+    writeFileSync(BASELINE_PATH, `${JSON.stringify(results, null, 2)}\n`);
+    console.log(`\nBaseline disimpan ke ${BASELINE_PATH}`);
+  }
+
+  if (args.check && regressions.length > 0) {
+    console.error(`\n${regressions.length} metrik melambat lebih dari ${Math.round(args.threshold * 100)}%`);
+    process.exitCode = 1;
+  }
+};
+
+main().catch((error) => {
+  console.error(error);
+  process.exitCode = 1;
+});
@@ -0,0 +1,241 @@
+// Mock server REST pengganti backend history kamera, history AI dan API user
+// presensi, berisi data sintetis dari history_data.js.
+//
+//   node mock/api_server.js                         -> http://localhost:4200
+//   HISTORY_SIZE=1000000 AI_SIZE=100000 USERS=2000 node mock/api_server.js
+//
+// Endpoint (bentuk respons sama dengan backend asli: { data, total, totalPages, ... }):
+//   GET  /history/get?page&limit&since              history kamera, terbaru dulu
+//   GET  /history_ai/get?page&limit&start&end&device&person
+//        (keduanya menerima format=columnar, lihat src/columnar.js)
+//   GET  /api/v1/user/public?id-institution&page&limit
+//   DELETE /history/delete/:id, PUT /history/update/:id
+//   POST /history/delete-bulk, PUT /history/update-bulk
+//
+// Untuk dipakai dari dashboard, jalankan Vite dengan
+// VITE_API_BASE_URL=http://localhost:4200/ VITE_AI_API_BASE_URL=http://localhost:4200
+// VITE_PRESENSI_ORIGIN=http://localhost:4200
+
+import http from "node:http";
+import { fileURLToPath } from "node:url";
+import { createHistoryDataset, generateUsers } from "./history_data.js";
+import { COLUMNAR_FORMAT, encodeColumnar } from "../src/columnar.js";
+
+const DEFAULT_PAGE_SIZE = 100;
+const MAX_PAGE_SIZE = 5000;
+const MAX_SINCE_ITEMS = 5000;
+
+const readBody = (req) =>
+  new Promise((resolve, reject) => {
+    let body = "";
+    req.on("data", (chunk) => (body += chunk));
+    req.on("end", () => {
+      try {
+        resolve(body ? JSON.parse(body) : {});
+      } catch (error) {
+        reject(error);
+      }
+    });
+    req.on("error", reject);
+  });
+
+const send = (res, status, body) => {
+  const payload = body === undefined ? "" : JSON.stringify(body);
+  res.writeHead(status, {
+    "Content-Type": "application/json",
+    "Content-Length": Buffer.byteLength(payload),
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type, Authorization",
+    "Access-Control-Expose-Headers": "Content-Length",
+  });
+  res.end(payload);
+};
+
+const pageParams = (query) => {
+  const page = Math.max(1, Number(query.get("page")) || 1);
+  const limit = Math.min(MAX_PAGE_SIZE, Math.max(1, Number(query.get("limit")) || DEFAULT_PAGE_SIZE));
+  return { page, limit };
+};
+
+const paged = (items, total, { page, limit }) => ({
+  data: items,
+  page,
+  limit,
+  total,
+  totalPages: Math.max(1, Math.ceil(total / limit)),
+});
+
+// Body berisi `data` -> format columnar; datetime dataset sintetis selalu UTC
+const toColumnar = (body) => {
+  if (!Array.isArray(body?.data)) return body;
+  const { data, ...meta } = body;
+  return encodeColumnar(data, { meta, tzOffset: 0 });
+};
+
+// Koleksi history di atas dataset sintetis + perubahan (hapus / patch) selama server hidup
+const createCollection = (dataset, idPattern) => {
+  const deleted = new Set();
+  const patches = new Map();
+
+  const indexOf = (id) => {
+    const match = idPattern.exec(String(id));
+    const index = match ? Number(match[1]) : -1;
+    return index >= 0 && index < dataset.count ? index : -1;
+  };
+
+  const read = (index) => {
+    const record = dataset.recordAt(index);
+    const patch = patches.get(record.id);
+    return patch ? { ...record, ...patch } : record;
+  };
+
+  // Halaman terbaru dulu dalam rentang indeks [from, to), opsional dengan predicate
+  const list = ({ from = 0, to = dataset.count, filter = null }, params) => {
+    const offset = (params.page - 1) * params.limit;
+    const items = [];
+    if (!filter && deleted.size === 0) {
+      const total = to - from;
+      for (let i = to - 1 - offset; i >= from && items.length < params.limit; i--) items.push(read(i));
+      return paged(items, total, params);
+    }
+    let total = 0;
+    for (let i = to - 1; i >= from; i--) {
+      const record = read(i);
+      if (deleted.has(record.id) || (filter && !filter(record))) continue;
+      if (total >= offset && items.length < params.limit) items.push(record);
+      total++;
+    }
+    return paged(items, total, params);
+  };
+
+  // Record lebih baru dari `since` (timestamp ms), terlama dulu
+  const since = (sinceMs) => {
+    const { from } = dataset.indexRange(sinceMs + 1);
+    const items = [];
+    for (let i = from; i < dataset.count && items.length < MAX_SINCE_ITEMS; i++) {
+      const record = read(i);
+      if (!deleted.has(record.id)) items.push(record);
+    }
+    return { data: items, deleted: [...deleted] };
+  };
+
+  const remove = (id) => {
+    if (indexOf(id) < 0 || deleted.has(id)) return false;
+    deleted.add(id);
+    return true;
+  };
+
+  const update = (id, patch) => {
+    if (indexOf(id) < 0 || deleted.has(id)) return false;
+    const { id: _ignored, ...rest } = patch || {};
+    patches.set(id, { ...(patches.get(id) || {}), ...rest });
+    return true;
+  };
+
+  return { list, since, remove, update };
+};
+
+export const createMockApiServer = ({
+  historySize = 10000,
+  aiSize = 10000,
+  userCount = 200,
+  seed = 1,
+  days = 365,
+  latency = 0,
+} = {}) => {
+  const users = generateUsers({ count: userCount, seed });
+  const historyDataset = createHistoryDataset({ count: historySize, users, seed, days, idPrefix: "h" });
+  const aiDataset = createHistoryDataset({ count: aiSize, users, seed: seed + 1, days, idPrefix: "ai" });
+  const history = createCollection(historyDataset, new RegExp(`^h-${seed}-(\\d+)$`));
+  const historyAi = createCollection(aiDataset, new RegExp(`^ai-${seed + 1}-(\\d+)$`));
+
+  const routes = async (req, url) => {
+    const { pathname, searchParams: query } = url;
+    const method = req.method;
+
+    if (method === "GET" && pathname === "/history/get") {
+      const since = query.get("since");
+      if (since !== null) return [200, history.since(Number(since))];
+      return [200, history.list({}, pageParams(query))];
+    }
+
+    if (method === "GET" && pathname === "/history_ai/get") {
+      const start = query.get("start");
+      const end = query.get("end");
+      const device = query.get("device");
+      const person = query.get("person")?.toLowerCase();
+      const since = query.get("since");
+      if (since !== null) return [200, historyAi.since(Number(since))];
+      const { from, to } = aiDataset.indexRange(
+        start ? Date.parse(`${start}T00:00:00Z`) : -Infinity,
+        end ? Date.parse(`${end}T23:59:59Z`) : Infinity
+      );
+      const filter =
+        device || person
+          ? (record) =>
+              (!device || record.guid_device === device) && (!person || record.nama.toLowerCase() === person)
+          : null;
+      return [200, historyAi.list({ from, to, filter }, pageParams(query))];
+    }
+
+    if (method === "GET" && pathname === "/api/v1/user/public") {
+      const params = pageParams(query);
+      const offset = (params.page - 1) * params.limit;
+      return [200, paged(users.slice(offset, offset + params.limit), users.length, params)];
+    }
+
+    const single = /^\/history\/(delete|update)\/([^/]+)$/.exec(pathname);
+    if (single && method === "DELETE" && single[1] === "delete") {
+      const id = decodeURIComponent(single[2]);
+      return history.remove(id) ? [200, { message: "Data berhasil dihapus", id }] : [404, { message: "Data tidak ditemukan" }];
+    }
+    if (single && method === "PUT" && single[1] === "update") {
+      const id = decodeURIComponent(single[2]);
+      const patch = await readBody(req);
+      return history.update(id, patch) ? [200, { message: "Data berhasil diperbarui", id }] : [404, { message: "Data tidak ditemukan" }];
+    }
+
+    if (method === "POST" && pathname === "/history/delete-bulk") {
+      const { ids = [] } = await readBody(req);
+      const deleted = ids.filter((id) => history.remove(id));
+      return [200, { message: `${deleted.length} data dihapus`, deleted }];
+    }
+    if (method === "PUT" && pathname === "/history/update-bulk") {
+      const { ids = [], data = {} } = await readBody(req);
+      const updated = ids.filter((id) => history.update(id, data));
+      return [200, { message: `${updated.length} data diperbarui`, updated }];
+    }
+
+    return [404, { message: "Endpoint tidak ditemukan" }];
+  };
+
+  return http.createServer(async (req, res) => {
+    if (req.method === "OPTIONS") {
+      send(res, 204);
+      return;
+    }
+    try {
+      const url = new URL(req.url, `http://${req.headers.host || "localhost"}`);
+      const [status, body] = await routes(req, url);
+      if (latency > 0) await new Promise((resolve) => setTimeout(resolve, latency));
+      send(res, status, url.searchParams.get("format") === COLUMNAR_FORMAT ? toColumnar(body) : body);
+    } catch (error) {
+      send(res, 500, { message: error.message });
+    }
+  });
+};
+
+if (process.argv[1] === fileURLToPath(import.meta.url)) {
+  const PORT = Number(process.env.PORT || 4200);
+  const server = createMockApiServer({
+    historySize: Number(process.env.HISTORY_SIZE || 10000),
+    aiSize: Number(process.env.AI_SIZE || 10000),
+    userCount: Number(process.env.USERS || 200),
+    seed: Number(process.env.SEED || 1),
+    latency: Number(process.env.LATENCY || 0),
+  });
+  server.listen(PORT, () => {
+    console.log(`Mock API berjalan di http://localhost:${PORT}`);
+  });
+}
@@ -0,0 +1,128 @@
+// Generator data sintetis history kamera / AI dan direktori user untuk mock
+// server dan benchmark.
+//
+// Deterministik: seed + indeks yang sama selalu menghasilkan record yang
+// sama, sehingga hasil benchmark antar mesin / commit bisa dibandingkan.
+// Record ke-i dihitung langsung dari indeksnya (`recordAt`), jadi dataset
+// 1 juta record tidak perlu dibuat seluruhnya di memori untuk di-serve.
+// Waktu record naik monoton terhadap indeks: rentang tanggal bisa
+// diterjemahkan ke rentang indeks tanpa scan.
+
+const FIRST_NAMES = [
+  "Iqbal", "Asep", "Wawan", "Dewi", "Siti", "Budi", "Rina", "Agus", "Yusuf", "Nur",
+  "Fajar", "Intan", "Rizky", "Putri", "Dedi", "Lestari", "Hendra", "Ayu", "Bayu", "Citra",
+];
+const LAST_NAMES = [
+  "Ferdana", "Saputra", "Hidayat", "Lestari", "Pratama", "Wijaya", "Permata", "Kurniawan",
+  "Rahmawati", "Nugroho", "Sari", "Setiawan", "Gunawan", "Purnama", "Maulana",
+];
+const UNITS = ["Admin", "User", "Teknisi", "Keuangan", "Operasional", "Riset"];
+// Bobot mood mengikuti distribusi kasar data produksi (kebanyakan netral)
+const MOODS = [
+  ["Netral", 0.42],
+  ["Bahagia", 0.3],
+  ["Sedih", 0.12],
+  ["Marah", 0.08],
+  ["Tidak Terdeteksi", 0.08],
+];
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+// Hash 32-bit (mulberry32) -> bilangan [0, 1)
+const random = (seed, index, salt = 0) => {
+  let t = (seed ^ Math.imul(index + 1, 0x9e3779b1) ^ Math.imul(salt + 1, 0x85ebca6b)) >>> 0;
+  t = Math.imul(t ^ (t >>> 15), t | 1);
+  t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+  return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+};
+
+const pick = (items, value) => items[Math.floor(value * items.length) % items.length];
+
+const pickWeighted = (weighted, value) => {
+  let acc = 0;
+  for (const [item, weight] of weighted) {
+    acc += weight;
+    if (value < acc) return item;
+  }
+  return weighted[weighted.length - 1][0];
+};
+
+const pad = (value) => String(value).padStart(2, "0");
+
+// Format datetime backend: "YYYY-MM-DD HH:MM:SS" (waktu lokal server = UTC di sini)
+export const formatDatetime = (ms) => {
+  const date = new Date(ms);
+  return (
+    `${date.getUTCFullYear()}-${pad(date.getUTCMonth() + 1)}-${pad(date.getUTCDate())} ` +
+    `${pad(date.getUTCHours())}:${pad(date.getUTCMinutes())}:${pad(date.getUTCSeconds())}`
+  );
+};
+
+export const generateUsers = ({ count = 200, seed = 1 } = {}) =>
+  Array.from({ length: count }, (_, index) => {
+    const name = `${pick(FIRST_NAMES, random(seed, index, 1))} ${pick(LAST_NAMES, random(seed, index, 2))}`;
+    return {
+      guid: `USR-${seed}-${index + 1}`,
+      guid_device: `CAM-${String(index + 1).padStart(5, "0")}`,
+      name: `${name} ${index + 1}`,
+      unit: pick(UNITS, random(seed, index, 3)),
+      detail: `NIP ${19800000 + index}`,
+      photo: `/uploads/users/${index + 1}.jpg`,
+      isDeleted: false,
+    };
+  });
+
+// Dataset history: `count` record selama `days` hari yang berakhir di `endDate`
+export const createHistoryDataset = ({
+  count = 10000,
+  users = generateUsers(),
+  seed = 1,
+  days = 365,
+  endDate = "2025-06-30",
+  idPrefix = "h",
+} = {}) => {
+  const endMs = Date.parse(`${endDate}T23:59:59Z`);
+  const startMs = endMs - days * DAY_MS;
+  const step = (endMs - startMs) / Math.max(1, count);
+
+  const timestampAt = (index) => Math.floor(startMs + index * step + random(seed, index, 4) * step);
+
+  const recordAt = (index) => {
+    const user = users[Math.floor(random(seed, index, 5) * users.length)];
+    const timestamp = timestampAt(index);
+    const present = random(seed, index, 6) > 0.15;
+    return {
+      id: `${idPrefix}-${seed}-${index}`,
+      nama: user.name,
+      guid_device: user.guid_device,
+      datetime: formatDatetime(timestamp),
+      timestamp,
+      keletihan: Math.round(random(seed, index, 7) * 1000) / 10,
+      mood: pickWeighted(MOODS, random(seed, index, 8)),
+      status_absen: present ? "hadir" : "tidak hadir",
+      unit: user.unit,
+      gambar: `${user.guid_device}-${index}.jpg`,
+    };
+  };
+
+  // Rentang indeks [from, to) yang timestamp-nya di [fromMs, toMs]
+  const indexRange = (fromMs = -Infinity, toMs = Infinity) => {
+    const estimate = (ms) => Math.min(count, Math.max(0, Math.floor((ms - startMs) / step)));
+    let from = estimate(fromMs);
+    while (from > 0 && timestampAt(from - 1) >= fromMs) from--;
+    while (from < count && timestampAt(from) < fromMs) from++;
+    let to = estimate(toMs);
+    while (to < count && timestampAt(to) <= toMs) to++;
+    while (to > from && timestampAt(to - 1) > toMs) to--;
+    return { from, to };
+  };
+
+  return { count, users, startMs, endMs, recordAt, timestampAt, indexRange };
+};
+
+// Semua record dalam memori (untuk benchmark yang meniru state App)
+export const materialize = (dataset, { from = 0, to = dataset.count } = {}) => {
+  const records = new Array(to - from);
+  for (let i = from; i < to; i++) records[i - from] = dataset.recordAt(i);
+  return records;
+};
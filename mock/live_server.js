@@ -0,0 +1,91 @@
+// Mock server live feed (SSE) pengganti backend saat development.
+//
+//   node mock/live_server.js            -> http://localhost:4100/history/stream
+//   PORT=5000 INTERVAL=500 node mock/live_server.js
+//
+// Lalu jalankan Vite dengan VITE_LIVE_FEED_URL=http://localhost:4100/history/stream
+// Event disimpan di buffer sehingga klien yang tersambung ulang dengan
+// header Last-Event-ID (atau query ?lastEventId=) menerima event yang terlewat;
+// klien baru mulai dari event terbaru.
+
+import http from "node:http";
+
+const PORT = Number(process.env.PORT || 4100);
+const INTERVAL = Number(process.env.INTERVAL || 2000);
+const BUFFER_SIZE = 1000;
+
+const MOODS = ["Bahagia", "Netral", "Sedih", "Marah"];
+const NAMES = ["Iqbal", "Asep", "Wawan", "Tes"];
+
+const buffer = [];
+const clients = new Set();
+let nextEventId = 1;
+let nextRecordId = 1;
+
+const pad = (value) => String(value).padStart(2, "0");
+
+const createRecord = () => {
+  const now = new Date();
+  const index = Math.floor(Math.random() * NAMES.length);
+  return {
+    id: `mock-${nextRecordId++}`,
+    nama: NAMES[index],
+    guid_device: `CAM-MOCK-${index + 1}`,
+    datetime: `${now.getFullYear()}-${pad(now.getMonth() + 1)}-${pad(now.getDate())} ${pad(now.getHours())}:${pad(now.getMinutes())}:${pad(now.getSeconds())}`,
+    timestamp: now.getTime(),
+    keletihan: Math.round(Math.random() * 100),
+    mood: MOODS[Math.floor(Math.random() * MOODS.length)],
+    status_absen: Math.random() > 0.2 ? "hadir" : "tidak hadir",
+    unit: "User",
+    gambar: "fallback.jpg",
+  };
+};
+
+const formatEvent = (event) =>
+  `id: ${event.id}\nevent: ${event.type}\ndata: ${JSON.stringify(event.data)}\n\n`;
+
+const publish = (type, data) => {
+  const event = { id: nextEventId++, type, data };
+  buffer.push(event);
+  if (buffer.length > BUFFER_SIZE) buffer.shift();
+  for (const res of clients) res.write(formatEvent(event));
+};
+
+const server = http.createServer((req, res) => {
+  const url = new URL(req.url, `http://${req.headers.host}`);
+  if (url.pathname !== "/history/stream") {
+    res.writeHead(404, { "Access-Control-Allow-Origin": "*" });
+    res.end();
+    return;
+  }
+
+  res.writeHead(200, {
+    "Content-Type": "text/event-stream",
+    "Cache-Control": "no-cache",
+    Connection: "keep-alive",
+    "Access-Control-Allow-Origin": "*",
+  });
+  res.write("retry: 2000\n\n");
+
+  // Kirim ulang event yang terlewat sejak id terakhir klien (hanya saat reconnect)
+  const resumeFrom = req.headers["last-event-id"] || url.searchParams.get("lastEventId");
+  if (resumeFrom) {
+    const lastEventId = Number(resumeFrom) || 0;
+    for (const event of buffer) {
+      if (event.id > lastEventId) res.write(formatEvent(event));
+    }
+  }
+
+  clients.add(res);
+  req.on("close", () => clients.delete(res));
+});
+
+setInterval(() => {
+  const record = createRecord();
+  publish("history", record);
+  publish("history_ai", { ...record, id: `${record.id}-ai` });
+}, INTERVAL);
+
+server.listen(PORT, () => {
+  console.log(`Mock live feed berjalan di http://localhost:${PORT}/history/stream`);
+});
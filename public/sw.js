@@ -0,0 +1,109 @@
+// Service worker: foto presensi disimpan di Cache Storage (cache-first),
+// sehingga foto yang pernah dilihat tetap tampil saat offline / cold start.
+// Data history tidak lewat sini, melainkan IndexedDB (src/persist.js).
+
+const PHOTO_CACHE = "presensi-photos-v1";
+const PHOTO_HOSTS = ["monja-file.pptik.id"];
+// Eviction berdasarkan ukuran: foto lama dibuang selama pemakaian storage
+// origin (navigator.storage.estimate, sudah termasuk padding response opaque)
+// melewati bagian ini dari kuota
+const STORAGE_SHARE = 0.5;
+const EVICT_BATCH = 20;
+// Cadangan jika storage.estimate tidak tersedia
+const MAX_PHOTOS = 500;
+
+self.addEventListener("install", () => self.skipWaiting());
+
+self.addEventListener("activate", (event) => {
+  // Hapus cache foto dari versi service worker sebelumnya
+  event.waitUntil(
+    caches
+      .keys()
+      .then((names) =>
+        Promise.all(
+          names
+            .filter((name) => name.startsWith("presensi-photos-") && name !== PHOTO_CACHE)
+            .map((name) => caches.delete(name))
+        )
+      )
+      .then(() => self.clients.claim())
+  );
+});
+
+// Byte di atas anggaran; null jika estimate tidak tersedia
+const bytesOverBudget = async () => {
+  if (!self.navigator?.storage?.estimate) return null;
+  const { usage = 0, quota = 0 } = await self.navigator.storage.estimate();
+  return quota > 0 ? usage - quota * STORAGE_SHARE : null;
+};
+
+// Entry paling lama (urutan cache.keys() = urutan masuk) dibuang per batch
+// sampai pemakaian kembali di bawah anggaran. `minimum` entry tetap dibuang
+// (dipakai setelah QuotaExceededError, saat estimate bisa tertinggal).
+const trimCache = async (cache, { minimum = 0 } = {}) => {
+  const keys = await cache.keys();
+  const over = await bytesOverBudget();
+  if (over === null) {
+    const excess = Math.max(minimum, keys.length - MAX_PHOTOS);
+    await Promise.all(keys.slice(0, excess).map((key) => cache.delete(key)));
+    return;
+  }
+  let index = 0;
+  let remaining = over;
+  while (index < keys.length && (remaining > 0 || index < minimum)) {
+    await Promise.all(keys.slice(index, index + EVICT_BATCH).map((key) => cache.delete(key)));
+    index += EVICT_BATCH;
+    remaining = await bytesOverBudget();
+  }
+};
+
+// Trim dijalankan berurutan agar beberapa foto yang masuk bersamaan tidak
+// menghapus entry yang sama
+let trimming = Promise.resolve();
+const scheduleTrim = (cache, options) => {
+  trimming = trimming.then(() => trimCache(cache, options)).catch(() => {});
+  return trimming;
+};
+
+// Gagal menyimpan (mis. kuota penuh) tidak boleh menggagalkan foto: response
+// network tetap dipakai, cache hanya dibersihkan
+const storePhoto = async (cache, request, response) => {
+  try {
+    await cache.put(request, response);
+  } catch {
+    await scheduleTrim(cache, { minimum: EVICT_BATCH });
+    return;
+  }
+  await scheduleTrim(cache);
+};
+
+const cacheFirst = async (event) => {
+  const { request } = event;
+  let cache = null;
+  try {
+    cache = await caches.open(PHOTO_CACHE);
+    const cached = await cache.match(request);
+    if (cached) return cached;
+  } catch {
+    cache = null;
+  }
+
+  const response = await fetch(request);
+  // Foto dari <img> tanpa CORS berupa response opaque; tetap boleh disimpan
+  if (cache && (response.ok || response.type === "opaque")) {
+    event.waitUntil(storePhoto(cache, request, response.clone()));
+  }
+  return response;
+};
+
+self.addEventListener("fetch", (event) => {
+  const { request } = event;
+  if (request.method !== "GET") return;
+  // Fetch CORS (thumbnail buatan browser, src/thumbnail.js) langsung ke
+  // network: cache ini berisi response opaque dari <img> yang tidak boleh
+  // dipakai untuk request CORS, dan thumbnail punya cache sendiri
+  if (request.mode === "cors") return;
+  const url = new URL(request.url);
+  if (!PHOTO_HOSTS.includes(url.hostname)) return;
+  event.respondWith(cacheFirst(event));
+});
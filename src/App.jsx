@@ -1,458 +1,309 @@
-import { useState, useEffect } from "react";
+import { useState, useEffect, useRef, useMemo, lazy, Suspense } from "react";
 import {
-  getDataCameraHistory,
+  getCameraHistoryPage,
   deleteDataCameraHistory,
+  getCameraHistoryExportSource,
   updateDataCameraHistory,
+  deleteCameraHistoryBulk,
+  updateCameraHistoryBulk,
+  subscribeCameraHistory,
 } from "./api";
-import * as XLSX from "xlsx";
-import jsPDF from "jspdf";
-import "jspdf-autotable";
-import { getAllCameraHistories } from "./ai";
 import {
-  LineChart,
-  Line,
-  CartesianGrid,
-  XAxis,
-  YAxis,
-  Tooltip,
-  Legend,
-  BarChart,
-  Bar,
-  ResponsiveContainer,
-  Cell,
-  PieChart,
-  Pie,
-} from "recharts";
+  getHistoryAiPage,
+  getHistoryAiSince,
+  getHistoryAiExportSource,
+  getHistoryAiRange,
+} from "./ai";
+import { monthRange, recentMonthsRange } from "./time_range";
+import { getInstitutionUsers, PRESENSI_ORIGIN } from "./user_api";
+import { createUserRegistry } from "./user_registry";
+import { createPageWindow } from "./page_window";
+import { createHistorySync } from "./history_sync";
+import { createRecordStore, toDateKey } from "./record_store";
+import { createRecordRetention } from "./record_retention";
+import { createAttendanceMatrix } from "./attendance_matrix";
+import { createWorkerPool, downloadBuffer } from "./worker_pool";
+import { TASK } from "./worker_messages";
+import { createSearchIndex, compileQuery } from "./search_index";
+import { createHistoryPersistence } from "./persist";
+import { createBatchMutator } from "./batch_mutation";
+import { createAtom, createDebouncedAtom } from "./ui_state";
+import { useAtom } from "./components/useAtom";
+import AtomInput from "./components/AtomInput";
+import { prependRecords } from "./live_feed";
+import { perf } from "./perf";
+import { isAbortError } from "./request_scheduler";
+import { loadProfilingRollup, profilingChartSeries } from "./profiling";
+import { useRenderTiming } from "./components/useRenderTiming";
+import { usePerfToggle } from "./components/usePerfToggle";
+import KameraTab from "./tabs/KameraTab";
+
+// Tab selain kamera dan modal grafik (recharts) dimuat saat pertama dibuka,
+// agar bundle awal tab kamera tetap kecil
+const AiTab = lazy(() => import("./tabs/AiTab"));
+const DashboardTab = lazy(() => import("./tabs/DashboardTab"));
+const DashboardUserTab = lazy(() => import("./tabs/DashboardUserTab"));
+const DetailChartModal = lazy(() => import("./components/DetailChartModal"));
+const UserDetailModal = lazy(() => import("./components/UserDetailModal"));
+const PerfPanel = lazy(() => import("./components/PerfPanel"));
+
+const TabFallback = () => <div className="text-center text-gray-500 mt-10">Memuat...</div>;
 
 // Data AI tiruan (jika diperlukan)
 const dummyAiData = [];
 
+// Dashboard memuat history AI beberapa bulan terakhir (query rentang ke
+// server), bukan seluruh isi /history_ai/get
+const DASHBOARD_MONTHS = 3;
+
+const EMPTY_DETAIL_FILTER = {
+  nama: "",
+  guid_device: "",
+  tanggal_hari: "",
+  bulan_tahun: "",
+};
+
 function App() {
+  useRenderTiming("App");
+  const [perfOpen, setPerfOpen] = usePerfToggle();
   const [data, setData] = useState([]);
   const [selectedPhoto, setSelectedPhoto] = useState(null);
   const [selectedUser, setSelectedUser] = useState(null);
-  const [searchTerm, setSearchTerm] = useState("");
-  const [editUnit, setEditUnit] = useState("User");
   const [page, setPage] = useState(1);
-  const [dashboardPage, setDashboardPage] = useState(1);
-  const itemsPerPage = 10;
-  const maxDashboardPages = 5;
+  // Mode scroll: seluruh hasil filter dirender lewat tabel virtual, tanpa pagination
+  const [dashboardScrollAll, setDashboardScrollAll] = useState(false);
   const [tab, setTab] = useState("kamera");
   const [loading, setLoading] = useState(false);
-  const [totalPages, setTotalPages] = useState(5);
+  const [totalPages, setTotalPages] = useState(1);
+  const [aiPageItems, setAiPageItems] = useState([]);
+  const [aiTotalPages, setAiTotalPages] = useState(1);
+  // Bulan yang dipilih di tab AI ("YYYY-MM"); kosong = tampilan per halaman
+  const [aiMonth, setAiMonth] = useState("");
+  const [aiMonthItems, setAiMonthItems] = useState([]);
+  const [aiMonthLoading, setAiMonthLoading] = useState(false);
   const [aiData, setAiData] = useState([]);
   const [message, setMessage] = useState("");
   const [error, setError] = useState("");
-  const [dataHistoriesAi, setDataHistoriesAi] = useState([]);
-  const [searchGrafik, setSearchGrafik] = useState("");
+  const [, setStoreVersion] = useState(0);
+  const [exportProgress, setExportProgress] = useState(null);
+  // Id record yang dicentang untuk hapus / ubah unit massal
+  const [selectedIds, setSelectedIds] = useState(() => new Set());
   const [userData, setUserData] = useState([]);
-  const [grafikFilter, setGrafikFilter] = useState([]);
-  const [attendanceFilter, setAttendanceFilter] = useState({
-  startDate: '',
-  endDate: ''
-});
-  const [detailFilter, setDetailFilter] = useState({
-    nama: '',
-    guid_device: '',
-    tanggal_hari: '',
-    bulan_tahun: ''
-  });
-  const [profilingData, setProfilingData] = useState([]);
-
-  const combinedDashboardData = [
-    ...data,
-    ...dataHistoriesAi.filter(itemAi => !data.some(item => item.id === itemAi.id))
-  ];
-
-  // Data Grafik Data Profiling (Dummy)
-  const prepareProfilingChartData = () => {
-    return profilingData.map(item => ({
-      date: item.date,
-      keletihan: parseFloat(item.keletihan) || 0,
-      bahagia: parseFloat(item.bahagia) || 0,
-      sedih: parseFloat(item.sedih) || 0,
-      marah: parseFloat(item.marah) || 0,
-      netral: parseFloat(item.netral) || 0
-    }));
-  };
-
-  const CustomTooltip = ({ active, payload, label }) => {
-  if (active && payload && payload.length) {
-    return (
-      <div className="bg-white p-4 border rounded shadow">
-        <p className="font-semibold">{`Tanggal: ${new Date(label).toLocaleDateString('id-ID')}`}</p>
-        <p style={{ color: '#4ade80' }}>{`Hadir: ${payload[0].value} orang`}</p>
-        <p style={{ color: '#f87171' }}>{`Tidak Hadir: ${payload[1].value} orang`}</p>
-      </div>
-    );
+  // Rollup profiling dari ai_worker.py (null = belum ada / belum dimuat)
+  const [profilingRollup, setProfilingRollup] = useState(null);
+
+  // Teks input (pencarian, unit di modal / aksi massal) disimpan di atom:
+  // mengetik hanya me-render input-nya, App baru render ulang saat nilai
+  // pencarian yang sudah di-debounce berubah. Halaman dashboard, filter &
+  // granularitas modal detail juga atom: yang render ulang hanya tab / modal
+  // yang membacanya, turunannya (potongan halaman, record & series grafik)
+  // dihitung di sana
+  const atomsRef = useRef(null);
+  if (!atomsRef.current) {
+    const search = createAtom("");
+    atomsRef.current = {
+      search,
+      debouncedSearch: createDebouncedAtom(search, 150),
+      editUnit: createAtom("User"),
+      bulkUnit: createAtom("User"),
+      searchGrafik: createAtom(""),
+      dashboardPage: createAtom(1),
+      detailFilter: createAtom(EMPTY_DETAIL_FILTER),
+      chartGranularity: createAtom("auto"),
+    };
+  }
+  const atoms = atomsRef.current;
+  useEffect(() => () => atoms.debouncedSearch.dispose(), []);
+
+  // Window halaman dari server (hanya beberapa halaman disimpan di memori)
+  const cameraPagesRef = useRef(null);
+  const aiPagesRef = useRef(null);
+  if (!cameraPagesRef.current) {
+    cameraPagesRef.current = createPageWindow({ fetchPage: getCameraHistoryPage });
+    aiPagesRef.current = createPageWindow({ fetchPage: getHistoryAiPage });
   }
-  return null;
-};
-
-  const prepareAttendanceData = () => {
-  // Kelompokkan data per tanggal
-  const attendanceByDate = combinedDashboardData.reduce((acc, curr) => {
-    const date = curr.datetime?.slice(0, 10);
-    if (!date) return acc;
-    
-    if (!acc[date]) {
-      acc[date] = {
-        date,
-        present: 0,
-        absent: 0,
-        total: 0
-      };
-    }
-    
-    // Pastikan logika pengecekan status kehadiran benar
-    if (curr.status_absen?.toLowerCase() === 'hadir') {
-      acc[date].present += 1;
-    } else {
-      acc[date].absent += 1;
-    }
-    
-    acc[date].total = acc[date].present + acc[date].absent;
-    
-    return acc;
-  }, {});
-
-  return Object.values(attendanceByDate)
-    .sort((a, b) => new Date(a.date) - new Date(b.date));
-};
-
 
-  // Menyiapkan Data Diagram Lingkaran Untuk Suasana Hati 
-  const prepareMoodDistributionData = () => {
-    if (profilingData.length === 0) return [];
-
-    // Hitung Presentase Suasana Hati ( Rata - Rata )
-    const totalDays = profilingData.length;
-    const averageMoods = profilingData.reduce((acc, curr) => {
-      acc.bahagia += parseFloat(curr.bahagia) || 0;
-      acc.sedih += parseFloat(curr.sedih) || 0;
-      acc.marah += parseFloat(curr.marah) || 0;
-      acc.netral += parseFloat(curr.netral) || 0;
-      return acc;
-    }, { bahagia: 0, sedih: 0, marah: 0, netral: 0 });
-
-    return [
-      { name: 'Bahagia', value: averageMoods.bahagia / totalDays, fill: '#22c55e' },
-      { name: 'Sedih', value: averageMoods.sedih / totalDays, fill: '#facc15' },
-      { name: 'Marah', value: averageMoods.marah / totalDays, fill: '#ef4444' },
-      { name: 'Netral', value: averageMoods.netral / totalDays, fill: '#3b82f6' }
-    ];
+  // Load halaman terakhir per tab: load baru meng-abort controller load lama
+  // agar respons lambat dari halaman sebelumnya tidak menimpa state. Request
+  // network-nya sendiri dibatalkan oleh scheduler (key supersede di api.js / ai.js).
+  const cameraLoadRef = useRef(null);
+  // Ukuran halaman kamera; default = ukuran halaman bawaan server
+  const cameraPageSizeRef = useRef(100);
+  const aiLoadRef = useRef(null);
+  const beginLoad = (ref) => {
+    ref.current?.abort();
+    ref.current = new AbortController();
+    return ref.current.signal;
   };
 
-  const prepareUserChartData = (userGuid) => {
-    // Filter Data Berdasarkan User Yang Dipilih Selama 1 Bulan Terakhir
-    const oneMonthAgo = new Date();
-    oneMonthAgo.setMonth(oneMonthAgo.getMonth() - 1);
-    
-    const filteredData = dataHistoriesAi.filter(item => {
-      return item.guid_device === userGuid && 
-             new Date(item.datetime) >= oneMonthAgo;
+  // Store record bersama (kamera + AI) dengan index per id / device / nama / tanggal
+  const recordStoreRef = useRef(null);
+  if (!recordStoreRef.current) {
+    recordStoreRef.current = createRecordStore();
+  }
+  const recordStore = recordStoreRef.current;
+
+  // Record yang sedang ditampilkan (halaman kamera / AI, bulan AI, live feed)
+  // dipegang per tampilan; sisanya dibuang dari store kecuali milik sync AI
+  const retentionRef = useRef(null);
+  if (!retentionRef.current) {
+    retentionRef.current = createRecordRetention({
+      store: recordStore,
+      isPinned: (id) => aiSyncRef.current.owns(id),
+    });
+  }
+  const retention = retentionRef.current;
+  // Record live feed terbaru (maksimal satu halaman) yang ikut dipegang
+  const liveRecordsRef = useRef([]);
+
+  // Index pencarian (nama / guid / tanggal / bulan) yang ikut diperbarui store
+  const searchIndexRef = useRef(null);
+  if (!searchIndexRef.current) {
+    searchIndexRef.current = createSearchIndex({ store: recordStore });
+  }
+  const searchIndex = searchIndexRef.current;
+  const refreshStore = () => setStoreVersion(recordStore.getVersion());
+
+  // History AI dashboard: load rentang DASHBOARD_MONTHS sekali ke store,
+  // selanjutnya hanya data baru (since)
+  const aiSyncRef = useRef(null);
+  if (!aiSyncRef.current) {
+    aiSyncRef.current = createHistorySync({
+      fetchSince: getHistoryAiSince,
+      store: recordStore,
+      onChange: refreshStore,
+      isHeld: (id) => retentionRef.current.isHeld(id),
     });
+  }
 
-    // Siapkan Data Keletihan Per Hari
-    const fatigueData = filteredData.reduce((acc, curr) => {
-      const date = curr.datetime?.slice(0, 10);
-      if (!acc[date]) {
-        acc[date] = {
-          date,
-          totalFatigue: 0,
-          count: 0
-        };
-      }
-      acc[date].totalFatigue += parseFloat(curr.keletihan) || 0;
-      acc[date].count += 1;
-      return acc;
-    }, {});
-
-    const fatigueChartData = Object.values(fatigueData).map(item => ({
-      date: item.date,
-      keletihan: item.count > 0 ? (item.totalFatigue / item.count).toFixed(1) : 0
-    }));
-
-    // Siapkan Data Mood Per Hari
-    const moodData = filteredData.reduce((acc, curr) => {
-      const date = curr.datetime?.slice(0, 10);
-      const mood = (curr.mood || "Tidak Terdeteksi").toLowerCase();
-      
-      if (!acc[date]) {
-        acc[date] = {
-          date,
-          moods: {
-            bahagia: 0,
-            sedih: 0,
-            marah: 0,
-            netral: 0,
-            lainnya: 0
-          }
-        };
-      }
-      
-      if (mood.includes("senang") || mood.includes("bahagia")) {
-        acc[date].moods.bahagia += 1;
-      } else if (mood.includes("sedih")) {
-        acc[date].moods.sedih += 1;
-      } else if (mood.includes("marah")) {
-        acc[date].moods.marah += 1;
-      } else if (mood.includes("netral")) {
-        acc[date].moods.netral += 1;
-      } else {
-        acc[date].moods.lainnya += 1;
-      }
-      
-      return acc;
-    }, {});
+  // Salinan store di IndexedDB (beserta cursor & id milik sync AI) untuk cold start / offline
+  const persistenceRef = useRef(null);
+  if (!persistenceRef.current) {
+    persistenceRef.current = createHistoryPersistence({
+      store: recordStore,
+      getMeta: () => ({ aiCursor: aiSyncRef.current.getCursor(), aiIds: aiSyncRef.current.getOwnedIds() }),
+    });
+  }
 
-    const moodChartData = Object.values(moodData).map(item => ({
-      date: item.date,
-      ...item.moods
-    }));
+  // Hapus / ubah unit (satuan maupun massal) langsung diterapkan ke store,
+  // dikembalikan jika request gagal
+  const mutatorRef = useRef(null);
+  if (!mutatorRef.current) {
+    mutatorRef.current = createBatchMutator({
+      store: recordStore,
+      deleteOne: deleteDataCameraHistory,
+      updateOne: updateDataCameraHistory,
+      bulkDelete: deleteCameraHistoryBulk,
+      bulkUpdate: updateCameraHistoryBulk,
+      onChange: refreshStore,
+    });
+  }
+  const mutator = mutatorRef.current;
+
+  // Direktori user institusi (dimuat sekali, di-refresh setelah TTL)
+  const userRegistryRef = useRef(null);
+  if (!userRegistryRef.current) {
+    userRegistryRef.current = createUserRegistry({
+      fetchUsers: getInstitutionUsers,
+      photoBase: PRESENSI_ORIGIN,
+    });
+  }
+  const userRegistry = userRegistryRef.current;
 
-    return { fatigueChartData, moodChartData };
-  };
+  // Kehadiran user direktori x hari (bit matrix); user tanpa record di hari
+  // kerja terhitung tidak hadir
+  const attendanceMatrixRef = useRef(null);
+  if (!attendanceMatrixRef.current) {
+    attendanceMatrixRef.current = createAttendanceMatrix({ store: recordStore, registry: userRegistry });
+  }
+  const attendanceMatrix = attendanceMatrixRef.current;
 
-  const getFilteredDetailData = () => {
-    return combinedDashboardData.filter(item => {
-      const isSelectedUser = item.guid_device === selectedPhoto?.guid_device;
-      const namaMatch = !detailFilter.nama || 
-        (item.nama && item.nama.toLowerCase().includes(detailFilter.nama.toLowerCase()));
-      const guidMatch = !detailFilter.guid_device || 
-        item.guid_device?.includes(detailFilter.guid_device);
-      
-      // Ekstrak Bagian Tanggal dari DateTime (format DD-MM-YYYY)
-      const [day, month, year] = item.datetime?.split('-') || [];
-      
-      // Filter Berdasarkan Hari (DD)
-      const hariMatch = !detailFilter.tanggal_hari || day === detailFilter.tanggal_hari;
-      
-      // Filter Berdasarkan Bulan & Tahun (YYYY-MM)
-      const bulanTahunMatch = !detailFilter.bulan_tahun || 
-        `${year}-${month}` === detailFilter.bulan_tahun;
-      
-      return isSelectedUser && namaMatch && guidMatch && hariMatch && bulanTahunMatch;
-    });
-  };
+  // Worker pool untuk export dashboard, dibuat saat export pertama
+  const workerPoolRef = useRef(null);
+  const exportControllerRef = useRef(null);
 
-  const handleGrafikFilterChange = (e) => {
-    const { name, value } = e.target;
-    setGrafikFilter(prev => ({
-      ...prev,
-      [name]: value
-    }));
-  };
+  // Halaman aktif untuk handler live feed (subscribe hanya sekali)
+  const pageRef = useRef(page);
+  pageRef.current = page;
 
-  const resetGrafikFilter = () => {
-    setGrafikFilter({
-      nama: '',
-      guid_device: '',
-      tanggal: '',
-      bulan: ''
-    });
-  };
+  // Gabungan data kamera + AI tanpa duplikat (dedup lewat index id di store)
+  const combinedDashboardData = recordStore.values();
+  const storeVersion = recordStore.getVersion();
 
-  const getFilteredGrafikData = () => {
-    return combinedDashboardData.filter(item => {
-      // Filter Utama Berdasarkan Karyawan Yang Dipilih
-      const isSelectedUser = item.guid_device === selectedPhoto?.guid_device;
-      
-      // Filter Berdasarkan Input Pengguna
-      const namaMatch = !grafikFilter.nama || 
-        (item.nama && item.nama.toLowerCase().includes(grafikFilter.nama.toLowerCase()));
-      
-      const tanggalMatch = !grafikFilter.tanggal || 
-        (item.datetime && item.datetime.slice(0, 10) === grafikFilter.tanggal);
-      
-      const bulanMatch = !grafikFilter.bulan || 
-        (item.datetime && item.datetime.slice(0, 7) === grafikFilter.bulan);
-      
-      return isSelectedUser && namaMatch && (tanggalMatch || bulanMatch);
-    });
-  };
+  // Data Grafik Profiling user terpilih (30 hari terakhir dari rollup)
+  const profilingChartData = useMemo(
+    () => profilingChartSeries(profilingRollup, selectedUser),
+    [profilingRollup, selectedUser]
+  );
 
-  const prepareGrafikData = () => {
-    const filteredData = getFilteredGrafikData();
-    
-    // Data Untuk Grafik Keletihan
-    const keletihanData = filteredData.map(item => ({
-      tanggal: item.datetime?.slice(0, 10),
-      keletihan: item.keletihan
-    }));
-
-    // Data Untuk Grafik Mood
-    const moodData = Object.entries(
-      filteredData.reduce((acc, curr) => {
-        let mood = (curr.mood || "").toLowerCase();
-        if (mood === "senang") mood = "bahagia";
-        mood = mood.charAt(0).toUpperCase() + mood.slice(1);
-        acc[mood] = (acc[mood] || 0) + 1;
-        return acc;
-      }, {})
-    ).map(([mood, count]) => ({ mood, count }));
-
-    return { keletihanData, moodData };
+  // Series & total kehadiran dari matriks kehadiran, plus heatmap bulan record
+  // yang dibuka (hanya dibaca saat modal detail terbuka, lihat detailOpen)
+  const readAttendance = (record) => {
+    const month = (toDateKey(record.datetime) || "").slice(0, 7);
+    const heatmap = month ? perf.time("aggregate", () => attendanceMatrix.monthHeatmap(month)) : null;
+    return {
+      attendanceData: perf.time("aggregate", () => attendanceMatrix.daySeries()),
+      attendanceTotals: perf.time("aggregate", () => attendanceMatrix.totals()),
+      employeeCount: attendanceMatrix.userCount(),
+      attendanceHeatmap: heatmap && {
+        month,
+        dates: heatmap.dates,
+        rates: heatmap.rates,
+        userCells: heatmap.dates.map((date) => attendanceMatrix.cellFor(record.guid_device, date)),
+      },
+    };
   };
 
-  const { keletihanData, moodData } = prepareGrafikData();
-
-  const fetchUserData = async () => {
+  // Ke network hanya jika registry kosong / sudah lewat TTL (atau force)
+  const fetchUserData = async ({ force = false } = {}) => {
     try {
-      const response = await fetch("https://presensi-api.lskk.co.id/api/v1/user/public?id-institution=CMb80a&isDeleted=false");
-      const data = await response.json();
-      console.log("Data user dari API:", data); // Untuk debugging
-      
-      const usersWithPhoto = data.data.map(user => ({
-        ...user,
-        photo: user.photo 
-          ? user.photo.startsWith('http') 
-            ? user.photo 
-            : `https://presensi-api.lskk.co.id${user.photo}`
-          : null
-      }));
-      
-      setUserData(usersWithPhoto || []);
+      const users = await userRegistry.load({ force });
+      setUserData(users);
     } catch (error) {
       console.error("Gagal mengambil data user:", error);
     }
   };
 
-  const getDataHistoriesAi = async () => {
+  const getDataHistoriesAi = async ({ force = false } = {}) => {
+    const aiSync = aiSyncRef.current;
     try {
-      const response = await getAllCameraHistories(page)
-      setDataHistoriesAi(response)
+      if (aiSync.isSeeded() && !force) {
+        // Sudah pernah load rentang: cukup ambil record yang lebih baru
+        await aiSync.sync();
+      } else {
+        // Record milik sync di luar rentang (bulan yang sudah lewat) ikut dibuang
+        const items = await getHistoryAiRange({ ...recentMonthsRange(DASHBOARD_MONTHS), force });
+        aiSync.seed(items);
+      }
     } catch (error) {
-      console.log(error)
+      // Dibatalkan oleh refresh yang lebih baru
+      if (!isAbortError(error)) console.log(error)
     }
   }
 
   const handleRefreshAi = async () => {
     try {
-      await getDataHistoriesAi();
       setPage(1); // Reset Halaman Ke Awal
-      await getDataHistoriesAi(); // Ambil Data Terbaru Dari Server
+      await getDataHistoriesAi({ force: true }); // Ambil Data Terbaru Dari Server
     } catch (error) {
       console.error("Gagal refresh:", error);
     }
   };
 
-  // Memuat Data Pembuatan Profil
+  // Memuat rollup profiling (dihitung batch oleh ai_worker.py) saat tab
+  // Dashboard User pertama dibuka
   useEffect(() => {
-    // Dalam Aplikasi Nyata, Anda Akan Mengambil ini Dari API
-// Untuk Saat Ini, Kita Akan Menggunakan Data Dummy yang Diimpor
-    const loadProfilingData = async () => {
-      try {
-        // Ini akan digantikan dengan panggilan API yang sebenarnya dalam produksi
-        // const respons = tunggu pengambilan('/api/profiling'); 
-        // const data = tunggu respons.json();
-        setProfilingData([
-          {
-            "_id": "profiling-01",
-            "date": "01-05-2025",
-            "guid": "profiling-01",
-            "userGuid": "profiling",
-            "name": "Profiling",
-            "keletihan": "15",
-            "bahagia": "20",
-            "sedih": "5",
-            "marah": "10",
-            "netral": "50",
-            "createdAt": "2025-05-01T00:00:00.000Z",
-            "updatedAt": "2025-05-01T00:00:00.000Z"
-          },
-          {
-            "_id": "profiling-02",
-            "date": "02-05-2025",
-            "guid": "profiling-02",
-            "userGuid": "profiling",
-            "name": "Profiling",
-            "keletihan": "12",
-            "bahagia": "25",
-            "sedih": "4",
-            "marah": "9",
-            "netral": "50",
-            "createdAt": "2025-05-02T00:00:00.000Z",
-            "updatedAt": "2025-05-02T00:00:00.000Z"
-          },
-          {
-            "_id": "profiling-03",
-            "date": "03-05-2025",
-            "guid": "profiling-03",
-            "userGuid": "profiling",
-            "name": "Profiling",
-            "keletihan": "18",
-            "bahagia": "15",
-            "sedih": "10",
-            "marah": "7",
-            "netral": "50",
-            "createdAt": "2025-05-03T00:00:00.000Z",
-            "updatedAt": "2025-05-03T00:00:00.000Z"
-          },
-          {
-            "_id": "profiling-04",
-            "date": "04-05-2025",
-            "guid": "profiling-04",
-            "userGuid": "profiling",
-            "name": "Profiling",
-            "keletihan": "10",
-            "bahagia": "30",
-            "sedih": "2",
-            "marah": "8",
-            "netral": "50",
-            "createdAt": "2025-05-04T00:00:00.000Z",
-            "updatedAt": "2025-05-04T00:00:00.000Z"
-          },
-          {
-            "_id": "profiling-05",
-            "date": "05-05-2025",
-            "guid": "profiling-05",
-            "userGuid": "profiling",
-            "name": "Profiling",
-            "keletihan": "20",
-            "bahagia": "10",
-            "sedih": "8",
-            "marah": "12",
-            "netral": "50",
-            "createdAt": "2025-05-05T00:00:00.000Z",
-            "updatedAt": "2025-05-05T00:00:00.000Z"
-          },
-          {
-            "_id": "profiling-06",
-            "date": "06-05-2025",
-            "guid": "profiling-06",
-            "userGuid": "profiling",
-            "name": "Profiling",
-            "keletihan": "14",
-            "bahagia": "18",
-            "sedih": "6",
-            "marah": "12",
-            "netral": "50",
-            "createdAt": "2025-05-06T00:00:00.000Z",
-            "updatedAt": "2025-05-06T00:00:00.000Z"
-          },
-          {
-            "_id": "profiling-07",
-            "date": "07-05-2025",
-            "guid": "profiling-07",
-            "userGuid": "profiling",
-            "name": "Profiling",
-            "keletihan": "13",
-            "bahagia": "21",
-            "sedih": "7",
-            "marah": "9",
-            "netral": "50",
-            "createdAt": "2025-05-07T00:00:00.000Z",
-            "updatedAt": "2025-05-07T00:00:00.000Z"
-          }
-        ]);
-      } catch (error) {
-        console.error("Failed to load profiling data:", error);
-      }
-    };
-
-    loadProfilingData();
-  }, []);
+    if (tab !== "dashboardUser" || profilingRollup) return;
+    const controller = new AbortController();
+    loadProfilingRollup(undefined, { signal: controller.signal })
+      .then((rollup) => {
+        if (rollup) setProfilingRollup(rollup);
+      })
+      .catch((error) => {
+        if (error.name !== "AbortError") console.error("Failed to load profiling data:", error);
+      });
+    return () => controller.abort();
+  }, [tab, profilingRollup]);
 
   useEffect(() => {
     if (tab === "dashboardUser") {
@@ -460,133 +311,350 @@ function App() {
     }
   }, [tab]);
 
+  // Tampilkan data terakhir dari IndexedDB dulu, lalu rekonsiliasi dengan server
   useEffect(() => {
-    getDataHistoriesAi()
+    let cancelled = false;
+    const start = async () => {
+      try {
+        const { count, meta } = await persistenceRef.current.hydrate();
+        if (cancelled) return;
+        if (count > 0) {
+          aiSyncRef.current.resume(meta.aiCursor, meta.aiIds);
+          refreshStore();
+        }
+      } catch (error) {
+        console.error("Gagal memuat history offline:", error);
+      }
+      if (!cancelled) getDataHistoriesAi();
+    };
+    start();
+    return () => {
+      cancelled = true;
+    };
   }, [])
 
+  // Total halaman dari metadata server; jika tidak ada, buka satu halaman lagi selama masih ada data
+  const resolveTotalPages = (result) =>
+    result.totalPages ?? (result.hasNext ? result.page + 1 : result.page);
+
   const fetchData = async () => {
+    const signal = beginLoad(cameraLoadRef);
     setLoading(true);
     try {
-      const response = await getDataCameraHistory(page);
-      setData(response.data);
+      const result = await cameraPagesRef.current.load(page);
+      if (signal.aborted) return;
+      setData(result.items);
+      // Halaman penuh = ukuran halaman server (batas list saat live feed menambah record)
+      if (result.hasNext) cameraPageSizeRef.current = result.items.length;
+      setTotalPages(resolveTotalPages(result));
+      // Halaman lain di window tetap di cache halaman, tidak di store
+      retention.hold("camera", result.items);
+      refreshStore();
     } catch (error) {
+      if (signal.aborted || isAbortError(error)) return;
       console.error("Gagal mengambil data:", error);
       setData([]);
     } finally {
-      setLoading(false);
+      if (!signal.aborted) setLoading(false);
+    }
+  };
+
+  // Refresh manual melewati cache; setelah hapus/edit cache sudah diinvalidasi oleh api.js
+  const refreshData = ({ force = false } = {}) => {
+    cameraPagesRef.current.reset({ force });
+    fetchData();
+  };
+
+  const fetchAiPage = async () => {
+    const signal = beginLoad(aiLoadRef);
+    try {
+      const result = await aiPagesRef.current.load(page);
+      if (signal.aborted) return;
+      setAiPageItems(result.items);
+      setAiTotalPages(resolveTotalPages(result));
+      retention.hold("aiPage", result.items);
+      refreshStore();
+    } catch (error) {
+      if (signal.aborted || isAbortError(error)) return;
+      console.error("Gagal mengambil data AI:", error);
+      setAiPageItems([]);
+    }
+  };
+
+  const refreshAiPage = ({ force = false } = {}) => {
+    aiPagesRef.current.reset({ force });
+    fetchAiPage();
+  };
+
+  // Data satu bulan diambil dengan filter rentang di server (cache per bulan)
+  const fetchAiMonth = async (month, { force = false, signal } = {}) => {
+    setAiMonthLoading(true);
+    try {
+      const items = await getHistoryAiRange({ ...monthRange(month), force, signal });
+      if (signal?.aborted) return;
+      setAiMonthItems(items);
+      retention.hold("aiMonth", items);
+      refreshStore();
+    } catch (error) {
+      if (signal?.aborted) return;
+      console.error("Gagal mengambil data AI per bulan:", error);
+      setAiMonthItems([]);
+    } finally {
+      if (!signal?.aborted) setAiMonthLoading(false);
     }
   };
 
+  useEffect(() => {
+    if (!aiMonth) {
+      retention.release("aiMonth");
+      refreshStore();
+    }
+    if (tab !== "ai" || !aiMonth) return;
+    const controller = new AbortController();
+    fetchAiMonth(aiMonth, { signal: controller.signal });
+    return () => controller.abort();
+  }, [tab, aiMonth]);
+
   useEffect(() => {
     if (tab === "kamera") {
       fetchData();
     }
+    if (tab === "ai") {
+      fetchAiPage();
+    }
   }, [page, tab]);
 
   useEffect(() => {
+    // Pilihan massal berlaku per tab
+    setSelectedIds(new Set());
     if (tab === "ai") {
       setAiData(dummyAiData);
     }
     if (tab === "dashboard") {
       getDataHistoriesAi();
+      fetchUserData();
     }
   }, [tab]);
 
-  const handleExportExcel = () => {
-    const worksheet = XLSX.utils.json_to_sheet(dashboardData);
-    const workbook = XLSX.utils.book_new();
-    XLSX.utils.book_append_sheet(workbook, worksheet, "Data Kamera");
-    XLSX.writeFile(workbook, "data_kamera.xlsx");
-  };
-
-  const handleExportPDF = () => {
-    const doc = new jsPDF();
-    doc.autoTable({
-      head: [["Nama", "GUID Device", "Tanggal", "Unit", "Keletihan", "Suasana Hati"]],
-      body: dashboardData.map((item) => [
-        item.nama || "-",
-        item.guid_device,
-        item.datetime,
-        item.unit || "-",
-        item.keletihan || "-",
-        item.mood || "-",
-      ]),
+  // Live feed: deteksi baru langsung masuk tanpa menekan "Refresh Data"
+  useEffect(() => {
+    const feed = subscribeCameraHistory((batch) => {
+      if (batch.history.length > 0) {
+        cameraPagesRef.current.reset();
+        // Record terbaru hanya tampil di halaman pertama
+        const limit = cameraPageSizeRef.current;
+        if (pageRef.current === 1) {
+          setData((prev) => prependRecords(batch.history, prev, { limit }));
+        }
+        liveRecordsRef.current = prependRecords(batch.history, liveRecordsRef.current, { limit });
+        retention.hold("live", liveRecordsRef.current);
+        refreshStore();
+      }
+      if (batch.history_ai.length > 0) {
+        aiPagesRef.current.reset();
+        aiSyncRef.current.apply(batch.history_ai);
+      }
     });
-    doc.save("data_kamera.pdf");
+    return () => feed?.close();
+  }, []);
+
+  // Polling otomatis (dengan backoff) selama dashboard terbuka
+  useEffect(() => {
+    if (tab !== "dashboard") return;
+    const aiSync = aiSyncRef.current;
+    const stopPolling = aiSync.startPolling();
+    return stopPolling;
+  }, [tab]);
+
+  // Worker (beserta writer xlsx / pdf) baru diunduh saat export pertama
+  const getWorkerPool = () => {
+    if (!workerPoolRef.current && typeof Worker !== "undefined") {
+      workerPoolRef.current = createWorkerPool();
+    }
+    return workerPoolRef.current;
   };
 
-  const handleDelete = async (id) => {
-    if (!window.confirm("Yakin ingin menghapus data ini?")) return;
+  useEffect(() => () => {
+    workerPoolRef.current?.terminate();
+    workerPoolRef.current = null;
+  }, []);
+
+  // Export seluruh history yang cocok dengan pencarian: worker mengambil data
+  // per halaman dari API dan menulis file per chunk, lalu file dipindah ke main thread
+  const runExport = async (format) => {
+    const pool = getWorkerPool();
+    if (!pool) return;
+    exportControllerRef.current?.abort();
+    const controller = new AbortController();
+    exportControllerRef.current = controller;
+    setExportProgress({ done: 0, pages: 0, total: null });
     try {
-      await deleteDataCameraHistory(id);
-      fetchData();
+      const file = await perf.time(`export:${format}`, () =>
+        pool.run(
+          TASK.EXPORT,
+          {
+            format,
+            sources: [getCameraHistoryExportSource(), getHistoryAiExportSource()],
+            query: atoms.search.get(),
+            fileName: "data_kamera",
+          },
+          { signal: controller.signal, onProgress: setExportProgress }
+        )
+      );
+      downloadBuffer(file);
     } catch (error) {
-      console.error("Gagal menghapus data:", error);
+      if (error.name !== "AbortError") console.error("Gagal export:", error);
+    } finally {
+      if (exportControllerRef.current === controller) {
+        exportControllerRef.current = null;
+        setExportProgress(null);
+      }
     }
   };
 
-  const handleEdit = async () => {
-    try {
-      await updateDataCameraHistory(selectedPhoto.id, {
-        ...selectedPhoto,
-        unit: editUnit,
-      });
-      setSelectedPhoto(null);
-      setMessage("✅ Perubahan berhasil disimpan");
-      setError("");
-      fetchData();
-      setTimeout(() => setMessage(""), 3000);
-    } catch (error) {
-      console.error("Gagal mengupdate data:", error);
-      setError("❌ Gagal menyimpan perubahan.");
+  const handleCancelExport = () => exportControllerRef.current?.abort();
+
+  const showResult = (successText, failedText, { failed }) => {
+    if (failed.length > 0) {
+      console.error(failedText, failed);
+      setError(`❌ ${failedText}`);
       setMessage("");
       setTimeout(() => setError(""), 3000);
+    } else {
+      setMessage(`✅ ${successText}`);
+      setError("");
+      setTimeout(() => setMessage(""), 3000);
     }
   };
 
-  const filteredData = (tab === "dashboard" ? combinedDashboardData : data).filter((item) =>
-    item.guid_device?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-    (item.nama || "").toLowerCase().includes(searchTerm.toLowerCase())
+  const toggleSelected = (id) => {
+    setSelectedIds((prev) => {
+      const next = new Set(prev);
+      if (next.has(id)) next.delete(id);
+      else next.add(id);
+      return next;
+    });
+  };
+
+  const selectAll = (items) => setSelectedIds(new Set(items.map((item) => item.id)));
+  const clearSelection = () => setSelectedIds(new Set());
+
+  const openDetail = (record) => {
+    setSelectedPhoto(record);
+    atoms.editUnit.set(record.unit || "User");
+  };
+  const closeDetail = () => setSelectedPhoto(null);
+
+  const handleDelete = async (id) => {
+    if (!window.confirm("Yakin ingin menghapus data ini?")) return;
+    if (selectedPhoto?.id === id) setSelectedPhoto(null);
+    const result = await mutator.deleteOne(id);
+    showResult("Data berhasil dihapus", "Gagal menghapus data.", result);
+  };
+
+  const handleEdit = async () => {
+    const id = selectedPhoto.id;
+    setSelectedPhoto(null);
+    const result = await mutator.updateOne(id, { unit: atoms.editUnit.get() });
+    showResult("Perubahan berhasil disimpan", "Gagal menyimpan perubahan.", result);
+  };
+
+  const handleDeleteSelected = async () => {
+    const ids = [...selectedIds];
+    if (!window.confirm(`Yakin ingin menghapus ${ids.length} data?`)) return;
+    clearSelection();
+    const result = await mutator.deleteMany(ids);
+    showResult(
+      `${result.succeeded.length} data berhasil dihapus`,
+      `${result.failed.length} dari ${ids.length} data gagal dihapus.`,
+      result
+    );
+  };
+
+  const handleUpdateSelectedUnit = async () => {
+    const ids = [...selectedIds];
+    clearSelection();
+    const result = await mutator.updateMany(ids, { unit: atoms.bulkUnit.get() });
+    showResult(
+      `Unit ${result.succeeded.length} data diubah`,
+      `${result.failed.length} dari ${ids.length} data gagal diubah.`,
+      result
+    );
+  };
+
+  // Toolbar aksi massal, tampil selama ada data yang dicentang
+  const renderSelectionBar = (items) => (
+    <div className="flex flex-wrap items-center gap-2 mb-4 text-sm">
+      <button onClick={() => selectAll(items)} className="px-3 py-1 bg-gray-200 hover:bg-gray-300 rounded">Pilih semua ({items.length})</button>
+      {selectedIds.size > 0 && (
+        <>
+          <span className="text-gray-600">{selectedIds.size} dipilih</span>
+          <button onClick={handleDeleteSelected} className="px-3 py-1 bg-red-500 hover:bg-red-600 text-white rounded">Hapus terpilih</button>
+          <AtomInput atom={atoms.bulkUnit} className="border px-2 py-1 rounded w-32" />
+          <button onClick={handleUpdateSelectedUnit} className="px-3 py-1 bg-blue-500 hover:bg-blue-600 text-white rounded">Ubah unit</button>
+          <button onClick={clearSelection} className="px-3 py-1 bg-gray-200 hover:bg-gray-300 rounded">Batal pilih</button>
+        </>
+      )}
+    </div>
   );
 
-  const dashboardData = filteredData.slice(
-    (dashboardPage - 1) * itemsPerPage,
-    dashboardPage * itemsPerPage
+  // Pencarian dijalankan setelah input berhenti berubah, bukan per ketikan
+  const debouncedSearch = useAtom(atoms.debouncedSearch);
+  const searchQuery = useMemo(() => compileQuery(debouncedSearch), [debouncedSearch]);
+  // Hasil turunan per tab hanya dihitung untuk tab yang sedang tampil
+  const filteredUsers = useMemo(
+    () => (tab === "dashboardUser" ? userRegistry.search(debouncedSearch) : []),
+    [tab, userData, debouncedSearch]
   );
 
-  const grafikData = combinedDashboardData
-    .filter(item =>
-      item.guid_device === selectedPhoto?.guid_device && // Filter berdasarkan guid_device yang dipilih
-      (
-        item.nama?.toLowerCase().includes(searchGrafik.toLowerCase()) ||
-        item.datetime?.slice(0, 10).includes(searchGrafik) ||
-        item.datetime?.slice(0, 7).includes(searchGrafik)
-      )
-    )
-    .map(item => ({
-      tanggal: item.datetime?.slice(0, 10),
-      keletihan: item.keletihan,
-      mood: item.mood
-    }));
-
-  const grafikMood = Object.entries(
-    combinedDashboardData
-      .filter(item =>
-        item.guid_device === selectedPhoto?.guid_device && // Filter berdasarkan guid_device yang dipilih
-        (
-          item.nama?.toLowerCase().includes(searchGrafik.toLowerCase()) ||
-          item.datetime?.slice(0, 10).includes(searchGrafik) ||
-          item.datetime?.slice(0, 7).includes(searchGrafik)
-        )
-      )
-      .reduce((acc, curr) => {
-        let mood = (curr.mood || "").toLowerCase();
-        if (mood === "senang") mood = "bahagia";
-        mood = mood.charAt(0).toUpperCase() + mood.slice(1);
-        acc[mood] = (acc[mood] || 0) + 1;
-        return acc;
-      }, {})
-  ).map(([mood, count]) => ({ mood, count }));
+  // Isi halaman dibaca ulang dari store agar hapus / edit (optimistic) langsung
+  // terlihat tanpa refetch halaman
+  const livePageItems = (items) =>
+    items.reduce((result, item) => {
+      if (item.id === undefined || item.id === null) result.push(item);
+      else if (recordStore.has(item.id)) result.push(recordStore.get(item.id));
+      return result;
+    }, []);
+
+  // Tab AI dan kamera hanya berisi satu halaman: cukup predicate hasil compileQuery
+  const aiFilteredItems = useMemo(() => {
+    if (tab !== "ai") return [];
+    return perf.time("filter", () => livePageItems(aiMonth ? aiMonthItems : aiPageItems).filter(searchQuery));
+  }, [tab, aiMonth, aiMonthItems, aiPageItems, searchQuery, storeVersion]);
+
+  // Dashboard mencari di seluruh store lewat index (hasil urut relevansi)
+  const filteredData = useMemo(() => {
+    if (tab === "kamera") return perf.time("filter", () => livePageItems(data).filter(searchQuery));
+    if (tab !== "dashboard") return [];
+    const ids = perf.time("search", () => searchIndex.search(debouncedSearch));
+    if (!ids) return combinedDashboardData;
+    return ids.map((id) => recordStore.get(id));
+  }, [tab, data, searchQuery, debouncedSearch, combinedDashboardData, storeVersion]);
+
+  // Modal detail + grafik hanya tampil di tab Dashboard / AI; selama tertutup
+  // record & series-nya tidak dihitung
+  const detailOpen = Boolean(selectedPhoto) && (tab === "dashboard" || tab === "ai");
+
+  // Roster kehadiran butuh direktori user (tab AI belum tentu sudah memuatnya)
+  useEffect(() => {
+    if (detailOpen) fetchUserData();
+  }, [detailOpen]);
+
+  // User direktori pemilik record yang dipilih (lookup index registry)
+  const selectedUserRecord = detailOpen ? userRegistry.joinRecord(selectedPhoto) : null;
+
+  // Record device yang dibuka; filter & grafik-nya dihitung di DetailChartModal
+  const detailDeviceRecords = useMemo(
+    () => (detailOpen ? recordStore.byDevice(selectedPhoto.guid_device) : []),
+    [detailOpen, selectedPhoto, storeVersion]
+  );
+  // Kehadiran untuk modal detail, dihitung ulang hanya jika record terpilih
+  // atau isi matriks kehadiran (store / direktori user) berubah
+  const attendanceVersion = attendanceMatrix.getVersion();
+  const detailAttendance = useMemo(
+    () => (detailOpen ? readAttendance(selectedPhoto) : null),
+    [detailOpen, selectedPhoto, attendanceVersion]
+  );
 
   return (
     <div className="p-4">
@@ -607,930 +675,115 @@ function App() {
 
       {/* Tab Kamera */}
       {tab === "kamera" && (
-        <>
-          <div className="flex items-center justify-between mb-4 gap-2">
-            <input
-              type="text"
-              placeholder="Cari berdasarkan guid_device..."
-              value={searchTerm}
-              onChange={(e) => setSearchTerm(e.target.value)}
-              className="px-4 py-2 border rounded w-full"
-            />
-            <button onClick={fetchData} className="px-4 py-2 bg-blue-500 hover:bg-blue-600 text-white rounded whitespace-nowrap">
-              Refresh Data
-            </button>
-          </div>
-
-          {loading ? (
-            <div className="text-center text-gray-500">Loading data...</div>
-          ) : filteredData.length === 0 ? (
-            <div className="text-center text-gray-500">File/Gambar Belum Tersedia</div>
-          ) : (
-            <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-5 gap-4">
-              {filteredData.map((history, index) => {
-                const imageUrl = `https://monja-file.pptik.id/v1/view?path=presensi/${history.gambar}`;
-                return (
-                  <div key={index} className="bg-white rounded-xl p-4 flex flex-col gap-4 hover:shadow-xl transition-all">
-                    <img
-                      src={imageUrl}
-                      alt={`Image ${index}`}
-                      className="w-full h-52 object-cover rounded-lg cursor-pointer"
-                      onClick={() => {
-                        setSelectedPhoto(history);
-                        setEditUnit(history.unit || "User");
-                      }}
-                    />
-                    <div>
-                      <h1 className="font-bold">{history.guid_device}</h1>
-                      <h2 className="text-xs mb-2">{history.datetime}</h2>
-                      <div className="flex gap-2">
-                        <button onClick={() => {
-                          setSelectedPhoto(history);
-                          setEditUnit(history.unit || "User");
-                        }} className="bg-green-500 hover:bg-green-600 text-white text-xs px-3 py-1 rounded">Detail</button>
-                        <button onClick={() => handleDelete(history.id)} className="bg-red-500 hover:bg-red-600 text-white text-xs px-3 py-1 rounded">Delete</button>
-                      </div>
-                    </div>
-                  </div>
-                );
-              })}
-            </div>
-          )}
-
-          {/* Navigasi Kamera */}
-          <div className="flex flex-col items-center mt-6 gap-2">
-            <div className="flex gap-2">
-              <button onClick={() => setPage((prev) => Math.max(prev - 1, 1))} disabled={page === 1} className="px-3 py-1 rounded border bg-white">Sebelumnya</button>
-              {[1, 2, 3, 4, 5].map((p) => (
-                <button key={p} onClick={() => setPage(p)} className={`px-3 py-1 rounded border ${page === p ? "bg-blue-600 text-white" : "bg-white"}`}>{p}</button>
-              ))}
-              <button onClick={() => setPage((prev) => Math.min(prev + 1, totalPages))} disabled={page === totalPages} className="px-3 py-1 rounded border bg-white">Berikutnya</button>
-            </div>
-            <p className="text-sm text-gray-500">Halaman {page} dari {totalPages}</p>
-          </div>
-        </>
-      )}
-
-      {/* Tab Dashboard */}
-      {tab === "dashboard" && (
-        <>
-          <h2 className="text-2xl font-bold mb-4">Dashboard</h2>
-          <div className="flex items-center justify-between mb-4">
-            <input 
-              type="text" 
-              placeholder="Cari berdasarkan nama atau guid_device..." 
-              value={searchTerm} 
-              onChange={(e) => setSearchTerm(e.target.value)} 
-              className="px-4 py-2 border rounded w-full mr-4" 
-            />
-            <div className="flex gap-2">
-              <button onClick={handleExportExcel} className="px-4 py-2 bg-green-500 hover:bg-green-600 text-white rounded">Export Excel</button>
-              <button onClick={handleExportPDF} className="px-4 py-2 bg-red-500 hover:bg-red-600 text-white rounded">Export PDF</button>
-            </div>
-          </div>
-
-          {/* Tabel Data */}
-          {dashboardData.length === 0 ? (
-            <div className="text-center text-gray-500 mt-10">Data Belum Tersedia</div>
-          ) : (
-            <div className="overflow-x-auto">
-              <table className="w-full table-auto border border-gray-300">
-                <thead>
-                  <tr className="bg-gray-100 text-left">
-                    <th className="p-2 border">Nama</th>
-                    <th className="p-2 border">GUID Device</th>
-                    <th className="p-2 border">Tanggal</th>
-                    <th className="p-2 border">Unit</th>
-                    <th className="p-2 border">Status</th>
-                    <th className="p-2 border">Keletihan</th>
-                    <th className="p-2 border">Suasana Hati</th>
-                    <th className="p-2 border">Detail</th>
-                  </tr>
-                </thead>
-                <tbody>
-                  {dashboardData.map((item, index) => (
-                    <tr key={index} className="border-t hover:bg-gray-50">
-                      <td className="p-2 border">{item.nama || "-"}</td>
-                      <td className="p-2 border">{item.guid_device}</td>
-                      <td className="p-2 border">{item.datetime}</td>
-                      <td className="p-2 border">{item.unit || "-"}</td>
-                      <td className="p-2 border">{item.status_absen}</td>
-                      <td className="p-2 border">{item.keletihan || "-"} %</td>
-                      <td className="p-2 border">{item.mood || "-"}</td>
-                      <td className="p-2 border">
-                        <button 
-                          onClick={() => {
-                            setSelectedPhoto(item);
-                            setEditUnit(item.unit || "User");
-                          }} 
-                          className="text-xs text-blue-600 underline"
-                        >
-                          Detail
-                        </button>
-                      </td>
-                    </tr>
-                  ))}
-                </tbody>
-              </table>
-            </div>
-          )}
-
-          {/* Navigasi Dashboard */}
-          <div className="flex flex-col items-center mt-6 gap-2">
-            <div className="flex gap-2">
-              <button 
-                onClick={() => setDashboardPage((prev) => Math.max(prev - 1, 1))} 
-                disabled={dashboardPage === 1} 
-                className="px-3 py-1 rounded border bg-white"
-              >
-                Sebelumnya
-              </button>
-              {[1, 2, 3, 4, 5].map((p) => (
-                <button 
-                  key={p} 
-                  onClick={() => setDashboardPage(p)} 
-                  className={`px-3 py-1 rounded border ${dashboardPage === p ? "bg-blue-600 text-white" : "bg-white"}`}
-                >
-                  {p}
-                </button>
-              ))}
-              <button 
-                onClick={() => setDashboardPage((prev) => Math.min(prev + 1, maxDashboardPages))} 
-                disabled={dashboardPage === maxDashboardPages} 
-                className="px-3 py-1 rounded border bg-white"
-              >
-                Berikutnya
-              </button>
-            </div>
-            <p className="text-sm text-gray-500">Halaman {dashboardPage} dari {maxDashboardPages}</p>
-          </div>
-        </>
-      )}
-
-      {/* Tab Dashboard User */}
-      {tab === "dashboardUser" && (
-        <>
-          <h2 className="text-2xl font-bold mb-4">Dashboard User</h2>
-          <div className="flex items-center justify-between mb-4">
-            <input 
-              type="text" 
-              placeholder="Cari berdasarkan nama dan unit..." 
-              value={searchTerm} 
-              onChange={(e) => setSearchTerm(e.target.value)} 
-              className="px-4 py-2 border rounded w-full mr-4" 
-            />
-            <button 
-              onClick={fetchUserData} 
-              className="px-4 py-2 bg-blue-500 hover:bg-blue-600 text-white rounded"
-            >
-              Refresh Data
-            </button>
-          </div>
-
-          {userData.length === 0 ? (
-            <p className="text-gray-500">Tidak ada data user tersedia.</p>
-          ) : (
-            <div className="overflow-x-auto">
-              <table className="w-full table-auto border border-gray-300">
-                <thead>
-                  <tr className="bg-gray-100 text-left">
-                    <th className="p-2 border">No</th>
-                    <th className="p-2 border">Foto</th>
-                    <th className="p-2 border">Nama</th>
-                    <th className="p-2 border">Unit</th>
-                    <th className="p-2 border">Detail</th>
-                  </tr>
-                </thead>
-                <tbody>
-                  {userData
-                    .filter(user => 
-                      user.name?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-                      user.unit?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-                      user.detail?.toLowerCase().includes(searchTerm.toLowerCase())
-                    )
-                    .map((user, index) => (
-                      <tr key={index} className="border-t hover:bg-gray-50">
-                        <td className="p-2 border">{index+1}</td>
-                        <td className="p-2 border">
-                          {user.photo ? (
-                            <img 
-                              src={user.photo} 
-                              alt={user.name} 
-                              className="w-10 h-10 rounded-full object-cover"
-                              onError={(e) => {
-                                e.target.onerror = null; 
-                                e.target.src = 'https://via.placeholder.com/150';
-                              }}
-                            />
-                          ) : (
-                            <div className="w-10 h-10 rounded-full bg-gray-200 flex items-center justify-center">
-                              <span className="text-xs">No Photo</span>
-                            </div>
-                          )}
-                        </td>
-                        
-                        <td className="p-2 border">{user.name}</td>
-                        <td className="p-2 border">{user.unit}</td>
-                        <td className="p-2 border">
-                          <button 
-                            onClick={() => setSelectedUser(user)}
-                            className="text-xs text-blue-600 underline"
-                          >
-                            Detail
-                          </button>
-                        </td>
-                      </tr>
-                    ))}
-                </tbody>
-              </table>
-            </div>
-          )}
-        </>
-      )}
-
-      {/* Modal Detail User */}
-{selectedUser && tab === "dashboardUser" && (
-  <div className="fixed inset-0 bg-black bg-opacity-50 flex justify-center items-center z-50">
-    <div className="bg-white p-6 rounded w-full max-w-4xl max-h-[90vh] overflow-y-auto">
-      <h2 className="text-2xl font-bold mb-4">Detail User</h2>
-
-      {/* Susunan vertikal */}
-      <div className="flex flex-col gap-6 mb-6">
-        {/* Detail User di atas */}
-        <div className="flex flex-col items-center">
-          {selectedUser.avatar ? (
-            <img 
-              src={selectedUser.avatar} 
-              alt={selectedUser.name} 
-              className="w-32 h-32 rounded-full object-cover mb-4"
-            />
-          ) : (
-            <div className="w-32 h-32 rounded-full bg-gray-200 flex items-center justify-center mb-4">
-              <span>No Photo</span>
-            </div>
-          )}
-          <h3 className="text-lg font-semibold">{selectedUser.name}</h3>
-          <p className="text-sm text-gray-500">{selectedUser.position || '-'}</p>
-
-          <div className="mt-4 w-full">
-            <DetailItem label="Profesi" value={selectedUser.profession} />
-            <DetailItem label="Email" value={selectedUser.email} />
-            <DetailItem label="No. Telp" value={selectedUser.phoneNumber} />
-            <DetailItem label="Unit" value={selectedUser.unit} />
-            <DetailItem label="Status" value={selectedUser.isDeleted ? "Non-Aktif" : "Aktif"} />
-          </div>
-        </div>
-
-        {/* Grafik Analisis Profil Emosi */}
-        <div>
-          <h3 className="text-xl font-semibold mb-4">Grafik Presentase Keletihan</h3>
-          <div className="h-64">
-            <ResponsiveContainer width="100%" height="100%">
-              <LineChart data={prepareProfilingChartData()}>
-                <CartesianGrid strokeDasharray="3 3" />
-                <XAxis 
-                  dataKey="date" 
-                  tickFormatter={(value) => value.slice(0, 5)}
-                />
-                <YAxis domain={[0, 100]} />
-                <Tooltip 
-                  formatter={(value) => [`${value}%`, "Keletihan"]}
-                  labelFormatter={(date) => `Tanggal: ${date}`}
-                />
-                <Legend />
-                <Line 
-                  type="monotone" 
-                  dataKey="keletihan" 
-                  stroke="#8884d8" 
-                  name="Keletihan (%)"
-                  strokeWidth={2}
-                />
-              </LineChart>
-            </ResponsiveContainer>
-          </div>
-        </div>
-
-        {/* Grafik Detail Emosi */}
-        <div>
-          <h3 className="text-xl font-semibold mb-4">Grafik Suasana Hati</h3>
-          <div className="h-64">
-            <ResponsiveContainer width="100%" height="100%">
-              <BarChart data={prepareProfilingChartData()}>
-                <CartesianGrid strokeDasharray="3 3" />
-                <XAxis 
-                  dataKey="date" 
-                  tickFormatter={(value) => value.slice(0, 5)}
-                />
-                <YAxis />
-                <Tooltip 
-                  formatter={(value, name) => [`${value}%`, name]}
-                  labelFormatter={(date) => `Tanggal: ${date}`}
-                />
-                <Legend />
-                <Bar dataKey="bahagia" stackId="a" fill="#22c55e" name="Bahagia" />
-                <Bar dataKey="netral" stackId="a" fill="#3b82f6" name="Netral" />
-                <Bar dataKey="sedih" stackId="a" fill="#facc15" name="Sedih" />
-                <Bar dataKey="marah" stackId="a" fill="#ef4444" name="Marah" />
-              </BarChart>
-            </ResponsiveContainer>
-          </div>
-        </div>
-      </div>
-
-      <div className="flex justify-end mt-4">
-        <button
-          onClick={() => setSelectedUser(null)}
-          className="px-4 py-2 bg-gray-300 rounded hover:bg-gray-400"
-        >
-          Tutup
-        </button>
-      </div>
-    </div>
-  </div>
-)}
-
-      {/* Tab Data AI */}
-      {tab === "ai" && (
-        <>
-          {/* Filter dan Refresh Data */}
-          <div className="flex items-center justify-between mb-4 gap-2">
-            <input
-              type="text"
-              placeholder="Cari berdasarkan nama..."
-              value={searchTerm}
-              onChange={(e) => setSearchTerm(e.target.value)}
-              className="px-4 py-2 border rounded w-1/3"
-            />
-            <input
-              type="month"
-              onChange={(e) => setSearchTerm(e.target.value)} 
-              className="px-4 py-2 border rounded w-1/3"
-            />
-            <button
-              onClick={getDataHistoriesAi}
-              className="px-4 py-2 bg-blue-500 hover:bg-blue-600 text-white rounded whitespace-nowrap"
-            >
-              Refresh Data
-            </button>
-          </div>
-
-          {dataHistoriesAi.length === 0 ? (
-            <div className="text-center text-gray-500 mt-10">Data Belum Tersedia</div>
-          ) : (
-            <>
-              <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-5 gap-4">
-                {dataHistoriesAi
-                  .filter(item => {
-                    const namaMatch = item.nama?.toLowerCase().includes(searchTerm.toLowerCase());
-                    const tanggal = item.datetime?.slice(0, 10) || "";
-                    const bulan = item.datetime?.slice(0, 7) || "";
-                    const filter = searchTerm.toLowerCase();
-                    return namaMatch || tanggal.includes(filter) || bulan.includes(filter);
-                  })
-                  .slice((page - 1) * itemsPerPage, page * itemsPerPage)
-                  .map((data, index) => {
-                    const moodColors = {
-                      senang: "bg-green-500",
-                      bahagia: "bg-green-500",
-                      sedih: "bg-yellow-400",
-                      netral: "bg-blue-500",
-                      marah: "bg-red-500",
-                    };
-                    const moodLower = data.mood?.toLowerCase() || "";
-                    return (
-                      <div key={index} className="bg-white rounded-xl p-4 shadow hover:shadow-lg transition relative cursor-pointer">
-                        <img
-                          src={`https://monja-file.pptik.id/v1/view?path=presensi/${data.gambar}`}
-                          alt="Preview"
-                          className="w-full h-52 object-cover rounded mb-4"
-                          onClick={() => {
-                            setSelectedPhoto(data);
-                            setEditUnit(data.unit || "User");
-                          }}
-                        />
-                        <p><strong>Nama:</strong> {data.nama}</p>
-                        <p><strong>Tanggal:</strong> {data.datetime?.slice(0, 10)}</p>
-                        <p><strong>Masuk :</strong> {data.jam_masuk_actual}</p>
-                        <p><strong>Keluar :</strong> {data.jam_keluar_actual}</p>
-                        <p><strong>Telat :</strong> {data.jumlah_telat}</p>
-                        <p><strong>Status Kehadiran:</strong> {data.status_absen}</p>
-                        <p><strong>Keletihan:</strong> {data.keletihan}%</p>
-                        <p>
-                          <strong>Suasana Hati:</strong>{" "}
-                          <span
-                            className={`inline-block px-2 py-1 rounded text-white text-xs ${
-                              moodColors[moodLower] || "bg-gray-400"
-                            }`}
-                          >
-                            {data.mood}
-                          </span>
-                        </p>
-
-                        {/* Tombol Edit & Delete di kanan bawah */}
-                        <div className="absolute bottom-2 right-2 flex gap-1">
-                          <button
-                            onClick={() => {
-                              setSelectedPhoto(data);
-                              setEditUnit(data.unit || "User");
-                            }}
-                            className="bg-blue-600 text-white text-xs px-2 py-1 rounded hover:bg-blue-700"
-                            title="Edit Detail"
-                          >
-                            Detail
-                          </button>
-                          <button
-                            onClick={async () => {
-                              if (window.confirm("Yakin ingin menghapus data ini?")) {
-                                try {
-                                  await deleteDataCameraHistory(data.id);
-                                  getDataHistoriesAi();
-                                } catch (error) {
-                                  alert("Gagal menghapus data.");
-                                }
-                              }
-                            }}
-                            className="bg-red-600 text-white text-xs px-2 py-1 rounded hover:bg-red-700"
-                            title="Delete Data"
-                          >
-                            Delete
-                          </button>
-                        </div>
-                      </div>
-                    );
-                  })}
-              </div>
-
-              {/* Pagination AI */}
-              <div className="flex flex-col items-center mt-6 gap-2">
-                <div className="flex gap-2">
-                  <button
-                    onClick={() => setPage((prev) => Math.max(prev - 1, 1))}
-                    disabled={page === 1}
-                    className="px-3 py-1 rounded border bg-white"
-                  >
-                    Sebelumnya
-                  </button>
-                  {Array.from({ length: Math.ceil(dataHistoriesAi.length / itemsPerPage) }, (_, i) => i + 1).map((p) => (
-                    <button
-                      key={p}
-                      onClick={() => setPage(p)}
-                      className={`px-3 py-1 rounded border ${
-                        page === p ? "bg-blue-600 text-white" : "bg-white"
-                      }`}
-                    >
-                      {p}
-                    </button>
-                  ))}
-                  <button
-                    onClick={() => setPage((prev) => Math.min(prev + 1, Math.ceil(dataHistoriesAi.length / itemsPerPage)))}
-                    disabled={page === Math.ceil(dataHistoriesAi.length / itemsPerPage)}
-                    className="px-3 py-1 rounded border bg-white"
-                  >
-                    Berikutnya
-                  </button>
-                </div>
-                <p className="text-sm text-gray-500">
-                  Halaman {page} dari {Math.ceil(dataHistoriesAi.length / itemsPerPage)}
-                </p>
-              </div>
-            </>
-          )}
-        </>
-      )}
-
-
-
-      {/* Modal Detail untuk Edit di Tab AI*/}
-      {selectedPhoto && tab === "ai" && (
-        <div className="fixed inset-0 bg-black bg-opacity-50 flex justify-center items-center z-50">
-          <div className="bg-white p-6 rounded w-full max-w-md max-h-[90vh] overflow-y-auto">
-            <h2 className="text-xl font-bold mb-4">Detail Gambar</h2>
-            <img
-              src={`https://monja-file.pptik.id/v1/view?path=presensi/${selectedPhoto.gambar}`}
-              alt="Preview"
-              className="w-full h-64 object-cover rounded mb-4"
-            />
-            <p><strong>Nama:</strong> {selectedPhoto.nama}</p>
-            <p><strong>Mood:</strong> {selectedPhoto.mood}</p>
-            <p><strong>Keletihan:</strong> {selectedPhoto.keletihan}%</p>
-            <p><strong>Status:</strong> {selectedPhoto.status_absen || "-"}</p>
-            <p><strong>GUID:</strong> {selectedPhoto.guid}</p>
-            <p><strong>GUID Device:</strong> {selectedPhoto.guid_device}</p>
-            <p><strong>DateTime:</strong> {selectedPhoto.datetime}</p>
-            <p><strong>Timestamp:</strong> {selectedPhoto.timestamp}</p>
-            <p><strong>Unit:</strong></p>
-            <input
-              type="text"
-              value={editUnit}
-              onChange={(e) => setEditUnit(e.target.value)}
-              className="border px-2 py-1 w-full mb-4"
-            />
-            <p><strong>Proses:</strong> {selectedPhoto.process || "-"}</p>
-            <div className="flex justify-between gap-2">
-              <button
-                onClick={() => setSelectedPhoto(null)}
-                className="px-4 py-2 bg-gray-300 rounded"
-              >
-                Batal
-              </button>
-              <button
-                onClick={handleEdit}
-                className="px-4 py-2 bg-blue-600 text-white rounded"
-              >
-                Simpan
-              </button>
-              <button
-                onClick={async () => {
-                  if (window.confirm("Yakin ingin menghapus data ini?")) {
-                    try {
-                      await deleteDataCameraHistory(selectedPhoto.id);
-                      setSelectedPhoto(null);
-                      getDataHistoriesAi();
-                    } catch (error) {
-                      alert("Gagal menghapus data.");
-                    }
-                  }
-                }}
-                className="px-4 py-2 bg-red-600 text-white rounded"
-              >
-                Delete
-              </button>
-            </div>
-          </div>
-        </div>
-      )}
-
-      {selectedPhoto && tab === "kamera" && (
-        <div className="fixed inset-0 bg-black bg-opacity-50 flex justify-center items-center z-50">
-          <div className="bg-white p-6 rounded w-full max-w-md max-h-[90vh] overflow-y-auto">
-            <h2 className="text-xl font-bold mb-4">Detail Gambar</h2>
-            <img
-              src={`https://monja-file.pptik.id/v1/view?path=presensi/${selectedPhoto.gambar}`}
-              alt="Preview"
-              className="w-full h-64 object-cover rounded mb-4"
-            />
-            <p><strong>Nama:</strong> {selectedPhoto.nama || "-"}</p>
-            <p><strong>GUID Device:</strong> {selectedPhoto.guid_device || "-"}</p>
-            <p><strong>Datetime:</strong> {selectedPhoto.datetime || "-"}</p>
-            <p><strong>Filter Nama/Tanggal/Bulan:</strong></p>
-            <input
-              type="text"
-              value={searchGrafik}
-              onChange={(e) => setSearchGrafik(e.target.value)}
-              className="border px-2 py-1 w-full mb-4"
-              placeholder="Contoh: ikbal / 2025-06 / 2025-06-10"
-            />
-            <div className="flex justify-between gap-2">
-              <button onClick={() => setSelectedPhoto(null)} className="px-4 py-2 bg-gray-300 rounded">Batal</button>
-              <button onClick={handleEdit} className="px-4 py-2 bg-blue-600 text-white rounded">Simpan</button>
-              <button
-                onClick={async () => {
-                  if (window.confirm("Yakin ingin menghapus data ini?")) {
-                    try {
-                      await deleteDataCameraHistory(selectedPhoto.id);
-                      setSelectedPhoto(null);
-                      fetchData();
-                    } catch (error) {
-                      alert("Gagal menghapus data.");
-                    }
-                  }
-                }}
-                className="px-4 py-2 bg-red-600 text-white rounded"
-              >
-                Delete
-              </button>
-            </div>
-          </div>
-        </div>
+        <KameraTab
+          searchAtom={atoms.search}
+          onRefresh={() => refreshData({ force: true })}
+          selectionBar={renderSelectionBar(filteredData)}
+          loading={loading}
+          items={filteredData}
+          selectedIds={selectedIds}
+          onToggleSelected={toggleSelected}
+          onOpen={openDetail}
+          onDelete={handleDelete}
+          page={page}
+          totalPages={totalPages}
+          onPageChange={setPage}
+          selectedPhoto={selectedPhoto}
+          searchGrafikAtom={atoms.searchGrafik}
+          onClose={closeDetail}
+          onSave={handleEdit}
+        />
       )}
 
-      {/* Modal Detail Dashboard*/}
-      {selectedPhoto && (tab === "dashboard" || tab === "ai") && (
-        <div className="fixed inset-0 bg-black bg-opacity-50 flex justify-center items-center z-50">
-          <div className="bg-white p-6 rounded w-full max-w-4xl max-h-[90vh] overflow-y-auto">
-            <h2 className="text-xl font-bold mb-4">Detail Grafik - {selectedPhoto.nama || selectedPhoto.guid_device}</h2>
-
-            {/* Filter Section */}
-            <div className="grid grid-cols-1 md:grid-cols-4 gap-4 mb-6">
-              {/* Filter Nama */}
-              <div>
-                <label className="block text-sm font-medium mb-1">Nama</label>
-                <input
-                  type="text"
-                  name="nama"
-                  value={detailFilter.nama}
-                  onChange={(e) => setDetailFilter({...detailFilter, nama: e.target.value})}
-                  placeholder="Filter nama..."
-                  className="w-full px-3 py-2 border rounded"
-                />
-              </div>
-
-              {/* Filter GUID Device */}
-              <div>
-                <label className="block text-sm font-medium mb-1">GUID Device</label>
-                <input
-                  type="text"
-                  name="guid_device"
-                  value={detailFilter.guid_device}
-                  onChange={(e) => setDetailFilter({...detailFilter, guid_device: e.target.value})}
-                  placeholder="Filter GUID..."
-                  className="w-full px-3 py-2 border rounded"
-                />
-              </div>
-
-              {/* Filter Tanggal (Hari) */}
-              <div>
-                <label className="block text-sm font-medium mb-1">Tanggal / Hari (DD)</label>
-                <select
-                  name="tanggal_hari"
-                  value={detailFilter.tanggal_hari}
-                  onChange={(e) => setDetailFilter({...detailFilter, tanggal_hari: e.target.value})}
-                  className="w-full px-3 py-2 border rounded"
-                >
-                  <option value="">Semua Hari</option>
-                  {Array.from({length: 31}, (_, i) => {
-                    const day = (i + 1).toString().padStart(2, '0');
-                    return <option key={day} value={day}>{day}</option>;
-                  })}
-                </select>
-              </div>
-
-              {/* Filter Bulan & Tahun */}
-              <div>
-                <label className="block text-sm font-medium mb-1">Bulan & Tahun</label>
-                <input
-                  type="month"
-                  name="bulan_tahun"
-                  value={detailFilter.bulan_tahun}
-                  onChange={(e) => setDetailFilter({...detailFilter, bulan_tahun: e.target.value})}
-                  className="w-full px-3 py-2 border rounded"
-                />
-              </div>
-            </div>
-
-            <div className="flex justify-between items-center mb-4">
-              <button
-                onClick={() => setDetailFilter({
-                  nama: '',
-                  guid_device: '',
-                  tanggal: '',
-                  bulan: ''
-                })}
-                className="px-4 py-2 bg-gray-300 rounded hover:bg-gray-400"
-              >
-                Reset Filter
-              </button>
-              <div className="text-sm text-gray-500">
-                Menampilkan data 1 bulan terakhir
-              </div>
-            </div>
-
-            {/* Detail Filter Tanggal/Hari / Bulan / Tahun */}
-            <div className="mb-4 p-3 bg-blue-50 rounded text-sm">
-              {detailFilter.tanggal_hari && (
-                <span className="inline-block mr-3">
-                  Hari: <strong>{detailFilter.tanggal_hari}</strong>
-                </span>
-              )}
-              {detailFilter.bulan_tahun && (
-                <span className="inline-block mr-3">
-                  Periode: <strong>{detailFilter.bulan_tahun}</strong>
-                </span>
-              )}
-              {(!detailFilter.tanggal_hari && !detailFilter.bulan_tahun) && (
-                <span>Menampilkan semua tanggal</span>
-              )}
-            </div>
-
-            {/* Tabel Data */}
-            <div className="overflow-x-auto">
-              <table className="w-full table-auto border border-gray-300">
-                <thead>
-                  <tr className="bg-gray-100 text-left">
-                    <th className="p-2 border">Tanggal</th>
-                    <th className="p-2 border">Nama</th>
-                    <th className="p-2 border">GUID Device</th>
-                    <th className="p-2 border">Status</th>
-                    <th className="p-2 border">Keletihan</th>
-                    <th className="p-2 border">Suasana Hati</th>
-                    <th className="p-2 border">Gambar</th>
-                  </tr>
-                </thead>
-                <tbody>
-                  {getFilteredDetailData().length > 0 ? (
-                    getFilteredDetailData().map((item, index) => (
-                      <tr key={index} className="border-t hover:bg-gray-50">
-                        <td className="p-2 border">{item.datetime?.slice(0, 10)}</td>
-                        <td className="p-2 border">{item.nama || '-'}</td>
-                        <td className="p-2 border">{item.guid_device}</td>
-                        <td className="p-2 border">{item.status_absen || '-'}</td>
-                        <td className="p-2 border">{item.keletihan || '-'}%</td>
-                        <td className="p-2 border">
-                          <span className={`px-2 py-1 rounded text-xs text-white ${
-                            item.mood === 'Bahagia' || item.mood === 'bahagia' ? 'bg-green-500' :
-                            item.mood === 'Sedih' || item.mood === 'sedih' ? 'bg-yellow-500' :
-                            item.mood === 'Marah' || item.mood === 'marah' ? 'bg-red-500' :
-                            item.mood === 'Netral' || item.mood === 'netral' ? 'bg-blue-500' : 
-                            'bg-gray-500'
-                          }`}>
-                            {item.mood || '-'}
-                          </span>
-                        </td>
-                        <td className="p-2 border">
-                          <img 
-                            src={`https://monja-file.pptik.id/v1/view?path=presensi/${item.gambar}`} 
-                            alt="Preview" 
-                            className="w-16 h-16 object-cover cursor-pointer"
-                            onClick={() => window.open(`https://monja-file.pptik.id/v1/view?path=presensi/${item.gambar}`, '_blank')}
-                          />
-                        </td>
-                      </tr>
-                    ))
-                  ) : (
-                    <tr>
-                      <td colSpan="6" className="p-4 text-center text-gray-500">
-                        Tidak ada data yang sesuai dengan filter
-                      </td>
-                    </tr>
-                  )}
-                </tbody>
-              </table>
-            </div>
-
-            {/* Informasi Karyawan */}
-            <div className="mb-6 p-4 bg-gray-50 rounded">
-              <h3 className="font-semibold mb-2">Informasi Karyawan</h3>
-              <div className="grid grid-cols-2 gap-2">
-                <p><span className="font-medium">Nama:</span> {selectedPhoto.nama || "-"}</p>
-                <p><span className="font-medium">GUID Device:</span> {selectedPhoto.guid_device}</p>
-                <p><span className="font-medium">Unit:</span> {selectedPhoto.unit || "-"}</p>
-                <p><span className="font-medium">Total Data:</span> {keletihanData.length}</p>
-              </div>
-            </div>
-
-            {/* Grafik */}
-            <h3 className="text-lg font-semibold mt-8 mb-4">Visualisasi Data</h3>
-            <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
-              
-              {/* Grafik Keletihan */}
-              <div className="bg-white p-4 rounded border">
-                <h4 className="font-medium mb-2">Presentase Keletihan</h4>
-                <div className="h-64">
-                  <ResponsiveContainer width="100%" height="100%">
-                    <LineChart data={getFilteredDetailData()}>
-                      <CartesianGrid strokeDasharray="3 3" />
-                      <XAxis dataKey="datetime" tickFormatter={(value) => value.slice(0, 10)} />
-                      <YAxis domain={[0, 100]} />
-                      <Tooltip />
-                      <Line 
-                        type="monotone" 
-                        dataKey="keletihan" 
-                        stroke="#8884d8" 
-                        name="Keletihan (%)"
-                      />
-                    </LineChart>
-                  </ResponsiveContainer>
-                </div>
-              </div>
-
-              {/* Grafik Mood */}
-              <div className="bg-white p-4 rounded border">
-                <h4 className="font-medium mb-2">Suasana Hati / Mood</h4>
-                <div className="h-64">
-                  <ResponsiveContainer width="100%" height="100%">
-                    <BarChart data={Object.entries(
-                      getFilteredDetailData().reduce((acc, curr) => {
-                        const mood = curr.mood || 'Tidak Terdeteksi';
-                        acc[mood] = (acc[mood] || 0) + 1;
-                        return acc;
-                      }, {})
-                    ).map(([mood, count]) => ({ mood, count }))}>
-                      <CartesianGrid strokeDasharray="3 3" />
-                      <XAxis dataKey="mood" />
-                      <YAxis />
-                      <Tooltip />
-                      <Bar dataKey="count" name="Jumlah">
-                        {Object.entries(
-                          getFilteredDetailData().reduce((acc, curr) => {
-                            const mood = curr.mood ? curr.mood.charAt(0).toUpperCase() + curr.mood.slice(1).toLowerCase() : 'Tidak Terdeteksi';
-                            acc[mood] = (acc[mood] || 0) + 1;
-                            return acc;
-                          }, {})
-                        ).map(([mood, _], index) => (
-                          <Cell 
-                            key={`cell-${index}`}
-                            fill={
-                              mood === 'Senang' ? '#22c55e' :
-                              mood === 'Bahagia' ? '#22c55e' :
-                              mood === 'Sedih' ? '#facc15' :
-                              mood === 'Marah' ? '#ef4444' :
-                              mood === 'Netral' ? '#3b82f6' : 
-                              '#9ca3af'
-                            }
-                          />
-                        ))}
-                      </Bar>
-                    </BarChart>
-                  </ResponsiveContainer>
-                </div>
-              </div>
-            </div>
-
-    {/* Grafik Kehadiran */}
-<div className="bg-white p-6 rounded-lg shadow mb-6">
-  <h3 className="text-lg font-semibold mb-4">Grafik Kehadiran Harian</h3>
-  <div className="h-80">
-    <ResponsiveContainer width="100%" height="100%">
-      <BarChart
-        data={prepareAttendanceData()}
-        margin={{ top: 20, right: 30, left: 20, bottom: 60 }}
-      >
-        <CartesianGrid strokeDasharray="3 3" />
-        <XAxis 
-          dataKey="date" 
-          angle={-1} 
-          textAnchor="end" 
-          height={60}
-          tickFormatter={(date) => new Date(date).toLocaleDateString('id-ID', { day: 'numeric', month: 'short' })}
-        />
-        <YAxis />
-        <Tooltip 
-          content={<CustomTooltip />} 
-          labelFormatter={(date) => `Tanggal: ${new Date(date).toLocaleDateString('id-ID')}`}
-        />
-        <Legend />
-        <Bar 
-          dataKey="present" 
-          name="Hadir" 
-          fill="#4ade80" 
-          radius={[4, 4, 0, 0]}
-        />
-        <Bar 
-          dataKey="absent" 
-          name="Tidak Hadir" 
-          fill="#f87171" 
-          radius={[4, 4, 0, 0]}
-        />
-      </BarChart>
-    </ResponsiveContainer>
-  </div>
-</div>
-
-{/* Ringkasan Statistik */}
-<div className="grid grid-cols-1 md:grid-cols-4 gap-4 mb-6">
-  <div className="bg-white p-4 rounded-lg shadow text-center border border-blue-100">
-    <h4 className="text-sm font-medium text-gray-500">Total Karyawan</h4>
-    <p className="text-2xl font-bold text-blue-600">
-      {[...new Set(combinedDashboardData.map(item => item.guid_device))].length}
-    </p>
-  </div>
-  <div className="bg-white p-4 rounded-lg shadow text-center border border-green-100">
-    <h4 className="text-sm font-medium text-gray-500">Hadir</h4>
-    <p className="text-2xl font-bold text-green-600">
-      {prepareAttendanceData().reduce((sum, day) => sum + day.present, 0)}
-    </p>
-  </div>
-  <div className="bg-white p-4 rounded-lg shadow text-center border border-red-100">
-    <h4 className="text-sm font-medium text-gray-500">Tidak Hadir</h4>
-    <p className="text-2xl font-bold text-red-600">
-      {prepareAttendanceData().reduce((sum, day) => sum + day.absent, 0)}
-    </p>
-  </div>
-  <div className="bg-white p-4 rounded-lg shadow text-center border border-purple-100">
-    <h4 className="text-sm font-medium text-gray-500">Rata-rata Kehadiran</h4>
-    <p className="text-2xl font-bold text-purple-600">
-      {prepareAttendanceData().length > 0 
-        ? `${Math.round(
-            prepareAttendanceData().reduce((sum, day) => sum + (day.present / day.total), 0) / 
-            prepareAttendanceData().length * 100
-          )}%` 
-        : '0%'}
-    </p>
-  </div>
-</div>
-
-            {/* Tombol Tutup */}
-            <div className="flex justify-end mt-6">
-              <button
-                onClick={() => setSelectedPhoto(null)}
-                className="px-4 py-2 bg-blue-600 text-white rounded hover:bg-blue-700"
-              >
-                Tutup
-              </button>
-            </div>
-          </div>
-        </div>
+      <Suspense fallback={<TabFallback />}>
+        {/* Tab Dashboard */}
+        {tab === "dashboard" && (
+          <DashboardTab
+            searchAtom={atoms.search}
+            exportProgress={exportProgress}
+            onExport={runExport}
+            onCancelExport={handleCancelExport}
+            renderSelectionBar={renderSelectionBar}
+            scrollAll={dashboardScrollAll}
+            onScrollAllChange={setDashboardScrollAll}
+            items={filteredData}
+            pageAtom={atoms.dashboardPage}
+            selectedIds={selectedIds}
+            onToggleSelected={toggleSelected}
+            resolveName={(item) => userRegistry.joinRecord(item)?.name}
+            onOpen={openDetail}
+          />
+        )}
+
+        {/* Tab Dashboard User */}
+        {tab === "dashboardUser" && (
+          <DashboardUserTab
+            searchAtom={atoms.search}
+            onRefresh={() => fetchUserData({ force: true })}
+            hasUsers={userData.length > 0}
+            users={filteredUsers}
+            onSelectUser={setSelectedUser}
+          />
+        )}
+
+        {/* Tab Data AI */}
+        {tab === "ai" && (
+          <AiTab
+            searchAtom={atoms.search}
+            month={aiMonth}
+            onMonthChange={setAiMonth}
+            onRefresh={() => (aiMonth ? fetchAiMonth(aiMonth, { force: true }) : refreshAiPage({ force: true }))}
+            selectionBar={renderSelectionBar(aiFilteredItems)}
+            loading={Boolean(aiMonth) && aiMonthLoading}
+            empty={(aiMonth ? aiMonthItems : aiPageItems).length === 0}
+            items={aiFilteredItems}
+            selectedIds={selectedIds}
+            onToggleSelected={toggleSelected}
+            onOpen={openDetail}
+            onDelete={handleDelete}
+            page={page}
+            totalPages={aiTotalPages}
+            onPageChange={setPage}
+            selectedPhoto={selectedPhoto}
+            editUnitAtom={atoms.editUnit}
+            onClose={closeDetail}
+            onSave={handleEdit}
+          />
+        )}
+      </Suspense>
+
+      {/* Modal grafik dimuat terpisah; fallback kosong agar tab tidak berkedip */}
+      <Suspense fallback={null}>
+        {/* Modal Detail User */}
+        {selectedUser && tab === "dashboardUser" && (
+          <UserDetailModal
+            user={selectedUser}
+            profilingChartData={profilingChartData}
+            onClose={() => setSelectedUser(null)}
+          />
+        )}
+
+        {/* Modal Detail Dashboard*/}
+        {detailOpen && (
+          <DetailChartModal
+            selectedPhoto={selectedPhoto}
+            filterAtom={atoms.detailFilter}
+            granularityAtom={atoms.chartGranularity}
+            deviceRecords={detailDeviceRecords}
+            selectedUserRecord={selectedUserRecord}
+            {...detailAttendance}
+            onClose={closeDetail}
+          />
+        )}
+      </Suspense>
+
+      {perfOpen && (
+        <Suspense fallback={null}>
+          <PerfPanel onClose={() => setPerfOpen(false)} />
+        </Suspense>
       )}
     </div>
   );
 }
 
-// Tambahkan ini di bagian paling bawah file, sebelum export default App
-const DetailItem = ({ label, value }) => (
-  <div className="flex">
-    <span className="font-medium w-1/3">{label}:</span>
-    <span className="w-2/3">{value || '-'}</span>
-  </div>
-);
-
-export default App;
\ No newline at end of file
+export default App;
@@ -0,0 +1,21 @@
+// Kategori & label suasana hati yang dipakai bersama oleh grafik (lihat
+// downsample.js) dan modal detail. Kehadiran dihitung di attendance_matrix.js.
+
+export const MOOD_CATEGORIES = ["bahagia", "sedih", "marah", "netral", "lainnya"];
+
+// Label mood lowercase; "senang" disamakan dengan "bahagia"
+export const normalizeMood = (mood) => {
+  const label = (mood || "").toLowerCase();
+  return label === "senang" ? "bahagia" : label;
+};
+
+// Kategori mood untuk grafik per hari (sama dengan logika lama prepareUserChartData)
+export const moodCategory = (label) => {
+  if (label.includes("senang") || label.includes("bahagia")) return "bahagia";
+  if (label.includes("sedih")) return "sedih";
+  if (label.includes("marah")) return "marah";
+  if (label.includes("netral")) return "netral";
+  return "lainnya";
+};
+
+export const capitalize = (label) => label.charAt(0).toUpperCase() + label.slice(1);
@@ -1,34 +1,52 @@
 import axios from "axios";
+import { fetchAllPages } from "./paginate";
+import { readPageMeta } from "./page_window";
+import { requestCache, containsRecord } from "./request_cache";
+import { monthRange, currentMonth, fetchByMonth } from "./time_range";
+import { instrumentAxios } from "./perf";
+import { COLUMNAR_FORMAT, enableColumnarHistory } from "./columnar";
+import { PRIORITY, scheduleAxios } from "./request_scheduler";
+
+// Bisa diarahkan ke mock server (mock/api_server.js) lewat VITE_AI_API_BASE_URL
+const AI_BASE_URL = import.meta.env?.VITE_AI_API_BASE_URL || "http://localhost:4000";
 
 const api = axios.create({
-   baseURL: "http://localhost:4000",
+   baseURL: AI_BASE_URL,
 })
 
 const apiLocal = axios.create({
-   baseURL: "http://localhost:4000",
+   baseURL: AI_BASE_URL,
 })
 
+// Latency & ukuran payload per endpoint untuk PerfPanel
+instrumentAxios(api);
+instrumentAxios(apiLocal);
+
+// Prioritas, batas per host & pembatalan request usang (lihat request_scheduler.js)
+scheduleAxios(api);
+scheduleAxios(apiLocal);
+
+// Respons history ringkas jika VITE_HISTORY_FORMAT=columnar (lihat api.js)
+const COLUMNAR_HISTORY = import.meta.env?.VITE_HISTORY_FORMAT === COLUMNAR_FORMAT;
+enableColumnarHistory(api, { request: COLUMNAR_HISTORY });
+enableColumnarHistory(apiLocal, { request: COLUMNAR_HISTORY });
+
+// GET lewat cache bersama (TTL, stale-while-revalidate, dedup in-flight)
+const cachedGetLocal = requestCache.wrap(apiLocal);
+
 // GET semua data dari semua halaman (misal 5 halaman)
 export const getDataAI = async () => {
     const response = await api.get("/ai/data");
     return response.data;
 }
 
-export const getAllCameraHistory = async (totalPages = 5) => {
-    let allData = [];
-
-    for (let page = 1; page <= totalPages; page++) {
-    const response = await api.get("/history_ai/get?page=1", { params: { page } });
-    if (response.data && response.data.data) {
-        allData = allData.contat(response.data.data);
-    }
-}
-
-    return allData;
-}
-
-export const getAllCameraHistories = async () => {
-    const response = await apiLocal.get("/history_ai/get",  );
+// `onUpdate` dipanggil dengan data terbaru jika cache yang dikembalikan sudah basi (stale)
+// Refresh berikutnya membatalkan load penuh yang masih berjalan
+export const getAllCameraHistories = async ({ force = false, onUpdate } = {}) => {
+    const response = await cachedGetLocal("/history_ai/get", {
+        supersede: "ai-history-all",
+        cache: { force, onUpdate: onUpdate && ((fresh) => onUpdate(fresh.data.data)) },
+    });
     return response.data.data
 }
 
@@ -38,15 +56,102 @@ export const getDataCameraHistory= async (page) => {
     return response.data;
     }
 
+// GET satu halaman history AI beserta total & cursor dari server
+// (halaman yang dibuka user membatalkan halaman sebelumnya, lihat api.js)
+export const getHistoryAiPage = async (
+    page,
+    { cursor, signal, pageSize, force = false, priority = PRIORITY.interactive } = {}
+) => {
+    const params = cursor ? { page, cursor } : { page };
+    const supersede = priority === PRIORITY.interactive ? "ai-history-page" : undefined;
+    const response = await cachedGetLocal("/history_ai/get", { params, signal, priority, supersede, cache: { force } });
+    return readPageMeta(response.data, page, pageSize);
+};
+
+// GET record AI yang lebih baru dari cursor (sync inkremental, tanpa cache)
+export const getHistoryAiSince = async (since) => {
+    const response = await apiLocal.get("/history_ai/get", {
+        params: since === null || since === undefined ? {} : { since },
+    });
+    return { items: response.data?.data || [], deleted: response.data?.deleted || [] };
+};
+
+// Bulan yang sudah lewat hampir tidak berubah lagi: cache lebih lama
+const PAST_MONTH_TTL = 60 * 60 * 1000;
+const MAX_RANGE_PAGES = 100;
+
+// GET semua halaman history AI (opsional dengan filter `params`, mis. satu
+// bulan) lewat fetchAllPages: sisa halaman diambil paralel (maksimal
+// `concurrency`) sampai totalPages atau halaman kosong pertama. Hasil
+// { data, errors, ... }: halaman yang gagal tidak membuang halaman lain.
+export const fetchAllCameraHistory = async ({
+    params = {},
+    maxPages = MAX_RANGE_PAGES,
+    concurrency = 4,
+    signal,
+    force = false,
+    ttl,
+} = {}) => {
+    const fetchPage = async (page) => {
+        const response = await cachedGetLocal("/history_ai/get", {
+            params: { ...params, page },
+            signal,
+            cache: { force, ttl },
+        });
+        return readPageMeta(response.data, page);
+    };
+    return fetchAllPages(fetchPage, { maxPages, concurrency, signal });
+};
+
+// Seperti fetchAllCameraHistory, tetapi hanya mengembalikan data (halaman
+// yang gagal dicatat ke console)
+export const getAllCameraHistory = async (options = {}) => {
+    const { data, errors } = await fetchAllCameraHistory(options);
+    if (errors.length > 0) {
+        console.error("Sebagian halaman AI gagal diambil:", errors);
+    }
+    return data;
+};
+
+// GET satu bucket bulan (semua halaman). Parameter start/end selalu satu
+// bulan penuh sehingga entry cache bisa dipakai ulang oleh rentang lain.
+const fetchHistoryAiMonth = async (month, { device, person, signal, force }) => {
+    const { start, end } = monthRange(month);
+    const params = { start, end };
+    if (device) params.device = device;
+    if (person) params.person = person;
+    const ttl = month < currentMonth() ? PAST_MONTH_TTL : undefined;
+    return getAllCameraHistory({ params, signal, force, ttl });
+};
+
+// GET history AI dalam rentang tanggal [start, end] ("YYYY-MM-DD"), opsional
+// per device (guid_device) dan/atau orang (nama). Filter dikirim ke server
+// sebagai query params; hasil di-cache per bulan, jadi melihat satu bulan
+// hanya mentransfer data bulan tersebut.
+export const getHistoryAiRange = async ({ start, end, device, person, signal, force = false }) =>
+    fetchByMonth(
+        (month) => fetchHistoryAiMonth(month, { device, person, signal, force }),
+        { start, end, device, person }
+    );
+
+// Sumber export history AI (dibaca langsung oleh worker export per halaman)
+export const getHistoryAiExportSource = () => ({
+    url: new URL("/history_ai/get", apiLocal.defaults.baseURL).href,
+    params: COLUMNAR_HISTORY ? { format: COLUMNAR_FORMAT } : {},
+});
+
 // DELETE data by ID
 export const deleteDataCameraHistory = async (id) => {
     const response = await api.delete(`/history_ai/delete/683e642979fbccf67dbb4b3d${id}`);
+    requestCache.invalidate({ url: "/history_ai/get" });
+    requestCache.invalidate({ match: containsRecord(id) });
     return response.data;
 };
 
 //UPDATE data by ID
 export const updateDataCameraHistory = async (id, data) => {
     const response = await api.put(`/history_update/update/683e66a72b06bb1a084fe281${id}`,data);
+    requestCache.invalidate({ match: containsRecord(id) });
     return response.data;
 };
 
@@ -1,633 +1,342 @@
-import { useState, useEffect } from "react";
-import {
-  getDataCameraHistory,
-  deleteDataCameraHistory,
-  updateDataCameraHistory,
-} from "./api";
-import * as XLSX from "xlsx";
-import jsPDF from "jspdf";
-import "jspdf-autotable";
-import { getAllCameraHistories } from "./ai";
-import {
-  LineChart,
-  Line,
-  CartesianGrid,
-  XAxis,
-  YAxis,
-  Tooltip,
-  Legend,
-  BarChart,
-  Bar,
-  ResponsiveContainer
-} from "recharts";
-
-function App() {
-  const [data, setData] = useState([]);
-  const [selectedPhoto, setSelectedPhoto] = useState(null);
-  const [searchTerm, setSearchTerm] = useState("");
-  const [editUnit, setEditUnit] = useState("User");
-  const [page, setPage] = useState(1);
-  const [dashboardPage, setDashboardPage] = useState(1);
-  const itemsPerPage = 10;
-  const maxDashboardPages = 5;
-  const [tab, setTab] = useState("kamera");
-  const [loading, setLoading] = useState(false);
-  const [totalPages, setTotalPages] = useState(5);
-  const [aiData, setAiData] = useState([]);
-  const [message, setMessage] = useState("");
-  const [error, setError] = useState("");
-  const [dataHistoriesAi, setDataHistoriesAi] = useState([])
-
-  const getDataHistoriesAi = async () => {
-    try {
-      const response = await getAllCameraHistories(page)
-      setDataHistoriesAi(response)
-    } catch (error) {
-      console.log(error)
-    }
-  }
-
-  const handleRefreshAi = async () => {
-  try {
-    await getDataHistoriesAi();
-    setPage(1); // reset halaman ke awal
-    await getDataHistoriesAi(); // Ambil data terbaru dari server
-  } catch (error) {
-    console.error("Gagal refresh:", error);
-  }
-};
-
-  useEffect(() => {
-    getDataHistoriesAi()
-  }, [])
-
-  const dummyAiData = [
-    {
-      id: 1,
-      nama: "Testing",
-      tanggal: "2025-06-01",
-      gambar: "/images/tes.jpg",
-      keletihan: 15,
-      mood: "Bahagia",
-    },
-    {
-      id: 2,
-      nama: "Asep Trisna",
-      tanggal: "2025-06-01",
-      gambar: "/images/asep.jpg",
-      keletihan: 70,
-      mood: "Marah",
-    },
-    {
-      id: 3,
-      nama: "Iqbal Ferdana",
-      tanggal: "2025-06-01",
-      gambar: "/images/Iqbal.jpg",
-      keletihan: 15,
-      mood: "Netral",
-    },
-    {
-      id: 4,
-      nama: "Wawan Setiawan",
-      tanggal: "2025-06-01",
-      gambar: "/images/wawan.jpg",
-      keletihan: 15,
-      mood: "Sedih",
-    },
+"""Batch worker rollup profiling (keletihan, suasana hati, kehadiran).
+
+Membaca export history dalam bentuk JSONL secara streaming lalu menghitung
+rollup per user (guid_device) per hari dan per hari (semua karyawan) dengan
+group-by NumPy. Hasilnya ditulis sebagai JSON ringkas yang langsung dibaca
+grafik profiling dashboard (lihat src/profiling.js).
+
+Setiap baris input boleh berupa satu record history, atau satu body halaman
+API (``{"data": [...], ...}``). File ``.gz`` dibaca langsung, ``-`` = stdin.
+
+    python src/ai_worker.py history.jsonl -o public/rollups/profiling.json
+    python src/ai_worker.py export-*.jsonl.gz --chunk-size 200000
+
+Format output (versi 1), semua series berbentuk kolom sejajar::
+
     {
-      id: 5,
-      nama: "Kunto Aji Gits",
-      tanggal: "2025-06-4",
-      gambar: "/images/kuntoaji.jpg",
-      keletihan: 90,
-      mood: "Bahagia",
-    },
-  ];
-
-  const fetchData = async () => {
-    setLoading(true);
-    try {
-      const response = await getDataCameraHistory(page);
-      setData(response.data);
-    } catch (error) {
-      console.error("Gagal mengambil data:", error);
-      setData([]);
-    } finally {
-      setLoading(false);
+      "version": 1, "generatedAt": "...", "records": 123456,
+      "moods": ["bahagia", "sedih", "marah", "netral", "lainnya"],
+      "days": ["2025-05-01", ...],                 # urut naik
+      "daily": <series>,
+      "users": {"CAM-00001": {"nama": ..., "unit": ..., **<series>}, ...}
     }
-  };
-
-  useEffect(() => {
-  if (tab === "ai") {
-    setAiData(dummyAiData);
-  }
-  if (tab === "dashboard") {
-    getDataHistoriesAi();
-  }
-}, [tab]);
-
-  const handleExportExcel = () => {
-    const worksheet = XLSX.utils.json_to_sheet(dashboardData);
-    const workbook = XLSX.utils.book_new();
-    XLSX.utils.book_append_sheet(workbook, worksheet, "Data Kamera");
-    XLSX.writeFile(workbook, "data_kamera.xlsx");
-  };
-
-  const handleExportPDF = () => {
-    const doc = new jsPDF();
-    doc.autoTable({
-      head: [["Nama", "GUID Device", "Tanggal", "Unit", "Keletihan", "Suasana Hati"]],
-      body: dashboardData.map((item) => [
-        item.nama || "-",
-        item.guid_device,
-        item.datetime,
-        item.unit || "-",
-        item.keletihan || "-",
-        item.mood || "-",
-      ]),
-    });
-    doc.save("data_kamera.pdf");
-  };
-
-  const handleDelete = async (id) => {
-    if (!window.confirm("Yakin ingin menghapus data ini?")) return;
-    try {
-      await deleteDataCameraHistory(id);
-      fetchData();
-    } catch (error) {
-      console.error("Gagal menghapus data:", error);
+
+    <series> = {
+      "day": [indeks ke "days"], "total": [...], "hadir": [...],
+      "keletihan": {"count": [...], "mean": [...], "min": [...], "max": [...], "std": [...]},
+      "mood": {"bahagia": [jumlah], ...}
+    }
+
+Memori tetap kecil untuk export besar: setiap chunk record diringkas menjadi
+tabel parsial (user, hari) lalu semua tabel parsial digabung di akhir.
+"""
+
+import argparse
+import gzip
+import json
+import math
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+
+ROLLUP_VERSION = 1
+
+# Sama dengan MOOD_CATEGORIES / moodCategory di src/aggregates.js
+MOOD_CATEGORIES = ["bahagia", "sedih", "marah", "netral", "lainnya"]
+
+NO_USER = ""
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def mood_category(mood):
+    label = (mood or "").lower()
+    if "senang" in label or "bahagia" in label:
+        return 0
+    if "sedih" in label:
+        return 1
+    if "marah" in label:
+        return 2
+    if "netral" in label:
+        return 3
+    return 4
+
+
+def date_key(record, tz_offset):
+    """Tanggal "YYYY-MM-DD" record, sama dengan toDateKey di record_store.js.
+
+    Jika datetime tidak ada, dipakai timestamp (epoch ms) + tz_offset menit.
+    """
+    value = record.get("datetime")
+    if isinstance(value, str) and len(value) >= 10:
+        if value[4] == "-" and value[7] == "-":
+            return value[:10]
+        if value[2] == "-" and value[5] == "-":
+            return f"{value[6:10]}-{value[3:5]}-{value[0:2]}"
+    timestamp = record.get("timestamp")
+    if isinstance(timestamp, (int, float)):
+        moment = datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc) + timedelta(minutes=tz_offset)
+        return moment.strftime("%Y-%m-%d")
+    return None
+
+
+def to_float(value):
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return math.nan
+    return number if math.isfinite(number) else math.nan
+
+
+def open_source(path):
+    if path == "-":
+        return sys.stdin
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def iter_records(paths):
+    """Record satu per satu dari file JSONL (record atau body halaman per baris)."""
+    for path in paths:
+        with open_source(path) as source:
+            for number, line in enumerate(source, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    item = json.loads(line)
+                except json.JSONDecodeError as error:
+                    raise ValueError(f"{path}:{number}: JSON tidak valid ({error})") from error
+                if isinstance(item, dict) and isinstance(item.get("data"), list):
+                    yield from item["data"]
+                elif isinstance(item, dict):
+                    yield item
+
+
+class Encoder:
+    """Kode integer stabil untuk string (user, hari) selama seluruh proses."""
+
+    def __init__(self):
+        self.codes = {}
+        self.values = []
+
+    def __call__(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+
+def group_sum(inverse, groups, values):
+    return np.bincount(inverse, weights=values, minlength=groups)
+
+
+def summarize(user, day, fatigue, mood, present, extra=None):
+    """Group-by (user, hari) atas array record/parsial -> tabel parsial.
+
+    Tanpa ``extra`` setiap baris adalah satu record; dengan ``extra`` setiap
+    baris sudah berupa tabel parsial yang dijumlahkan lagi.
+    """
+    pairs = np.stack([user, day], axis=1)
+    keys, inverse = np.unique(pairs, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    groups = len(keys)
+
+    if extra is None:
+        has_fatigue = ~np.isnan(fatigue)
+        values = np.where(has_fatigue, fatigue, 0.0)
+        total = np.bincount(inverse, minlength=groups)
+        hadir = group_sum(inverse, groups, present.astype(np.float64))
+        count = group_sum(inverse, groups, has_fatigue.astype(np.float64))
+        total_sum = group_sum(inverse, groups, values)
+        total_sq = group_sum(inverse, groups, values * values)
+        low = np.where(has_fatigue, fatigue, np.inf)
+        high = np.where(has_fatigue, fatigue, -np.inf)
+        moods = np.bincount(inverse * len(MOOD_CATEGORIES) + mood, minlength=groups * len(MOOD_CATEGORIES))
+        moods = moods.reshape(groups, len(MOOD_CATEGORIES))
+    else:
+        total = group_sum(inverse, groups, extra["total"])
+        hadir = group_sum(inverse, groups, extra["hadir"])
+        count = group_sum(inverse, groups, extra["count"])
+        total_sum = group_sum(inverse, groups, extra["sum"])
+        total_sq = group_sum(inverse, groups, extra["sumsq"])
+        low = extra["min"]
+        high = extra["max"]
+        moods = np.zeros((groups, len(MOOD_CATEGORIES)))
+        np.add.at(moods, inverse, extra["moods"])
+
+    minimum = np.full(groups, np.inf)
+    maximum = np.full(groups, -np.inf)
+    np.minimum.at(minimum, inverse, low)
+    np.maximum.at(maximum, inverse, high)
+
+    return {
+        "user": keys[:, 0],
+        "day": keys[:, 1],
+        "total": total.astype(np.float64),
+        "hadir": hadir,
+        "count": count,
+        "sum": total_sum,
+        "sumsq": total_sq,
+        "min": minimum,
+        "max": maximum,
+        "moods": moods.astype(np.float64),
+    }
+
+
+def concat(tables):
+    return {key: np.concatenate([table[key] for table in tables]) for key in tables[0]}
+
+
+def series(table, day_rank):
+    """Tabel (sudah digabung per hari) -> series kolom untuk JSON, urut tanggal."""
+    order = np.argsort(day_rank[table["day"]], kind="stable")
+    count = table["count"][order]
+    safe = np.maximum(count, 1)
+    mean = table["sum"][order] / safe
+    variance = np.maximum(table["sumsq"][order] / safe - mean * mean, 0.0)
+    empty = count == 0
+
+    def rounded(values):
+        return [None if skip else round(float(value), 1) for value, skip in zip(values, empty)]
+
+    return {
+        "day": day_rank[table["day"]][order].tolist(),
+        "total": table["total"][order].astype(np.int64).tolist(),
+        "hadir": table["hadir"][order].astype(np.int64).tolist(),
+        "keletihan": {
+            "count": count.astype(np.int64).tolist(),
+            "mean": rounded(mean),
+            "min": rounded(table["min"][order]),
+            "max": rounded(table["max"][order]),
+            "std": rounded(np.sqrt(variance)),
+        },
+        "mood": {
+            category: table["moods"][order, index].astype(np.int64).tolist()
+            for index, category in enumerate(MOOD_CATEGORIES)
+        },
+    }
+
+
+def regroup(table, key):
+    """Gabungkan tabel parsial pada satu kolom kunci (mis. hari untuk rollup harian)."""
+    keys, inverse = np.unique(table[key], return_inverse=True)
+    groups = len(keys)
+    merged = {
+        name: np.bincount(inverse, weights=table[name], minlength=groups)
+        for name in ("total", "hadir", "count", "sum", "sumsq")
     }
-  };
-
-  const handleEdit = async () => {
-    try {
-      await updateDataCameraHistory(selectedPhoto.id, {
-        ...selectedPhoto,
-        unit: editUnit,
-      });
-      setSelectedPhoto(null);
-      setMessage("✅ Perubahan berhasil disimpan");
-      setError("");
-      fetchData();
-      setTimeout(() => setMessage(""), 3000);
-    } catch (error) {
-      console.error("Gagal mengupdate data:", error);
-      setError("❌ Gagal menyimpan perubahan.");
-      setMessage("");
-      setTimeout(() => setError(""), 3000);
+    merged["min"] = np.full(groups, np.inf)
+    merged["max"] = np.full(groups, -np.inf)
+    np.minimum.at(merged["min"], inverse, table["min"])
+    np.maximum.at(merged["max"], inverse, table["max"])
+    merged["moods"] = np.zeros((groups, len(MOOD_CATEGORIES)))
+    np.add.at(merged["moods"], inverse, table["moods"])
+    merged["day"] = keys
+    return merged
+
+
+def build_rollup(records, chunk_size=DEFAULT_CHUNK_SIZE, tz_offset=0):
+    users = Encoder()
+    days = Encoder()
+    profiles = {}
+    partials = []
+    total_records = 0
+
+    columns = {"user": [], "day": [], "fatigue": [], "mood": [], "present": []}
+
+    def flush():
+        if not columns["user"]:
+            return
+        partials.append(
+            summarize(
+                np.asarray(columns["user"], dtype=np.int64),
+                np.asarray(columns["day"], dtype=np.int64),
+                np.asarray(columns["fatigue"], dtype=np.float64),
+                np.asarray(columns["mood"], dtype=np.int64),
+                np.asarray(columns["present"], dtype=bool),
+            )
+        )
+        for values in columns.values():
+            values.clear()
+
+    for record in records:
+        day = date_key(record, tz_offset)
+        if day is None:
+            continue
+        guid = record.get("guid_device") or NO_USER
+        user = users(guid)
+        if guid != NO_USER and guid not in profiles:
+            profiles[guid] = {"nama": record.get("nama"), "unit": record.get("unit")}
+        columns["user"].append(user)
+        columns["day"].append(days(day))
+        columns["fatigue"].append(to_float(record.get("keletihan")))
+        columns["mood"].append(mood_category(record.get("mood")))
+        columns["present"].append(str(record.get("status_absen") or "").lower() == "hadir")
+        total_records += 1
+        if len(columns["user"]) >= chunk_size:
+            flush()
+    flush()
+
+    rollup = {
+        "version": ROLLUP_VERSION,
+        "generatedAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "records": total_records,
+        "moods": MOOD_CATEGORIES,
+        "days": [],
+        "daily": None,
+        "users": {},
     }
-  };
-
-  const filteredData = data.filter((item) =>
-    item.guid_device.toLowerCase().includes(searchTerm.toLowerCase()) ||
-    (item.nama || "").toLowerCase().includes(searchTerm.toLowerCase())
-  );
-
-  const dashboardData = filteredData.slice(
-    (dashboardPage - 1) * itemsPerPage,
-    dashboardPage * itemsPerPage
-  );
-
-  const grafikData = dataHistoriesAi
-    .filter(item => item.nama === selectedPhoto?.nama)
-    .map(item => ({
-      tanggal: item.datetime?.slice(0, 10),
-      keletihan: item.keletihan,
-      mood: item.mood
-    }));
-
-    const grafikMood = Object.entries(
-    dataHistoriesAi
-      .filter(item => item.nama === selectedPhoto?.nama)
-      .reduce((acc, curr) => {
-        acc[curr.mood] = (acc[curr.mood] || 0) + 1;
-        return acc;
-      }, {})
-  ).map(([mood, count]) => ({ mood, count }));
-
-  return (
-    
-
-
-
-
-
-
-
-
-
-
-
-
-    
- <div className="p-4">
-      {/* Notifikasi */}
-      {(message || error) && (
-        <div className={`mb-4 px-4 py-2 rounded text-white ${message ? "bg-green-500" : "bg-red-500"}`}>
-          {message || error}
-        </div>
-      )}
-
-      {/* Tab Menu */}
-      <div className="mb-4 flex gap-2">
-        <button className={`px-4 py-2 rounded ${tab === "kamera" ? "bg-blue-600 text-white" : "bg-gray-300"}`} onClick={() => setTab("kamera")}>Data Kamera</button>
-        <button className={`px-4 py-2 rounded ${tab === "ai" ? "bg-blue-600 text-white" : "bg-gray-300"}`} onClick={() => setTab("ai")}>Data AI</button>
-        <button className={`px-4 py-2 rounded ${tab === "dashboard" ? "bg-blue-600 text-white" : "bg-gray-300"}`} onClick={() => setTab("dashboard")}>Dashboard</button>
-      </div>
-
-      {/* Tab Kamera */}
-      {tab === "kamera" && (
-        <>
-          <div className="flex items-center justify-between mb-4 gap-2">
-            <input
-              type="text"
-              placeholder="Cari berdasarkan guid_device"
-              value={searchTerm}
-              onChange={(e) => setSearchTerm(e.target.value)}
-              className="px-4 py-2 border rounded w-full"
-            />
-            <button onClick={fetchData} className="px-4 py-2 bg-blue-500 hover:bg-blue-600 text-white rounded whitespace-nowrap">
-              Refresh Data
-            </button>
-          </div>
-
-          {loading ? (
-            <div className="text-center text-gray-500">Loading data...</div>
-          ) : filteredData.length === 0 ? (
-            <div className="text-center text-gray-500">File/Gambar Belum Tersedia</div>
-          ) : (
-            <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-5 gap-4">
-              {filteredData.map((history, index) => {
-                const imageUrl = `https://monja-file.pptik.id/v1/view?path=presensi/${history.gambar}`;
-                return (
-                  <div key={index} className="bg-white rounded-xl p-4 flex flex-col gap-4 hover:shadow-xl transition-all">
-                    <img
-                      src={imageUrl}
-                      alt={`Image ${index}`}
-                      className="w-full h-52 object-cover rounded-lg cursor-pointer"
-                      onClick={() => {
-                        setSelectedPhoto(history);
-                        setEditUnit(history.unit || "User");
-                      }}
-                    />
-                    <div>
-                      <h1 className="font-bold">{history.guid_device}</h1>
-                      <h2 className="text-xs mb-2">{history.datetime}</h2>
-                      <div className="flex gap-2">
-                        <button onClick={() => {
-                          setSelectedPhoto(history);
-                          setEditUnit(history.unit || "User");
-                        }} className="bg-green-500 hover:bg-green-600 text-white text-xs px-3 py-1 rounded">Detail</button>
-                        <button onClick={() => handleDelete(history.id)} className="bg-red-500 hover:bg-red-600 text-white text-xs px-3 py-1 rounded">Delete</button>
-                      </div>
-                    </div>
-                  </div>
-                );
-              })}
-            </div>
-          )}
-
-          {/* Navigasi Kamera */}
-          <div className="flex flex-col items-center mt-6 gap-2">
-            <div className="flex gap-2">
-              <button onClick={() => setPage((prev) => Math.max(prev - 1, 1))} disabled={page === 1} className="px-3 py-1 rounded border bg-white">Sebelumnya</button>
-              {[1, 2, 3, 4, 5].map((p) => (
-                <button key={p} onClick={() => setPage(p)} className={`px-3 py-1 rounded border ${page === p ? "bg-blue-600 text-white" : "bg-white"}`}>{p}</button>
-              ))}
-              <button onClick={() => setPage((prev) => Math.min(prev + 1, totalPages))} disabled={page === totalPages} className="px-3 py-1 rounded border bg-white">Berikutnya</button>
-            </div>
-            <p className="text-sm text-gray-500">Halaman {page} dari {totalPages}</p>
-          </div>
-        </>
-      )}
-
-      {/* Tab Dashboard */}
-      {tab === "dashboard" && (
-        <>
-          <div className="flex items-center justify-between mb-4">
-            <input type="text" placeholder="Cari nama atau guid_device" value={searchTerm} onChange={(e) => setSearchTerm(e.target.value)} className="px-4 py-2 border rounded w-full mr-4" />
-            <div className="flex gap-2">
-              <button onClick={handleExportExcel} className="px-4 py-2 bg-green-500 hover:bg-green-600 text-white rounded">Export Excel</button>
-              <button onClick={handleExportPDF} className="px-4 py-2 bg-red-500 hover:bg-red-600 text-white rounded">Export PDF</button>
-            </div>
-          </div>
-
-          {dashboardData.length === 0 ? (
-            <div className="text-center text-gray-500 mt-10">Data Belum Tersedia</div>
-          ) : (
-            <div className="overflow-x-auto">
-              <table className="w-full table-auto border border-gray-300">
-                <thead>
-                  <tr className="bg-gray-100 text-left">
-                    <th className="p-2 border">Nama</th>
-                    <th className="p-2 border">GUID Device</th>
-                    <th className="p-2 border">Tanggal</th>
-                    <th className="p-2 border">Unit</th>
-                    <th className="p-2 border">Keletihan</th>
-                    <th className="p-2 border">Suasana Hati</th>
-                    <th className="p-2 border">Detail</th>
-                  </tr>
-                </thead>
-                <tbody>
-                  {dashboardData.map((item, index) => (
-                    <tr key={index} className="border-t hover:bg-gray-50">
-                      <td className="p-2 border">{item.nama || "-"}</td>
-                      <td className="p-2 border">{item.guid_device}</td>
-                      <td className="p-2 border">{item.datetime}</td>
-                      <td className="p-2 border">{item.unit || "-"}</td>
-                      <td className="p-2 border">{item.keletihan || "-"} %</td>
-                      <td className="p-2 border">{item.mood || "-"}</td>
-                      <td className="p-2 border">
-                        <button onClick={() => {
-                          setSelectedPhoto(item);
-                          setEditUnit(item.unit || "User");
-                        }} className="text-xs text-blue-600 underline">Detail</button>
-                      </td>
-                    </tr>
-                  ))}
-                </tbody>
-              </table>
-            </div>
-          )}
-
-          {/* Navigasi Dashboard */}
-          <div className="flex flex-col items-center mt-6 gap-2">
-            <div className="flex gap-2">
-              <button onClick={() => setDashboardPage((prev) => Math.max(prev - 1, 1))} disabled={dashboardPage === 1} className="px-3 py-1 rounded border bg-white">Sebelumnya</button>
-              {[1, 2, 3, 4, 5].map((p) => (
-                <button key={p} onClick={() => setDashboardPage(p)} className={`px-3 py-1 rounded border ${dashboardPage === p ? "bg-blue-600 text-white" : "bg-white"}`}>{p}</button>
-              ))}
-              <button onClick={() => setDashboardPage((prev) => Math.min(prev + 1, maxDashboardPages))} disabled={dashboardPage === maxDashboardPages} className="px-3 py-1 rounded border bg-white">Berikutnya</button>
-            </div>
-            <p className="text-sm text-gray-500">Halaman {dashboardPage} dari {maxDashboardPages}</p>
-          </div>
-        </>
-      )}
-
-
-      {tab === "ai" && (
-  <>
-    {/* Filter dan Refresh Data */}
-    <div className="flex items-center justify-between mb-4 gap-2">
-      <input
-        type="text"
-        placeholder="Cari nama, tanggal, bulan..."
-        value={searchTerm}
-        onChange={(e) => setSearchTerm(e.target.value)}
-        className="px-4 py-2 border rounded w-1/3"
-      />
-      <input
-        type="month"
-        onChange={(e) => setSearchTerm(e.target.value)} 
-        className="px-4 py-2 border rounded w-1/3"
-      />
-      <button
-        onClick={getDataHistoriesAi}
-        className="px-4 py-2 bg-blue-500 hover:bg-blue-600 text-white rounded whitespace-nowrap"
-      >
-        Refresh Data
-      </button>
-    </div>
-
-    {dataHistoriesAi.length === 0 ? (
-      <div className="text-center text-gray-500 mt-10">Data Belum Tersedia</div>
-    ) : (
-      <>
-        <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-5 gap-4">
-          {dataHistoriesAi
-            .filter(item => {
-              const namaMatch = item.nama?.toLowerCase().includes(searchTerm.toLowerCase());
-              const tanggal = item.datetime?.slice(0, 10) || "";
-              const bulan = item.datetime?.slice(0, 7) || "";
-              const filter = searchTerm.toLowerCase();
-              return namaMatch || tanggal.includes(filter) || bulan.includes(filter);
-            })
-            .slice((page - 1) * itemsPerPage, page * itemsPerPage)
-            .map((data, index) => {
-              const moodColors = {
-                senang: "bg-green-500",
-                sedih: "bg-yellow-400",
-                netral: "bg-blue-500",
-                marah: "bg-red-500",
-              };
-              const moodLower = data.mood?.toLowerCase() || "";
-              return (
-                <div key={index} className="bg-white rounded-xl p-4 shadow hover:shadow-lg transition relative cursor-pointer">
-                  <img
-                    src={`https://monja-file.pptik.id/v1/view?path=presensi/${data.gambar}`}
-                    alt="Preview"
-                    className="w-full h-52 object-cover rounded mb-4"
-                    onClick={() => {
-                      setSelectedPhoto(data);
-                      setEditUnit(data.unit || "User");
-                    }}
-                  />
-                  <p><strong>Nama:</strong> {data.nama}</p>
-                  <p><strong>Tanggal:</strong> {data.datetime?.slice(0, 10)}</p>
-                  <p><strong>Keletihan:</strong> {data.keletihan}%</p>
-                  <p>
-                    <strong>Suasana Hati:</strong>{" "}
-                    <span
-                      className={`inline-block px-2 py-1 rounded text-white text-xs ${
-                        moodColors[moodLower] || "bg-gray-400"
-                      }`}
-                    >
-                      {data.mood}
-                    </span>
-                  </p>
-                  {/* Tombol Edit & Delete di kanan bawah */}
-                  <div className="absolute bottom-2 right-2 flex gap-1">
-                    <button
-                      onClick={() => {
-                        setSelectedPhoto(data);
-                        setEditUnit(data.unit || "User");
-                      }}
-                      className="bg-blue-600 text-white text-xs px-2 py-1 rounded hover:bg-blue-700"
-                      title="Edit Detail"
-                    >
-                      Edit
-                    </button>
-                    <button
-                      onClick={async () => {
-                        if (window.confirm("Yakin ingin menghapus data ini?")) {
-                          try {
-                            await deleteDataCameraHistory(data.id);
-                            getDataHistoriesAi();
-                          } catch (error) {
-                            alert("Gagal menghapus data.");
-                          }
-                        }
-                      }}
-                      className="bg-red-600 text-white text-xs px-2 py-1 rounded hover:bg-red-700"
-                      title="Delete Data"
-                    >
-                      Delete
-                    </button>
-                  </div>
-                </div>
-              );
-            })}
-        </div>
-
-
-        {/* Pagination AI */}
-        <div className="flex flex-col items-center mt-6 gap-2">
-          <div className="flex gap-2">
-            <button
-              onClick={() => setPage((prev) => Math.max(prev - 1, 1))}
-              disabled={page === 1}
-              className="px-3 py-1 rounded border bg-white"
-            >
-              Sebelumnya
-            </button>
-            {Array.from({ length: Math.ceil(dataHistoriesAi.length / itemsPerPage) }, (_, i) => i + 1).map((p) => (
-              <button
-                key={p}
-                onClick={() => setPage(p)}
-                className={`px-3 py-1 rounded border ${
-                  page === p ? "bg-blue-600 text-white" : "bg-white"
-                }`}
-              >
-                {p}
-              </button>
-            ))}
-            <button
-              onClick={() => setPage((prev) => Math.min(prev + 1, Math.ceil(dataHistoriesAi.length / itemsPerPage)))}
-              disabled={page === Math.ceil(dataHistoriesAi.length / itemsPerPage)}
-              className="px-3 py-1 rounded border bg-white"
-            >
-              Berikutnya
-            </button>
-          </div>
-          <p className="text-sm text-gray-500">
-            Halaman {page} dari {Math.ceil(dataHistoriesAi.length / itemsPerPage)}
-          </p>
-        </div>
-      </>
-    )}
-  </>
-)}
-    {/* Modal Detail untuk Edit di Tab AI*/}
-{selectedPhoto && tab === "ai" && (
-  <div className="fixed inset-0 bg-black bg-opacity-50 flex justify-center items-center z-50">
-    <div className="bg-white p-6 rounded w-full max-w-md max-h-[90vh] overflow-y-auto">
-      <h2 className="text-xl font-bold mb-4">Detail Gambar</h2>
-      <img
-        src={`https://monja-file.pptik.id/v1/view?path=presensi/${selectedPhoto.gambar}`}
-        alt="Preview"
-        className="w-full h-64 object-cover rounded mb-4"
-      />
-      <p><strong>Nama:</strong> {selectedPhoto.nama}</p>
-      <p><strong>Mood:</strong> {selectedPhoto.mood}</p>
-      <p><strong>Keletihan:</strong> {selectedPhoto.keletihan}%</p>
-      <p><strong>Status:</strong> {selectedPhoto.status_absen || "-"}</p>
-      <p><strong>GUID:</strong> {selectedPhoto.guid}</p>
-      <p><strong>GUID Device:</strong> {selectedPhoto.guid_device}</p>
-      <p><strong>DateTime:</strong> {selectedPhoto.datetime}</p>
-      <p><strong>Timestamp:</strong> {selectedPhoto.timestamp}</p>
-      <p><strong>Unit:</strong></p>
-      <input
-        type="text"
-        value={editUnit}
-        onChange={(e) => setEditUnit(e.target.value)}
-        className="border px-2 py-1 w-full mb-4"
-      />
-      <p><strong>Proses:</strong> {selectedPhoto.process || "-"}</p>
-      <div className="flex justify-between gap-2">
-        <button
-          onClick={() => setSelectedPhoto(null)}
-          className="px-4 py-2 bg-gray-300 rounded"
-        >
-          Batal
-        </button>
-        <button
-          onClick={handleEdit}
-          className="px-4 py-2 bg-blue-600 text-white rounded"
-        >
-          Simpan
-        </button>
-        <button
-          onClick={async () => {
-            if (window.confirm("Yakin ingin menghapus data ini?")) {
-              try {
-                await deleteDataCameraHistory(selectedPhoto.id);
-                setSelectedPhoto(null);
-                getDataHistoriesAi();
-              } catch (error) {
-                alert("Gagal menghapus data.");
-              }
-            }
-          }}
-          className="px-4 py-2 bg-red-600 text-white rounded"
-        >
-          Delete
-        </button>
-      </div>
-    </div>
-  </div>
-)}
-
-
-      {/* Modal Detail */}
-      {selectedPhoto && tab === "dashboard" && (
-        <div className="fixed inset-0 bg-black bg-opacity-50 flex justify-center items-center z-50">
-          <div className="bg-white p-6 rounded w-full max-w-4xl max-h-[90vh] overflow-y-auto">
-            <h2 className="text-xl font-bold mb-4">Detail Gambar & Grafik</h2>
-            <img
-              src={`https://monja-file.pptik.id/v1/view?path=presensi/${selectedPhoto.gambar}`}
-              alt="Preview"
-              className="w-full h-64 object-cover rounded mb-4"
-            />
-            <p><strong>Nama:</strong> {selectedPhoto.nama}</p>
-            <p><strong>GUID:</strong> {selectedPhoto.guid}</p>
-            <p><strong>Device:</strong> {selectedPhoto.guid_device}</p>
-            <p><strong>Datetime:</strong> {selectedPhoto.datetime}</p>
-            <p><strong>Unit:</strong></p>
-            <input
-              type="text"
-              value={editUnit}
-              onChange={(e) => setEditUnit(e.target.value)}
-              className="border px-2 py-1 w-full mb-4"
-            />
-            <div className="flex justify-end gap-2 mb-4">
-              <button onClick={() => setSelectedPhoto(null)} className="px-4 py-2 bg-gray-300 rounded">Batal</button>
-              <button onClick={handleEdit} className="px-4 py-2 bg-blue-600 text-white rounded">Simpan</button>
-            </div>
-            <h3 className="text-lg font-semibold mb-2">Grafik Keletihan</h3>
-            <ResponsiveContainer width="100%" height={300}>
-              <LineChart data={grafikData}>
-                <CartesianGrid stroke="#ccc" />
-                <XAxis dataKey="tanggal" />
-                <YAxis label={{ value: 'Keletihan (%)', angle: -90, position: 'insideLeft' }} />
-                <Tooltip />
-                <Legend />
-                <Line type="monotone" dataKey="keletihan" stroke="#8884d8" />
-              </LineChart>
-            </ResponsiveContainer>
-            <h3 className="text-lg font-semibold mt-6 mb-2">Grafik Suasana Hati</h3>
-            <ResponsiveContainer width="100%" height={250}>
-              <BarChart data={grafikMood}>
-                <CartesianGrid strokeDasharray="3 3" />
-                <XAxis dataKey="mood" />
-                <YAxis />
-                <Tooltip />
-                <Bar dataKey="count" fill="#82ca9d" />
-              </BarChart>
-            </ResponsiveContainer>
-          </div>
-        </div>
-      )}
-    </div>
-  );
-}
-
-
-export default App;
-
-
-
-<input
-        type="month"
-        onChange={(e) => setSearchTerm(e.target.value)} 
-        className="px-4 py-2 border rounded w-1/3"
-      />
\ No newline at end of file
+    if not partials:
+        return rollup
+
+    merged = concat(partials)
+    table = summarize(merged["user"], merged["day"], None, None, None, extra=merged)
+
+    # Kode hari mengikuti urutan kemunculan; ranking -> indeks ke daftar tanggal urut
+    sorted_days = sorted(days.values)
+    position = {value: index for index, value in enumerate(sorted_days)}
+    day_rank = np.array([position[value] for value in days.values], dtype=np.int64)
+    rollup["days"] = sorted_days
+    rollup["daily"] = series(regroup(table, "day"), day_rank)
+
+    order = np.argsort(table["user"], kind="stable")
+    boundaries = np.flatnonzero(np.diff(table["user"][order])) + 1
+    for rows in np.split(order, boundaries):
+        guid = users.values[int(table["user"][rows[0]])]
+        if guid == NO_USER:
+            continue
+        user_table = {name: values[rows] for name, values in table.items()}
+        rollup["users"][guid] = {**profiles[guid], **series(user_table, day_rank)}
+    return rollup
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rollup profiling harian dari export history JSONL")
+    parser.add_argument("inputs", nargs="+", help="file JSONL (.jsonl / .jsonl.gz), '-' untuk stdin")
+    parser.add_argument("-o", "--output", default="public/rollups/profiling.json", help="file JSON hasil")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="record per group-by parsial")
+    parser.add_argument(
+        "--tz-offset", type=int, default=0, help="offset zona waktu (menit) untuk record yang hanya punya timestamp"
+    )
+    args = parser.parse_args(argv)
+
+    rollup = build_rollup(iter_records(args.inputs), chunk_size=max(1, args.chunk_size), tz_offset=args.tz_offset)
+    rollup["source"] = [Path(path).name for path in args.inputs]
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(rollup, separators=(",", ":"), ensure_ascii=False), encoding="utf-8")
+    print(
+        f"{rollup['records']} record, {len(rollup['users'])} user, {len(rollup['days'])} hari -> {output}",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,28 @@
 import axios from "axios";
+import { readPageMeta } from "./page_window";
+import { requestCache, containsRecord } from "./request_cache";
+import { subscribeHistoryFeed } from "./live_feed";
+import { instrumentAxios } from "./perf";
+import { COLUMNAR_FORMAT, enableColumnarHistory } from "./columnar";
+import { PRIORITY, scheduleAxios } from "./request_scheduler";
 
+// Bisa diarahkan ke mock server lokal (mock/api_server.js) lewat VITE_API_BASE_URL
 const api = axios.create({
-  baseURL: "https://api-human-detection.pptik.id/",
+  baseURL: import.meta.env?.VITE_API_BASE_URL || "https://api-human-detection.pptik.id/",
 });
+instrumentAxios(api);
+// Prioritas, batas per host & pembatalan request usang (lihat request_scheduler.js)
+scheduleAxios(api);
+
+// Respons history ringkas (kolom + dictionary, lihat columnar.js) hanya jika
+// VITE_HISTORY_FORMAT=columnar: transfer lebih kecil tetapi parse + decode
+// lebih lambat daripada JSON, jadi tidak aktif secara default. Respons columnar
+// selalu di-decode, jadi server yang mengabaikan parameter `format` tetap terbaca
+const COLUMNAR_HISTORY = import.meta.env?.VITE_HISTORY_FORMAT === COLUMNAR_FORMAT;
+enableColumnarHistory(api, { request: COLUMNAR_HISTORY });
+
+// GET lewat cache bersama (TTL, stale-while-revalidate, dedup in-flight)
+const cachedGet = requestCache.wrap(api);
 
 // GET semua data dari semua halaman (misalnya 3 halaman)
 export const getDataAI = async () => {
@@ -10,36 +30,91 @@ export const getDataAI = async () => {
   return response.data;
 };
 
-export const getAllCameraHistory = async (totalPages = 3) => {
-  let allData = [];
-
-  for (let page = 1; page <= totalPages; page++) {
-    const response = await api.get("/history/get", { params: { page } });
-    if (response.data && response.data.data) {
-      allData = allData.concat(response.data.data);
-    }
-  }
-
-  return allData;
-};
-
 // GET data per halaman (jika kamu ingin tetap pakai pagination manual)
-export const getDataCameraHistory = async (page) => {
-  const response = await api.get("/history/get", {
+export const getDataCameraHistory = async (page, { force = false } = {}) => {
+  const response = await cachedGet("/history/get", {
     params: { page },
+    cache: { force },
   });
   return response.data;
 };
 
+// GET satu halaman beserta metadata pagination dari server (total, cursor).
+// Halaman yang dibuka user membatalkan request halaman sebelumnya yang belum
+// selesai; prefetch berjalan di kelas prioritas lebih rendah.
+export const getCameraHistoryPage = async (
+  page,
+  { cursor, signal, pageSize, force = false, priority = PRIORITY.interactive } = {}
+) => {
+  const params = cursor ? { page, cursor } : { page };
+  const supersede = priority === PRIORITY.interactive ? "camera-history-page" : undefined;
+  const response = await cachedGet("/history/get", { params, signal, priority, supersede, cache: { force } });
+  return readPageMeta(response.data, page, pageSize);
+};
+
+// Sumber export (dibaca langsung oleh worker export per halaman)
+export const getCameraHistoryExportSource = () => ({
+  url: new URL("/history/get", api.defaults.baseURL).href,
+  params: COLUMNAR_HISTORY ? { format: COLUMNAR_FORMAT } : {},
+});
+
+// URL live feed (SSE), mis. mock server lokal (mock/live_server.js). Tanpa
+// VITE_LIVE_FEED_URL live feed tidak dipakai: backend produksi belum
+// menyediakan endpoint stream.
+const LIVE_FEED_URL = import.meta.env?.VITE_LIVE_FEED_URL || "";
+
+// Subscribe record `history` / `history_ai` baru. `onBatch` menerima
+// { history: [...], history_ai: [...] } maksimal sekali per animation frame.
+// Mengembalikan null jika live feed tidak dikonfigurasi.
+export const subscribeCameraHistory = (onBatch, options = {}) => {
+  if (!LIVE_FEED_URL) return null;
+  return subscribeHistoryFeed({
+    url: LIVE_FEED_URL,
+    ...options,
+    onBatch: (batch) => {
+      // Data list di cache sudah tidak lengkap lagi
+      if (batch.history.length > 0) {
+        requestCache.invalidate({ baseURL: api.defaults.baseURL, url: "/history/get" });
+      }
+      if (batch.history_ai.length > 0) {
+        requestCache.invalidate({ url: "/history_ai/get" });
+      }
+      onBatch(batch);
+    },
+  });
+};
+
 // DELETE data by ID
 export const deleteDataCameraHistory = async (id) => {
   const response = await api.delete(`/history/delete/${id}`);
+  // Hapus menggeser isi halaman berikutnya, jadi semua halaman list dibuang,
+  // ditambah entry lain (mis. history AI) yang memuat record ini
+  requestCache.invalidate({ baseURL: api.defaults.baseURL, url: "/history/get" });
+  requestCache.invalidate({ match: containsRecord(id) });
   return response.data;
 };
 
 // UPDATE data by ID
 export const updateDataCameraHistory = async (id, data) => {
   const response = await api.put(`/history/update/${id}`, data);
+  // Update tidak mengubah urutan: cukup buang entry yang memuat record ini
+  requestCache.invalidate({ match: containsRecord(id) });
+  return response.data;
+};
+
+// DELETE banyak data sekaligus (satu request). Jika server belum punya
+// endpoint ini (404), batch_mutation.js kembali ke DELETE per id.
+export const deleteCameraHistoryBulk = async (ids) => {
+  const response = await api.post("/history/delete-bulk", { ids });
+  requestCache.invalidate({ baseURL: api.defaults.baseURL, url: "/history/get" });
+  for (const id of ids) requestCache.invalidate({ match: containsRecord(id) });
+  return response.data;
+};
+
+// UPDATE field yang sama (mis. unit) untuk banyak data sekaligus
+export const updateCameraHistoryBulk = async (ids, data) => {
+  const response = await api.put("/history/update-bulk", { ids, data });
+  for (const id of ids) requestCache.invalidate({ match: containsRecord(id) });
   return response.data;
 };
 
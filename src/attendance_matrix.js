@@ -0,0 +1,346 @@
+// Matriks kehadiran user x hari dalam bentuk bit (Uint32Array).
+//
+// Baris = seluruh user direktori institusi (user_registry.js) ditambah device
+// yang muncul di history tapi tidak ada di direktori; kolom = hari. Dua bidang
+// bit per sel: `present` (ada record hadir) dan `late` (hadir, tapi record
+// hadir paling awal hari itu setelah `lateAfter`, atau status terlambat).
+// User yang tidak punya record sama sekali di suatu hari tetap terhitung
+// tidak hadir (bukan hanya record berstatus selain "hadir").
+//
+// Hari tanpa record sama sekali (libur / data belum ada) tidak dihitung
+// sebagai hari kerja, sehingga tidak menambah jumlah tidak hadir.
+//
+// Ukuran: 2 bit per sel, mis. 5000 user x 366 hari ~ 460 KB. Jumlah hadir /
+// terlambat per hari disimpan terpisah (Int32Array) dan diperbarui setiap
+// bit berubah, jadi total per hari O(1). Record baru diterapkan langsung;
+// sel yang record-nya dihapus / diubah dihitung ulang dari store saat dibaca.
+
+import { toDateKey } from "./record_store.js";
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+// Nilai sel di monthHeatmap
+export const CELL = { NO_DATA: 0, ABSENT: 1, PRESENT: 2, LATE: 3 };
+
+const dayNumber = (date) => Math.floor(Date.parse(`${date}T00:00:00Z`) / DAY_MS);
+
+const dayDate = (number) => new Date(number * DAY_MS).toISOString().slice(0, 10);
+
+// Status record: null (tidak hadir / tidak diketahui), "present" atau "late"
+const recordStatus = (record, lateAfter) => {
+  const status = (record.status_absen || "").toLowerCase();
+  if (status.includes("terlambat") || status.includes("telat")) return "late";
+  if (status !== "hadir") return null;
+  const time = typeof record.datetime === "string" ? record.datetime.slice(11, 16) : "";
+  return time && time > lateAfter ? "late" : "present";
+};
+
+export const createAttendanceMatrix = ({ store, registry = null, lateAfter = "08:00" }) => {
+  // Baris: key -> indeks; key = user direktori (objek) atau guid_device tanpa user
+  let rows = [];
+  let rowIndex = new Map();
+  const deviceRow = new Map();
+  let firstDay = 0;
+  let dayCount = 0;
+  let words = 0;
+  let present = new Uint32Array(0);
+  let late = new Uint32Array(0);
+  let presentPerDay = new Int32Array(0);
+  let latePerDay = new Int32Array(0);
+  let recordsPerDay = new Int32Array(0);
+  // "row:day" yang harus dihitung ulang dari store sebelum dibaca
+  const dirty = new Set();
+  // Matriks disusun ulang saat dibaca berikutnya (roster berubah / tanggal di
+  // luar rentang), jadi load massal ke store tidak memicu rebuild per record
+  let stale = true;
+  let version = 0;
+  const cache = new Map();
+
+  const addRow = (key, label) => {
+    rowIndex.set(key, rows.length);
+    rows.push({ key, ...label });
+    return rows.length - 1;
+  };
+
+  const rowOf = (record, { create = true } = {}) => {
+    const device = record.guid_device;
+    if (device === undefined || device === null || device === "") return -1;
+    const known = deviceRow.get(device);
+    if (known !== undefined) return known;
+    const user = registry?.joinRecord(record);
+    let row = user ? rowIndex.get(user) : rowIndex.get(device);
+    if (row === undefined) {
+      if (!create) return -1;
+      // Device di luar direktori tetap dihitung (kehadirannya tidak boleh hilang)
+      row = addRow(device, { name: record.nama || device, unit: record.unit || null, device, inDirectory: false });
+      growRows();
+    }
+    deviceRow.set(device, row);
+    return row;
+  };
+
+  const growRows = () => {
+    if (rows.length * words <= present.length) return;
+    const capacity = Math.max(rows.length, Math.ceil(present.length / Math.max(1, words)) * 2) * words;
+    const nextPresent = new Uint32Array(capacity);
+    nextPresent.set(present);
+    present = nextPresent;
+    const nextLate = new Uint32Array(capacity);
+    nextLate.set(late);
+    late = nextLate;
+  };
+
+  const getBit = (plane, row, day) => (plane[row * words + (day >>> 5)] >>> (day & 31)) & 1;
+
+  const setBit = (plane, perDay, row, day, on) => {
+    const index = row * words + (day >>> 5);
+    const mask = 1 << (day & 31);
+    const was = (plane[index] & mask) !== 0;
+    if (was === on) return;
+    plane[index] = on ? plane[index] | mask : plane[index] & ~mask;
+    perDay[day] += on ? 1 : -1;
+  };
+
+  // Indeks kolom record (bisa di luar [0, dayCount)); null jika tanpa tanggal
+  // Nomor hari per tanggal di-cache (Date.parse per record terlalu mahal saat load massal)
+  const dayNumbers = new Map();
+  const dayOf = (record) => {
+    const date = toDateKey(record?.datetime);
+    if (!date) return null;
+    let number = dayNumbers.get(date);
+    if (number === undefined) {
+      number = dayNumber(date);
+      dayNumbers.set(date, number);
+    }
+    return Number.isNaN(number) ? null : number - firstDay;
+  };
+
+  // Sel dari satu record baru: hadir OR, terlambat hanya jika semua record hadir terlambat
+  const applyRecord = (record, row, day) => {
+    recordsPerDay[day]++;
+    if (row < 0) return;
+    const status = recordStatus(record, lateAfter);
+    if (!status) return;
+    if (!getBit(present, row, day)) {
+      setBit(present, presentPerDay, row, day, true);
+      setBit(late, latePerDay, row, day, status === "late");
+    } else if (status === "present") {
+      setBit(late, latePerDay, row, day, false);
+    }
+  };
+
+  // Hitung ulang satu sel dari record store (setelah hapus / ubah record)
+  const recomputeCell = (row, day) => {
+    let isPresent = false;
+    let isLate = true;
+    for (const record of store.byDate(dayDate(firstDay + day))) {
+      if (rowOf(record, { create: false }) !== row) continue;
+      const status = recordStatus(record, lateAfter);
+      if (!status) continue;
+      isPresent = true;
+      if (status === "present") isLate = false;
+    }
+    setBit(present, presentPerDay, row, day, isPresent);
+    setBit(late, latePerDay, row, day, isPresent && isLate);
+  };
+
+  const flushDirty = () => {
+    if (dirty.size === 0) return;
+    for (const cell of dirty) {
+      const [row, day] = cell.split(":").map(Number);
+      recomputeCell(row, day);
+    }
+    dirty.clear();
+  };
+
+  // Susun ulang seluruh matriks: roster dari direktori, rentang hari dari store
+  const rebuild = () => {
+    rows = [];
+    rowIndex = new Map();
+    deviceRow.clear();
+    dirty.clear();
+    for (const user of registry?.getUsers() || []) {
+      addRow(user, { name: user.name, unit: user.unit || null, device: user.guid_device ?? null, inDirectory: true });
+    }
+    const dates = store.dates();
+    firstDay = dates.length > 0 ? dayNumber(dates[0]) : 0;
+    dayCount = dates.length > 0 ? dayNumber(dates[dates.length - 1]) - firstDay + 1 : 0;
+    words = Math.ceil(dayCount / 32);
+    present = new Uint32Array(rows.length * words);
+    late = new Uint32Array(rows.length * words);
+    presentPerDay = new Int32Array(dayCount);
+    latePerDay = new Int32Array(dayCount);
+    recordsPerDay = new Int32Array(dayCount);
+    stale = false;
+    for (const record of store.values()) {
+      const day = dayOf(record);
+      if (day !== null && day >= 0 && day < dayCount) applyRecord(record, rowOf(record), day);
+    }
+    version++;
+    cache.clear();
+  };
+
+  const markStale = () => {
+    stale = true;
+    version++;
+    cache.clear();
+  };
+
+  const onChange = ({ type, record, previous }) => {
+    if (stale) {
+      version++;
+      return;
+    }
+    const removed = type === "upsert" ? previous : record;
+    const added = type === "upsert" ? record : null;
+    const removedDay = removed ? dayOf(removed) : null;
+    const addedDay = added ? dayOf(added) : null;
+    for (const day of [removedDay, addedDay]) {
+      if (day !== null && (day < 0 || day >= dayCount)) {
+        markStale();
+        return;
+      }
+    }
+    if (removedDay !== null) {
+      recordsPerDay[removedDay]--;
+      const row = rowOf(removed, { create: false });
+      if (row >= 0) dirty.add(`${row}:${removedDay}`);
+    }
+    if (addedDay !== null) applyRecord(added, rowOf(added), addedDay);
+    version++;
+    cache.clear();
+  };
+
+  const unsubscribeStore = store.subscribe(onChange);
+  const unsubscribeRegistry = registry?.subscribe(markStale);
+
+  const ensureFresh = () => {
+    if (stale) rebuild();
+    else flushDirty();
+  };
+
+  const memo = (name, compute) => {
+    ensureFresh();
+    const hit = cache.get(name);
+    if (hit && hit.version === version) return hit.value;
+    const value = compute();
+    cache.set(name, { version, value });
+    return value;
+  };
+
+  const dayRange = ({ start = null, end = null } = {}) => {
+    const from = start ? Math.max(0, dayNumber(start) - firstDay) : 0;
+    const to = end ? Math.min(dayCount - 1, dayNumber(end) - firstDay) : dayCount - 1;
+    return [from, to];
+  };
+
+  // Series per hari kerja: [{ date, present, late, absent, total }]; present termasuk terlambat
+  const daySeries = (range = {}) =>
+    memo(`series:${range.start}:${range.end}`, () => {
+      const [from, to] = dayRange(range);
+      const series = [];
+      for (let day = from; day <= to; day++) {
+        if (recordsPerDay[day] <= 0) continue;
+        series.push({
+          date: dayDate(firstDay + day),
+          present: presentPerDay[day],
+          late: latePerDay[day],
+          absent: rows.length - presentPerDay[day],
+          total: rows.length,
+        });
+      }
+      return series;
+    });
+
+  const totals = (range = {}) =>
+    memo(`totals:${range.start}:${range.end}`, () => {
+      const series = daySeries(range);
+      const result = { present: 0, late: 0, absent: 0, days: series.length, averageRate: 0 };
+      let rateSum = 0;
+      for (const day of series) {
+        result.present += day.present;
+        result.late += day.late;
+        result.absent += day.absent;
+        rateSum += day.total > 0 ? day.present / day.total : 0;
+      }
+      result.averageRate = series.length > 0 ? rateSum / series.length : 0;
+      return result;
+    });
+
+  // Status satu user (lewat guid_device) pada satu tanggal; null jika bukan hari kerja
+  const cellFor = (device, date) => {
+    ensureFresh();
+    const day = dayNumber(date) - firstDay;
+    if (!(day >= 0 && day < dayCount) || recordsPerDay[day] <= 0) return null;
+    const row = rowOf({ guid_device: device }, { create: false });
+    if (row < 0) return "absent";
+    if (!getBit(present, row, day)) return "absent";
+    return getBit(late, row, day) ? "late" : "present";
+  };
+
+  // Heatmap satu bulan ("YYYY-MM"): sel Uint8Array rows x hari berisi CELL.*,
+  // plus tingkat kehadiran per hari (0..1, NaN untuk bukan hari kerja)
+  const monthHeatmap = (month) =>
+    memo(`month:${month}`, () => {
+      const [year, monthIndex] = month.split("-").map(Number);
+      const daysInMonth = new Date(Date.UTC(year, monthIndex, 0)).getUTCDate();
+      const monthStart = dayNumber(`${month}-01`) - firstDay;
+      const cells = new Uint8Array(rows.length * daysInMonth);
+      const rates = new Float32Array(daysInMonth);
+      const dates = [];
+      for (let offset = 0; offset < daysInMonth; offset++) {
+        const day = monthStart + offset;
+        dates.push(dayDate(firstDay + day));
+        const workday = day >= 0 && day < dayCount && recordsPerDay[day] > 0;
+        rates[offset] = workday && rows.length > 0 ? presentPerDay[day] / rows.length : NaN;
+        if (!workday) continue;
+        for (let row = 0; row < rows.length; row++) {
+          cells[row * daysInMonth + offset] = !getBit(present, row, day)
+            ? CELL.ABSENT
+            : getBit(late, row, day)
+              ? CELL.LATE
+              : CELL.PRESENT;
+        }
+      }
+      return { dates, rows: rows.map(({ key, ...row }) => row), cells, rates };
+    });
+
+  // Bulan ("YYYY-MM") yang tercakup matriks, urut naik
+  const months = () => {
+    if (dayCount === 0) return [];
+    const result = [];
+    let month = dayDate(firstDay).slice(0, 7);
+    const last = dayDate(firstDay + dayCount - 1).slice(0, 7);
+    while (month <= last) {
+      result.push(month);
+      const [year, index] = month.split("-").map(Number);
+      month = index === 12 ? `${year + 1}-01` : `${year}-${String(index + 1).padStart(2, "0")}`;
+    }
+    return result;
+  };
+
+  return {
+    rebuild: markStale,
+    daySeries,
+    totals,
+    cellFor,
+    monthHeatmap,
+    months,
+    userCount: () => {
+      ensureFresh();
+      return rows.length;
+    },
+    dayCount: () => {
+      ensureFresh();
+      return dayCount;
+    },
+    // Byte yang dipakai bidang bit + counter per hari
+    byteSize: () =>
+      present.byteLength + late.byteLength + presentPerDay.byteLength + latePerDay.byteLength + recordsPerDay.byteLength,
+    getVersion: () => version,
+    dispose: () => {
+      unsubscribeStore();
+      unsubscribeRegistry?.();
+    },
+  };
+};
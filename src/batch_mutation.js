@@ -0,0 +1,144 @@
+// Mutasi massal (hapus / ubah unit) untuk record history.
+//
+// Perubahan langsung diterapkan ke record store (optimistic) sehingga UI
+// tidak menunggu server dan tidak perlu refetch halaman. Request dikirim:
+//
+// - lewat endpoint bulk (`bulkDelete(ids)` / `bulkUpdate(ids, patch)`) per
+//   potongan `bulkSize` id, jika disediakan dan didukung server;
+// - jika tidak, satu request per id dengan maksimal `concurrency` berjalan
+//   bersamaan.
+//
+// Id yang gagal dikembalikan ke kondisi sebelumnya (rollback) tanpa
+// mengganggu id lain yang berhasil.
+
+// Jalankan `task(item)` untuk semua item, maksimal `limit` bersamaan.
+// Mengembalikan { succeeded: [item], failed: [{ item, error }] }.
+export const runWithConcurrency = async (items, limit, task) => {
+  const succeeded = [];
+  const failed = [];
+  let next = 0;
+  const worker = async () => {
+    while (next < items.length) {
+      const item = items[next++];
+      try {
+        await task(item);
+        succeeded.push(item);
+      } catch (error) {
+        failed.push({ item, error });
+      }
+    }
+  };
+  await Promise.all(Array.from({ length: Math.max(1, Math.min(limit, items.length)) }, worker));
+  return { succeeded, failed };
+};
+
+const chunk = (items, size) => {
+  const chunks = [];
+  for (let i = 0; i < items.length; i += size) chunks.push(items.slice(i, i + size));
+  return chunks;
+};
+
+// Endpoint bulk yang tidak ada di server (404 / 405 / 501): jangan dicoba lagi
+const isUnsupported = (error) => [404, 405, 501].includes(error?.response?.status);
+
+export const createBatchMutator = ({
+  store,
+  key = "id",
+  deleteOne,
+  updateOne,
+  bulkDelete = null,
+  bulkUpdate = null,
+  concurrency = 4,
+  bulkSize = 100,
+  onChange,
+}) => {
+  const bulkSupported = { delete: Boolean(bulkDelete), update: Boolean(bulkUpdate) };
+
+  // Kirim `ids` lewat bulk jika bisa; sisanya (atau semua jika bulk tidak
+  // didukung) per id. Mengembalikan id yang gagal beserta error-nya.
+  const send = async (kind, ids, bulk, single) => {
+    let remaining = ids;
+    const failed = [];
+    if (bulkSupported[kind]) {
+      remaining = [];
+      for (const part of chunk(ids, bulkSize)) {
+        if (!bulkSupported[kind]) {
+          remaining.push(...part);
+          continue;
+        }
+        try {
+          await bulk(part);
+        } catch (error) {
+          if (isUnsupported(error)) {
+            bulkSupported[kind] = false;
+            remaining.push(...part);
+          } else {
+            failed.push(...part.map((id) => ({ id, error })));
+          }
+        }
+      }
+    }
+    const result = await runWithConcurrency(remaining, concurrency, single);
+    return [...failed, ...result.failed.map(({ item, error }) => ({ id: item, error }))];
+  };
+
+  const rollback = (snapshots, failed) => {
+    for (const { id } of failed) {
+      const previous = snapshots.get(id);
+      if (!previous) continue;
+      // Ganti total (bukan merge) agar field hasil patch ikut kembali
+      store.remove(id);
+      store.upsert(previous);
+    }
+    if (failed.length > 0) onChange?.();
+  };
+
+  const snapshot = (ids) => {
+    const snapshots = new Map();
+    for (const id of ids) {
+      const record = store.get(id);
+      if (record) snapshots.set(id, record);
+    }
+    return snapshots;
+  };
+
+  const deleteMany = async (ids) => {
+    const unique = [...new Set(ids)];
+    const snapshots = snapshot(unique);
+    for (const id of unique) store.remove(id);
+    onChange?.();
+
+    const failed = await send("delete", unique, bulkDelete, deleteOne);
+    rollback(snapshots, failed);
+    const failedIds = new Set(failed.map(({ id }) => id));
+    return { succeeded: unique.filter((id) => !failedIds.has(id)), failed };
+  };
+
+  // `patch` diterapkan ke semua id, mis. { unit: "Admin" }
+  const updateMany = async (ids, patch) => {
+    const unique = [...new Set(ids)];
+    const snapshots = snapshot(unique);
+    for (const id of unique) {
+      const previous = snapshots.get(id);
+      if (previous) store.upsert({ ...previous, ...patch });
+    }
+    onChange?.();
+
+    const failed = await send(
+      "update",
+      unique,
+      (part) => bulkUpdate(part, patch),
+      (id) => updateOne(id, { ...(snapshots.get(id) || { [key]: id }), ...patch })
+    );
+    rollback(snapshots, failed);
+    const failedIds = new Set(failed.map(({ id }) => id));
+    return { succeeded: unique.filter((id) => !failedIds.has(id)), failed };
+  };
+
+  return {
+    deleteMany,
+    updateMany,
+    deleteOne: (id) => deleteMany([id]),
+    updateOne: (id, patch) => updateMany([id], patch),
+  };
+};
@@ -0,0 +1,241 @@
+// Format transport ringkas untuk respons history (`?format=columnar`).
+//
+// Alih-alih array objek yang mengulang nama field di setiap record, respons
+// berisi satu array per kolom:
+//
+//   { format: "columnar", version: 1, length, columns: { <field>: <kolom> }, ...meta }
+//
+// Jenis kolom:
+//   dict  : { kind: "dict", values: [string], codes: [int] }   (-1 = kosong)
+//           untuk string berulang (mood, guid_device, unit, status_absen, nama)
+//   delta : { kind: "delta", values: [int] }  nilai pertama lalu selisih;
+//           dipakai untuk timestamp (epoch ms)
+//   fixed : { kind: "fixed", scale, values: [int | null] }  angka desimal x scale
+//   raw   : { kind: "raw", values: [any] }
+//
+// `datetime` ("YYYY-MM-DD HH:MM:SS") tidak dikirim jika bisa diturunkan dari
+// timestamp + `tzOffset` (menit) server; decoder membentuknya kembali.
+//
+// Decoder mengisi typed array (Float64Array / Int32Array) per kolom lalu
+// membentuk record lewat `toRecords()`. Field kosong (null / tidak ada) tidak
+// ikut di record hasil decode.
+//
+// Catatan: karena semua konsumen (store, cache, export) memakai array record,
+// respons selalu di-decode penuh; total parse + decode masih lebih lambat
+// daripada JSON biasa (lihat `transport` di bench/run.js). Yang dihemat hanya
+// ukuran transfer, jadi format ini tidak aktif kecuali VITE_HISTORY_FORMAT=columnar.
+
+export const COLUMNAR_FORMAT = "columnar";
+export const COLUMNAR_VERSION = 1;
+
+// Field yang selalu di-dictionary-encode; string lain hanya jika cukup berulang
+export const DICTIONARY_FIELDS = ["mood", "guid_device", "unit", "status_absen", "nama"];
+
+const MINUTE_MS = 60 * 1000;
+
+const pad = (value) => String(value).padStart(2, "0");
+
+const isEmpty = (value) => value === null || value === undefined;
+
+// "YYYY-MM-DD HH:MM:SS" dari epoch ms pada offset zona waktu `tzOffset` menit.
+// Bagian tanggal di-cache per hari karena record satu halaman biasanya
+// berada di beberapa hari saja.
+const createDatetimeFormatter = (tzOffset) => {
+  const days = new Map();
+  return (timestamp) => {
+    const local = timestamp + tzOffset * MINUTE_MS;
+    const day = Math.floor(local / 86400000);
+    let date = days.get(day);
+    if (date === undefined) {
+      const d = new Date(day * 86400000);
+      date = `${d.getUTCFullYear()}-${pad(d.getUTCMonth() + 1)}-${pad(d.getUTCDate())}`;
+      days.set(day, date);
+    }
+    const seconds = Math.floor((local - day * 86400000) / 1000);
+    return `${date} ${pad(Math.floor(seconds / 3600))}:${pad(Math.floor(seconds / 60) % 60)}:${pad(seconds % 60)}`;
+  };
+};
+
+export const isColumnar = (body) =>
+  Boolean(body) && typeof body === "object" && body.format === COLUMNAR_FORMAT && body.columns !== undefined;
+
+const encodeDict = (values) => {
+  const dictionary = [];
+  const lookup = new Map();
+  const codes = values.map((value) => {
+    if (isEmpty(value)) return -1;
+    let code = lookup.get(value);
+    if (code === undefined) {
+      code = dictionary.length;
+      dictionary.push(value);
+      lookup.set(value, code);
+    }
+    return code;
+  });
+  return { kind: "dict", values: dictionary, codes };
+};
+
+const encodeColumn = (name, values) => {
+  const present = values.filter((value) => !isEmpty(value));
+  if (present.length === 0) return { kind: "raw", values };
+
+  if (present.every((value) => typeof value === "string")) {
+    if (DICTIONARY_FIELDS.includes(name) || new Set(present).size * 4 <= values.length) return encodeDict(values);
+    return { kind: "raw", values };
+  }
+
+  if (present.length === values.length && values.every(Number.isSafeInteger) && name === "timestamp") {
+    return { kind: "delta", values: values.map((value, i) => (i === 0 ? value : value - values[i - 1])) };
+  }
+
+  // Angka dengan maksimal satu desimal (mis. keletihan 45.5)
+  if (present.every((value) => typeof value === "number" && Number.isFinite(value))) {
+    const scale = present.every(Number.isInteger) ? 1 : 10;
+    if (present.every((value) => Math.abs(Math.round(value * scale) - value * scale) < 1e-6)) {
+      return { kind: "fixed", scale, values: values.map((value) => (isEmpty(value) ? null : Math.round(value * scale))) };
+    }
+  }
+
+  return { kind: "raw", values };
+};
+
+// Encode record menjadi body columnar. `meta` (total, totalPages, deleted, ...)
+// ikut disalin apa adanya. `tzOffset`: offset zona waktu (menit) yang dipakai
+// server untuk field `datetime`; jika cocok untuk semua record, datetime tidak dikirim.
+export const encodeColumnar = (records, { meta = {}, tzOffset = null } = {}) => {
+  const fields = [];
+  const seen = new Set();
+  for (const record of records) {
+    for (const field in record) {
+      if (!seen.has(field)) {
+        seen.add(field);
+        fields.push(field);
+      }
+    }
+  }
+
+  let derived = null;
+  if (tzOffset !== null && seen.has("datetime") && seen.has("timestamp")) {
+    const format = createDatetimeFormatter(tzOffset);
+    const derivable = records.every(
+      (record) => Number.isSafeInteger(record.timestamp) && record.datetime === format(record.timestamp)
+    );
+    if (derivable) derived = { datetime: { from: "timestamp", tzOffset } };
+  }
+
+  const columns = {};
+  for (const field of fields) {
+    if (derived?.[field]) continue;
+    columns[field] = encodeColumn(
+      field,
+      records.map((record) => record[field])
+    );
+  }
+
+  return {
+    ...meta,
+    format: COLUMNAR_FORMAT,
+    version: COLUMNAR_VERSION,
+    length: records.length,
+    columns,
+    ...(derived ? { derived } : {}),
+  };
+};
+
+// Kolom hasil decode: dict -> { codes: Int32Array, values }, delta / fixed -> Float64Array
+// (NaN = kosong), raw -> array biasa
+const decodeColumn = (column, length) => {
+  if (column.kind === "dict") {
+    return { kind: "dict", values: column.values, codes: Int32Array.from(column.codes) };
+  }
+  if (column.kind === "delta") {
+    const values = new Float64Array(length);
+    let acc = 0;
+    for (let i = 0; i < length; i++) {
+      acc += column.values[i];
+      values[i] = acc;
+    }
+    return { kind: "number", values };
+  }
+  if (column.kind === "fixed") {
+    const values = new Float64Array(length);
+    const scale = column.scale || 1;
+    for (let i = 0; i < length; i++) {
+      const value = column.values[i];
+      values[i] = value === null ? NaN : value / scale;
+    }
+    return { kind: "number", values };
+  }
+  return { kind: "raw", values: column.values };
+};
+
+// Body columnar -> batch berkolom typed array
+export const decodeColumnar = (body) => {
+  if (body.version > COLUMNAR_VERSION) {
+    throw new Error(`Versi format columnar ${body.version} belum didukung`);
+  }
+  const { length } = body;
+  const columns = new Map(Object.entries(body.columns).map(([name, column]) => [name, decodeColumn(column, length)]));
+  const datetimeFrom = body.derived?.datetime;
+  const formatDatetime = datetimeFrom ? createDatetimeFormatter(datetimeFrom.tzOffset) : null;
+  const timestamps = datetimeFrom ? columns.get(datetimeFrom.from)?.values : null;
+  const entries = [...columns];
+
+  return {
+    length,
+    // Diisi per kolom (loop monomorfik per jenis kolom), bukan per baris
+    toRecords: () => {
+      const records = new Array(length);
+      for (let i = 0; i < length; i++) records[i] = {};
+      for (const [name, column] of entries) {
+        const { values } = column;
+        if (column.kind === "dict") {
+          const { codes } = column;
+          for (let i = 0; i < length; i++) {
+            if (codes[i] >= 0) records[i][name] = values[codes[i]];
+          }
+        } else if (column.kind === "number") {
+          for (let i = 0; i < length; i++) {
+            if (!Number.isNaN(values[i])) records[i][name] = values[i];
+          }
+        } else {
+          for (let i = 0; i < length; i++) {
+            if (values[i] !== null && values[i] !== undefined) records[i][name] = values[i];
+          }
+        }
+      }
+      if (formatDatetime && timestamps) {
+        for (let i = 0; i < length; i++) records[i].datetime = formatDatetime(timestamps[i]);
+      }
+      return records;
+    },
+  };
+};
+
+// Body respons API -> body biasa ({ ...meta, data: [record] }); body non-columnar
+// dikembalikan apa adanya sehingga aman dipakai untuk server yang belum mendukung
+export const decodeHistoryBody = (body) => {
+  if (!isColumnar(body)) return body;
+  const { format, version, length, columns, derived, ...meta } = body;
+  return { ...meta, data: decodeColumnar(body).toRecords() };
+};
+
+// Pasang ke instance axios: respons columnar selalu di-decode, dan jika
+// `request` aktif, GET ke `paths` meminta `format=columnar`
+export const enableColumnarHistory = (instance, { request = true, paths = ["/history/get", "/history_ai/get"] } = {}) => {
+  if (request) {
+    instance.interceptors.request.use((config) => {
+      const method = (config.method || "get").toLowerCase();
+      const path = (config.url || "").split("?")[0];
+      if (method === "get" && paths.includes(path)) {
+        config.params = { ...(config.params || {}), format: COLUMNAR_FORMAT };
+      }
+      return config;
+    });
+  }
+  instance.interceptors.response.use((response) => {
+    response.data = decodeHistoryBody(response.data);
+    return response;
+  });
+  return instance;
+};
@@ -0,0 +1,10 @@
+import { useAtom } from "./useAtom";
+
+// Input teks yang terikat langsung ke atom: mengetik hanya me-render input ini,
+// bukan App / tab yang memuatnya
+function AtomInput({ atom, ...props }) {
+  const value = useAtom(atom);
+  return <input type="text" {...props} value={value} onChange={(e) => atom.set(e.target.value)} />;
+}
+
+export default AtomInput;
@@ -0,0 +1,59 @@
+// Heatmap kehadiran satu bulan: baris atas = tingkat kehadiran seluruh user
+// per hari, baris bawah = status user pemilik record yang dibuka
+const USER_CELL_CLASS = {
+  present: "bg-green-500",
+  late: "bg-yellow-400",
+  absent: "bg-red-400",
+};
+
+const USER_CELL_LABEL = {
+  present: "Hadir",
+  late: "Terlambat",
+  absent: "Tidak Hadir",
+};
+
+// Hijau makin pekat untuk tingkat kehadiran makin tinggi; abu-abu = bukan hari kerja
+const rateStyle = (rate) =>
+  Number.isNaN(rate) ? undefined : { backgroundColor: `rgba(34, 197, 94, ${0.15 + rate * 0.85})` };
+
+function AttendanceHeatmap({ month, dates, rates, userCells, userName }) {
+  return (
+    <div className="overflow-x-auto">
+      <table className="text-xs border-separate" style={{ borderSpacing: 2 }}>
+        <thead>
+          <tr>
+            <th className="text-left pr-2 font-medium text-gray-500">{month}</th>
+            {dates.map((date) => (
+              <th key={date} className="w-6 font-normal text-gray-500">{Number(date.slice(8, 10))}</th>
+            ))}
+          </tr>
+        </thead>
+        <tbody>
+          <tr>
+            <td className="pr-2 whitespace-nowrap">Semua user</td>
+            {dates.map((date, index) => (
+              <td
+                key={date}
+                className={`w-6 h-6 rounded ${Number.isNaN(rates[index]) ? "bg-gray-100" : ""}`}
+                style={rateStyle(rates[index])}
+                title={Number.isNaN(rates[index]) ? `${date}: tidak ada data` : `${date}: ${Math.round(rates[index] * 100)}% hadir`}
+              />
+            ))}
+          </tr>
+          <tr>
+            <td className="pr-2 whitespace-nowrap">{userName || "-"}</td>
+            {dates.map((date, index) => (
+              <td
+                key={date}
+                className={`w-6 h-6 rounded ${USER_CELL_CLASS[userCells[index]] || "bg-gray-100"}`}
+                title={`${date}: ${USER_CELL_LABEL[userCells[index]] || "tidak ada data"}`}
+              />
+            ))}
+          </tr>
+        </tbody>
+      </table>
+    </div>
+  );
+}
+
+export default AttendanceHeatmap;
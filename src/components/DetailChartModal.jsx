@@ -0,0 +1,443 @@
+import { useMemo } from "react";
+import {
+  LineChart,
+  Line,
+  CartesianGrid,
+  XAxis,
+  YAxis,
+  Tooltip,
+  Legend,
+  BarChart,
+  Bar,
+  ResponsiveContainer,
+  Cell,
+} from "recharts";
+import AttendanceHeatmap from "./AttendanceHeatmap";
+import LazyImage from "./LazyImage";
+import VirtualTable from "./VirtualTable";
+import { useAtom } from "./useAtom";
+import { photoUrl } from "../thumbnail";
+import { capitalize, normalizeMood, moodCategory } from "../aggregates";
+import { toDateKey } from "../record_store";
+import { buildFatigueSeries, moodHistogram } from "../downsample";
+import { perf } from "../perf";
+
+const GRANULARITY_LABELS = { day: "Tanggal", week: "Minggu mulai", month: "Bulan" };
+
+// Warna per kategori mood (lihat moodCategory di aggregates.js)
+const MOOD_COLORS = {
+  bahagia: "#22c55e",
+  sedih: "#facc15",
+  marah: "#ef4444",
+  netral: "#3b82f6",
+  lainnya: "#9ca3af",
+};
+
+const MOOD_BADGE_CLASS = {
+  bahagia: "bg-green-500",
+  sedih: "bg-yellow-500",
+  marah: "bg-red-500",
+  netral: "bg-blue-500",
+  lainnya: "bg-gray-500",
+};
+
+// Tooltip grafik keletihan: agregat persis dari bucket yang ditunjuk
+const FatigueTooltip = ({ active, payload, granularity }) => {
+  if (!active || !payload || payload.length === 0) return null;
+  const point = payload[0].payload;
+  return (
+    <div className="bg-white p-3 border rounded shadow text-sm">
+      <p className="font-semibold">{`${GRANULARITY_LABELS[granularity] || "Tanggal"}: ${point.bucket}`}</p>
+      <p>{`Rata-rata: ${point.mean}%`}</p>
+      <p>{`Min / Max: ${point.min}% / ${point.max}%`}</p>
+      <p>{`Jumlah deteksi: ${point.count}`}</p>
+      <p>{`Mood dominan: ${capitalize(point.dominantMood)}`}</p>
+    </div>
+  );
+};
+
+const AttendanceTooltip = ({ active, payload, label }) => {
+  if (active && payload && payload.length) {
+    return (
+      <div className="bg-white p-4 border rounded shadow">
+        <p className="font-semibold">{`Tanggal: ${new Date(label).toLocaleDateString('id-ID')}`}</p>
+        {payload.map((entry) => (
+          <p key={entry.dataKey} style={{ color: entry.color }}>{`${entry.name}: ${entry.value} orang`}</p>
+        ))}
+      </div>
+    );
+  }
+  return null;
+};
+
+// Record device yang cocok dengan filter modal (nama, guid, hari DD, bulan YYYY-MM)
+const filterDetailRecords = (records, filter) => {
+  const nama = filter.nama.toLowerCase();
+  return records.filter((item) => {
+    const namaMatch = !nama || (item.nama && item.nama.toLowerCase().includes(nama));
+    const guidMatch = !filter.guid_device || item.guid_device?.includes(filter.guid_device);
+
+    // Ekstrak Bagian Tanggal dari DateTime (YYYY-MM-DD atau DD-MM-YYYY)
+    const dateKey = toDateKey(item.datetime) || "";
+    const hariMatch = !filter.tanggal_hari || dateKey.slice(8, 10) === filter.tanggal_hari;
+    const bulanTahunMatch = !filter.bulan_tahun || dateKey.slice(0, 7) === filter.bulan_tahun;
+
+    return namaMatch && guidMatch && hariMatch && bulanTahunMatch;
+  });
+};
+
+// Modal detail record (tab Dashboard & AI): tabel, grafik keletihan / mood
+// dan kehadiran. Dimuat lazy bersama recharts saat pertama dibuka.
+function DetailChartModal({
+  selectedPhoto,
+  filterAtom,
+  granularityAtom,
+  deviceRecords,
+  selectedUserRecord,
+  attendanceData,
+  attendanceTotals,
+  attendanceHeatmap,
+  employeeCount,
+  onClose,
+}) {
+  // Filter & granularitas dari atom: mengubahnya hanya me-render modal ini
+  const detailFilter = useAtom(filterAtom);
+  const chartGranularity = useAtom(granularityAtom);
+  const setFilterField = (field, value) => filterAtom.set((prev) => ({ ...prev, [field]: value }));
+
+  // Record tabel & grafik, memo per filter dan isi device (App memo per versi store)
+  const detailRecords = useMemo(
+    () => filterDetailRecords(deviceRecords, detailFilter),
+    [deviceRecords, detailFilter]
+  );
+  // Titik grafik keletihan: per bucket waktu, maksimal 120 titik (LTTB)
+  const detailFatigueSeries = useMemo(
+    () => perf.time("chart", () => buildFatigueSeries(detailRecords, { granularity: chartGranularity })),
+    [detailRecords, chartGranularity]
+  );
+  // Histogram mood (satu kali hitung, dipakai untuk data & warna grafik)
+  const detailMoodSeries = useMemo(() => moodHistogram(detailRecords), [detailRecords]);
+
+  return (
+    <div className="fixed inset-0 bg-black bg-opacity-50 flex justify-center items-center z-50">
+      <div className="bg-white p-6 rounded w-full max-w-4xl max-h-[90vh] overflow-y-auto">
+        <h2 className="text-xl font-bold mb-4">Detail Grafik - {selectedPhoto.nama || selectedPhoto.guid_device}</h2>
+
+        {/* Filter Section */}
+        <div className="grid grid-cols-1 md:grid-cols-4 gap-4 mb-6">
+          {/* Filter Nama */}
+          <div>
+            <label className="block text-sm font-medium mb-1">Nama</label>
+            <input
+              type="text"
+              name="nama"
+              value={detailFilter.nama}
+              onChange={(e) => setFilterField("nama", e.target.value)}
+              placeholder="Filter nama..."
+              className="w-full px-3 py-2 border rounded"
+            />
+          </div>
+
+          {/* Filter GUID Device */}
+          <div>
+            <label className="block text-sm font-medium mb-1">GUID Device</label>
+            <input
+              type="text"
+              name="guid_device"
+              value={detailFilter.guid_device}
+              onChange={(e) => setFilterField("guid_device", e.target.value)}
+              placeholder="Filter GUID..."
+              className="w-full px-3 py-2 border rounded"
+            />
+          </div>
+
+          {/* Filter Tanggal (Hari) */}
+          <div>
+            <label className="block text-sm font-medium mb-1">Tanggal / Hari (DD)</label>
+            <select
+              name="tanggal_hari"
+              value={detailFilter.tanggal_hari}
+              onChange={(e) => setFilterField("tanggal_hari", e.target.value)}
+              className="w-full px-3 py-2 border rounded"
+            >
+              <option value="">Semua Hari</option>
+              {Array.from({length: 31}, (_, i) => {
+                const day = (i + 1).toString().padStart(2, '0');
+                return <option key={day} value={day}>{day}</option>;
+              })}
+            </select>
+          </div>
+
+          {/* Filter Bulan & Tahun */}
+          <div>
+            <label className="block text-sm font-medium mb-1">Bulan & Tahun</label>
+            <input
+              type="month"
+              name="bulan_tahun"
+              value={detailFilter.bulan_tahun}
+              onChange={(e) => setFilterField("bulan_tahun", e.target.value)}
+              className="w-full px-3 py-2 border rounded"
+            />
+          </div>
+        </div>
+
+        <div className="flex justify-between items-center mb-4">
+          <button
+            onClick={() => filterAtom.set((prev) => Object.fromEntries(Object.keys(prev).map((field) => [field, ""])))}
+            className="px-4 py-2 bg-gray-300 rounded hover:bg-gray-400"
+          >
+            Reset Filter
+          </button>
+          <div className="text-sm text-gray-500">
+            Menampilkan data 1 bulan terakhir
+          </div>
+        </div>
+
+        {/* Detail Filter Tanggal/Hari / Bulan / Tahun */}
+        <div className="mb-4 p-3 bg-blue-50 rounded text-sm">
+          {detailFilter.tanggal_hari && (
+            <span className="inline-block mr-3">
+              Hari: <strong>{detailFilter.tanggal_hari}</strong>
+            </span>
+          )}
+          {detailFilter.bulan_tahun && (
+            <span className="inline-block mr-3">
+              Periode: <strong>{detailFilter.bulan_tahun}</strong>
+            </span>
+          )}
+          {(!detailFilter.tanggal_hari && !detailFilter.bulan_tahun) && (
+            <span>Menampilkan semua tanggal</span>
+          )}
+        </div>
+
+        {/* Tabel Data (di-window: hanya baris yang terlihat yang dirender) */}
+        {detailRecords.length > 0 ? (
+          <VirtualTable
+            items={detailRecords}
+            getKey={(item, index) => item.id ?? index}
+            height="24rem"
+            estimateRowHeight={82}
+            className="mb-6"
+            header={
+              <tr className="bg-gray-100 text-left">
+                <th className="p-2 border">Tanggal</th>
+                <th className="p-2 border">Nama</th>
+                <th className="p-2 border">GUID Device</th>
+                <th className="p-2 border">Status</th>
+                <th className="p-2 border">Keletihan</th>
+                <th className="p-2 border">Suasana Hati</th>
+                <th className="p-2 border">Gambar</th>
+              </tr>
+            }
+            renderRow={(item, index, row) => (
+              <tr key={row.key} ref={row.ref} className="border-t hover:bg-gray-50">
+                <td className="p-2 border">{item.datetime?.slice(0, 10)}</td>
+                <td className="p-2 border">{item.nama || '-'}</td>
+                <td className="p-2 border">{item.guid_device}</td>
+                <td className="p-2 border">{item.status_absen || '-'}</td>
+                <td className="p-2 border">{item.keletihan || '-'}%</td>
+                <td className="p-2 border">
+                  <span className={`px-2 py-1 rounded text-xs text-white ${MOOD_BADGE_CLASS[moodCategory(normalizeMood(item.mood))]}`}>
+                    {item.mood || '-'}
+                  </span>
+                </td>
+                <td className="p-2 border">
+                  <LazyImage
+                    gambar={item.gambar}
+                    alt="Preview"
+                    width={64}
+                    className="w-16 h-16 object-cover cursor-pointer"
+                    onClick={() => window.open(photoUrl(item.gambar), '_blank')}
+                  />
+                </td>
+              </tr>
+            )}
+          />
+        ) : (
+          <div className="p-4 mb-6 text-center text-gray-500 border border-gray-300">
+            Tidak ada data yang sesuai dengan filter
+          </div>
+        )}
+
+        {/* Informasi Karyawan */}
+        <div className="mb-6 p-4 bg-gray-50 rounded">
+          <h3 className="font-semibold mb-2">Informasi Karyawan</h3>
+          <div className="grid grid-cols-2 gap-2">
+            <p><span className="font-medium">Nama:</span> {selectedPhoto.nama || selectedUserRecord?.name || "-"}</p>
+            <p><span className="font-medium">GUID Device:</span> {selectedPhoto.guid_device}</p>
+            <p><span className="font-medium">Unit:</span> {selectedPhoto.unit || selectedUserRecord?.unit || "-"}</p>
+            <p><span className="font-medium">Total Data:</span> {deviceRecords.length}</p>
+          </div>
+        </div>
+
+        {/* Grafik */}
+        <h3 className="text-lg font-semibold mt-8 mb-4">Visualisasi Data</h3>
+        <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
+          
+          {/* Grafik Keletihan */}
+          <div className="bg-white p-4 rounded border">
+            <div className="flex items-center justify-between mb-2">
+              <h4 className="font-medium">Presentase Keletihan</h4>
+              <select
+                value={chartGranularity}
+                onChange={(e) => granularityAtom.set(e.target.value)}
+                className="border rounded px-2 py-1 text-sm"
+              >
+                <option value="auto">Otomatis</option>
+                <option value="day">Harian</option>
+                <option value="week">Mingguan</option>
+                <option value="month">Bulanan</option>
+              </select>
+            </div>
+            <div className="h-64">
+              <ResponsiveContainer width="100%" height="100%">
+                <LineChart data={detailFatigueSeries.points}>
+                  <CartesianGrid strokeDasharray="3 3" />
+                  <XAxis dataKey="bucket" />
+                  <YAxis domain={[0, 100]} />
+                  <Tooltip content={<FatigueTooltip granularity={detailFatigueSeries.granularity} />} />
+                  <Line 
+                    type="monotone" 
+                    dataKey="mean" 
+                    stroke="#8884d8" 
+                    name="Keletihan (%)"
+                    dot={detailFatigueSeries.points.length <= 60}
+                    isAnimationActive={false}
+                  />
+                </LineChart>
+              </ResponsiveContainer>
+            </div>
+            {detailFatigueSeries.points.length < detailFatigueSeries.totalBuckets && (
+              <p className="text-xs text-gray-500 mt-1">
+                {detailFatigueSeries.points.length} dari {detailFatigueSeries.totalBuckets} titik ditampilkan
+              </p>
+            )}
+          </div>
+
+          {/* Grafik Mood */}
+          <div className="bg-white p-4 rounded border">
+            <h4 className="font-medium mb-2">Suasana Hati / Mood</h4>
+            <div className="h-64">
+              <ResponsiveContainer width="100%" height="100%">
+                <BarChart data={detailMoodSeries}>
+                  <CartesianGrid strokeDasharray="3 3" />
+                  <XAxis dataKey="label" />
+                  <YAxis />
+                  <Tooltip />
+                  <Bar dataKey="count" name="Jumlah" isAnimationActive={false}>
+                    {detailMoodSeries.map((entry) => (
+                      <Cell key={entry.mood} fill={MOOD_COLORS[entry.mood]} />
+                    ))}
+                  </Bar>
+                </BarChart>
+              </ResponsiveContainer>
+            </div>
+          </div>
+        </div>
+
+        {/* Grafik Kehadiran */}
+        <div className="bg-white p-6 rounded-lg shadow mb-6">
+          <h3 className="text-lg font-semibold mb-4">Grafik Kehadiran Harian</h3>
+          <div className="h-80">
+            <ResponsiveContainer width="100%" height="100%">
+              <BarChart
+                data={attendanceData}
+                margin={{ top: 20, right: 30, left: 20, bottom: 60 }}
+              >
+                <CartesianGrid strokeDasharray="3 3" />
+                <XAxis
+                  dataKey="date"
+                  angle={-1}
+                  textAnchor="end"
+                  height={60}
+                  tickFormatter={(date) => new Date(date).toLocaleDateString('id-ID', { day: 'numeric', month: 'short' })}
+                />
+                <YAxis />
+                <Tooltip
+                  content={<AttendanceTooltip />}
+                  labelFormatter={(date) => `Tanggal: ${new Date(date).toLocaleDateString('id-ID')}`}
+                />
+                <Legend />
+                <Bar
+                  dataKey="present"
+                  name="Hadir"
+                  fill="#4ade80"
+                  radius={[4, 4, 0, 0]}
+                />
+                <Bar
+                  dataKey="late"
+                  name="Terlambat"
+                  fill="#facc15"
+                  radius={[4, 4, 0, 0]}
+                />
+                <Bar
+                  dataKey="absent"
+                  name="Tidak Hadir"
+                  fill="#f87171"
+                  radius={[4, 4, 0, 0]}
+                />
+              </BarChart>
+            </ResponsiveContainer>
+          </div>
+          {attendanceHeatmap && (
+            <div className="mt-6">
+              <h4 className="text-md font-semibold mb-2">Heatmap Kehadiran Bulanan</h4>
+              <AttendanceHeatmap
+                {...attendanceHeatmap}
+                userName={selectedPhoto.nama || selectedUserRecord?.name || selectedPhoto.guid_device}
+              />
+            </div>
+          )}
+        </div>
+
+        {/* Ringkasan Statistik */}
+        <div className="grid grid-cols-1 md:grid-cols-5 gap-4 mb-6">
+          <div className="bg-white p-4 rounded-lg shadow text-center border border-blue-100">
+            <h4 className="text-sm font-medium text-gray-500">Total Karyawan</h4>
+            <p className="text-2xl font-bold text-blue-600">
+              {employeeCount}
+            </p>
+          </div>
+          <div className="bg-white p-4 rounded-lg shadow text-center border border-green-100">
+            <h4 className="text-sm font-medium text-gray-500">Hadir</h4>
+            <p className="text-2xl font-bold text-green-600">
+              {attendanceTotals.present}
+            </p>
+          </div>
+          <div className="bg-white p-4 rounded-lg shadow text-center border border-yellow-100">
+            <h4 className="text-sm font-medium text-gray-500">Terlambat</h4>
+            <p className="text-2xl font-bold text-yellow-600">
+              {attendanceTotals.late}
+            </p>
+          </div>
+          <div className="bg-white p-4 rounded-lg shadow text-center border border-red-100">
+            <h4 className="text-sm font-medium text-gray-500">Tidak Hadir</h4>
+            <p className="text-2xl font-bold text-red-600">
+              {attendanceTotals.absent}
+            </p>
+          </div>
+          <div className="bg-white p-4 rounded-lg shadow text-center border border-purple-100">
+            <h4 className="text-sm font-medium text-gray-500">Rata-rata Kehadiran</h4>
+            <p className="text-2xl font-bold text-purple-600">
+              {attendanceData.length > 0
+                ? `${Math.round(attendanceTotals.averageRate * 100)}%`
+                : '0%'}
+            </p>
+          </div>
+        </div>
+
+        {/* Tombol Tutup */}
+        <div className="flex justify-end mt-6">
+          <button
+            onClick={onClose}
+            className="px-4 py-2 bg-blue-600 text-white rounded hover:bg-blue-700"
+          >
+            Tutup
+          </button>
+        </div>
+      </div>
+    </div>
+  );
+}
+
+export default DetailChartModal;
@@ -0,0 +1,112 @@
+import { useState, useEffect, useRef } from "react";
+import {
+  FALLBACK_IMAGE,
+  photoUrl,
+  thumbnailUrl,
+  thumbnailSrcSet,
+  getThumbnail,
+  canGenerateThumbnails,
+} from "../thumbnail";
+import { PRIORITY, requestScheduler, hostOf } from "../request_scheduler";
+
+// Foto presensi yang baru dimuat saat mendekati viewport (IntersectionObserver),
+// memakai thumbnail seukuran `width` dan placeholder blur sampai gambar siap.
+// Jika thumbnail gagal dibuat, foto asli dipakai; jika foto gagal dimuat,
+// ditampilkan /images/fallback.jpg. Unduhan lewat <img> menunggu slot kelas
+// thumbnail di request scheduler; kartu yang dilepas sebelum dapat slot batal.
+const LazyImage = ({ gambar, alt = "", width = 320, className = "", onClick, rootMargin = "200px" }) => {
+  const containerRef = useRef(null);
+  const [visible, setVisible] = useState(false);
+  const [src, setSrc] = useState(null);
+  const [loaded, setLoaded] = useState(false);
+  const [failed, setFailed] = useState(false);
+  // Pelepas slot scheduler milik <img> yang sedang diunduh
+  const releaseRef = useRef(null);
+
+  const releaseSlot = () => {
+    releaseRef.current?.();
+    releaseRef.current = null;
+  };
+
+  useEffect(() => {
+    const element = containerRef.current;
+    if (!element || typeof IntersectionObserver === "undefined") {
+      setVisible(true);
+      return;
+    }
+    const observer = new IntersectionObserver(
+      (entries) => {
+        if (entries.some((entry) => entry.isIntersecting)) {
+          setVisible(true);
+          observer.disconnect();
+        }
+      },
+      { rootMargin }
+    );
+    observer.observe(element);
+    return () => observer.disconnect();
+  }, [rootMargin]);
+
+  useEffect(() => {
+    setLoaded(false);
+    setFailed(!gambar);
+    setSrc(null);
+    if (!visible || !gambar) return;
+
+    const controller = new AbortController();
+    const loadWithSlot = (url) =>
+      requestScheduler
+        .acquire({ priority: PRIORITY.thumbnail, host: hostOf(url), signal: controller.signal })
+        .then(({ release }) => {
+          if (controller.signal.aborted) return;
+          releaseRef.current = release;
+          setSrc(url);
+        })
+        .catch(() => {});
+
+    if (thumbnailSrcSet(gambar)) {
+      loadWithSlot(thumbnailUrl(gambar, width));
+    } else if (!canGenerateThumbnails()) {
+      loadWithSlot(photoUrl(gambar));
+    } else {
+      getThumbnail(gambar, width * (globalThis.devicePixelRatio || 1), { signal: controller.signal })
+        .then((url) => !controller.signal.aborted && setSrc(url))
+        .catch(() => !controller.signal.aborted && loadWithSlot(photoUrl(gambar)));
+    }
+    return () => {
+      controller.abort();
+      releaseSlot();
+    };
+  }, [visible, gambar, width]);
+
+  const srcSet = !failed && gambar ? thumbnailSrcSet(gambar) : null;
+
+  return (
+    <div
+      ref={containerRef}
+      onClick={onClick}
+      className={`relative overflow-hidden bg-gray-200 ${loaded ? "" : "animate-pulse"} ${className}`}
+    >
+      {(src || failed) && (
+        <img
+          src={failed ? FALLBACK_IMAGE : src}
+          srcSet={srcSet || undefined}
+          sizes={srcSet ? `${width}px` : undefined}
+          alt={alt}
+          decoding="async"
+          onLoad={() => {
+            releaseSlot();
+            setLoaded(true);
+          }}
+          onError={() => {
+            releaseSlot();
+            setFailed(true);
+          }}
+          className={`w-full h-full object-cover transition duration-300 ${loaded ? "" : "blur-md scale-105"}`}
+        />
+      )}
+    </div>
+  );
+};
+
+export default LazyImage;
@@ -0,0 +1,37 @@
+import { getPageNumbers } from "../page_window";
+
+// Navigasi halaman: Sebelumnya / nomor halaman / Berikutnya
+function Pagination({ page, totalPages, onChange }) {
+  return (
+    <div className="flex flex-col items-center mt-6 gap-2">
+      <div className="flex gap-2">
+        <button
+          onClick={() => onChange(Math.max(page - 1, 1))}
+          disabled={page === 1}
+          className="px-3 py-1 rounded border bg-white"
+        >
+          Sebelumnya
+        </button>
+        {getPageNumbers(page, totalPages).map((p) => (
+          <button
+            key={p}
+            onClick={() => onChange(p)}
+            className={`px-3 py-1 rounded border ${page === p ? "bg-blue-600 text-white" : "bg-white"}`}
+          >
+            {p}
+          </button>
+        ))}
+        <button
+          onClick={() => onChange(Math.min(page + 1, totalPages))}
+          disabled={page === totalPages}
+          className="px-3 py-1 rounded border bg-white"
+        >
+          Berikutnya
+        </button>
+      </div>
+      <p className="text-sm text-gray-500">Halaman {page} dari {totalPages}</p>
+    </div>
+  );
+}
+
+export default Pagination;
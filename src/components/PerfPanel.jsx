@@ -0,0 +1,112 @@
+import { useState, useEffect } from "react";
+import { perf } from "../perf";
+import { requestScheduler } from "../request_scheduler";
+import { downloadBuffer } from "../worker_pool";
+
+// Panel debug tersembunyi: dimuat lazy oleh App saat flag aktif (lihat usePerfToggle.js)
+
+const ms = (value) => `${value.toFixed(1)} ms`;
+const kb = (value) => `${(value / 1024).toFixed(1)} KB`;
+
+const MetricTable = ({ title, rows, columns }) => (
+  <div className="mb-3">
+    <h4 className="font-semibold mb-1">{title}</h4>
+    {rows.length === 0 ? (
+      <p className="text-gray-400">Belum ada data</p>
+    ) : (
+      <table className="w-full">
+        <thead>
+          <tr className="text-left text-gray-500">
+            <th className="pr-2">Nama</th>
+            {columns.map(([label]) => (
+              <th key={label} className="pr-2 text-right">{label}</th>
+            ))}
+          </tr>
+        </thead>
+        <tbody>
+          {rows.map(([name, metric]) => (
+            <tr key={name} className="border-t border-gray-700">
+              <td className="pr-2 break-all">{name}</td>
+              {columns.map(([label, format]) => (
+                <td key={label} className="pr-2 text-right whitespace-nowrap">{format(metric)}</td>
+              ))}
+            </tr>
+          ))}
+        </tbody>
+      </table>
+    )}
+  </div>
+);
+
+const TIMING_COLUMNS = [
+  ["n", (m) => m.count],
+  ["p50", (m) => ms(m.p50)],
+  ["p95", (m) => ms(m.p95)],
+  ["max", (m) => ms(m.max)],
+];
+
+const QUEUE_COLUMNS = [
+  ["aktif", (m) => m.active],
+  ["antri", (m) => m.queued],
+  ["mulai", (m) => m.started],
+  ["batal", (m) => m.canceled + m.superseded],
+  ["tunggu", (m) => ms(m.waitAvg)],
+  ["maks", (m) => ms(m.waitMax)],
+];
+
+const HOST_COLUMNS = [
+  ["aktif", (m) => m.active],
+  ["antri", (m) => m.queued],
+];
+
+// Snapshot perf + kondisi antrian request scheduler
+const readSnapshot = () => ({ ...perf.snapshot(), queue: requestScheduler.metrics() });
+
+const REQUEST_COLUMNS = [
+  ...TIMING_COLUMNS,
+  ["rata2", (m) => kb(m.avgBytes)],
+  ["error", (m) => m.errors],
+];
+
+function PerfPanel({ onClose }) {
+  const [snapshot, setSnapshot] = useState(readSnapshot);
+
+  // Dibaca ulang per detik selama panel terbuka (bukan per event, agar render
+  // panel sendiri tidak memicu update berantai)
+  useEffect(() => {
+    const timer = setInterval(() => setSnapshot(readSnapshot()), 1000);
+    return () => clearInterval(timer);
+  }, []);
+
+  const handleExport = () => {
+    downloadBuffer({
+      blob: new Blob([JSON.stringify(readSnapshot(), null, 2)], { type: "application/json" }),
+      fileName: `perf-${new Date().toISOString().replace(/[:.]/g, "-")}.json`,
+    });
+  };
+
+  const handleReset = () => {
+    perf.reset();
+    setSnapshot(readSnapshot());
+  };
+
+  return (
+    <div className="fixed bottom-4 right-4 z-50 w-[32rem] max-h-[70vh] overflow-y-auto bg-gray-900 text-gray-100 text-xs rounded shadow-lg p-3">
+      <div className="flex items-center justify-between mb-2">
+        <h3 className="font-bold text-sm">Performa</h3>
+        <div className="flex gap-2">
+          <button onClick={handleExport} className="bg-blue-600 px-2 py-1 rounded">Export JSON</button>
+          <button onClick={handleReset} className="bg-gray-600 px-2 py-1 rounded">Reset</button>
+          <button onClick={onClose} className="bg-red-600 px-2 py-1 rounded">Tutup</button>
+        </div>
+      </div>
+      <MetricTable title="Request per endpoint" rows={Object.entries(snapshot.requests)} columns={REQUEST_COLUMNS} />
+      <MetricTable title="Antrian request per kelas" rows={Object.entries(snapshot.queue.classes)} columns={QUEUE_COLUMNS} />
+      <MetricTable title="Antrian per host" rows={Object.entries(snapshot.queue.hosts)} columns={HOST_COLUMNS} />
+      <MetricTable title="Tahap" rows={Object.entries(snapshot.stages)} columns={TIMING_COLUMNS} />
+      <MetricTable title="Render" rows={Object.entries(snapshot.renders)} columns={TIMING_COLUMNS} />
+    </div>
+  );
+}
+
+export default PerfPanel;
@@ -0,0 +1,124 @@
+import {
+  LineChart,
+  Line,
+  CartesianGrid,
+  XAxis,
+  YAxis,
+  Tooltip,
+  Legend,
+  BarChart,
+  Bar,
+  ResponsiveContainer,
+} from "recharts";
+
+const DetailItem = ({ label, value }) => (
+  <div className="flex">
+    <span className="font-medium w-1/3">{label}:</span>
+    <span className="w-2/3">{value || '-'}</span>
+  </div>
+);
+
+// Modal detail user + grafik profil emosi. Dimuat lazy (recharts) saat pertama dibuka.
+function UserDetailModal({ user, profilingChartData, onClose }) {
+  return (
+    <div className="fixed inset-0 bg-black bg-opacity-50 flex justify-center items-center z-50">
+      <div className="bg-white p-6 rounded w-full max-w-4xl max-h-[90vh] overflow-y-auto">
+        <h2 className="text-2xl font-bold mb-4">Detail User</h2>
+
+        {/* Susunan vertikal */}
+        <div className="flex flex-col gap-6 mb-6">
+          {/* Detail User di atas */}
+          <div className="flex flex-col items-center">
+            {user.avatar ? (
+              <img
+                src={user.avatar}
+                alt={user.name}
+                className="w-32 h-32 rounded-full object-cover mb-4"
+              />
+            ) : (
+              <div className="w-32 h-32 rounded-full bg-gray-200 flex items-center justify-center mb-4">
+                <span>No Photo</span>
+              </div>
+            )}
+            <h3 className="text-lg font-semibold">{user.name}</h3>
+            <p className="text-sm text-gray-500">{user.position || '-'}</p>
+
+            <div className="mt-4 w-full">
+              <DetailItem label="Profesi" value={user.profession} />
+              <DetailItem label="Email" value={user.email} />
+              <DetailItem label="No. Telp" value={user.phoneNumber} />
+              <DetailItem label="Unit" value={user.unit} />
+              <DetailItem label="Status" value={user.isDeleted ? "Non-Aktif" : "Aktif"} />
+            </div>
+          </div>
+
+          {/* Grafik Analisis Profil Emosi */}
+          <div>
+            <h3 className="text-xl font-semibold mb-4">Grafik Presentase Keletihan</h3>
+            <div className="h-64">
+              <ResponsiveContainer width="100%" height="100%">
+                <LineChart data={profilingChartData}>
+                  <CartesianGrid strokeDasharray="3 3" />
+                  <XAxis
+                    dataKey="date"
+                    tickFormatter={(value) => value.slice(0, 5)}
+                  />
+                  <YAxis domain={[0, 100]} />
+                  <Tooltip
+                    formatter={(value) => [`${value}%`, "Keletihan"]}
+                    labelFormatter={(date) => `Tanggal: ${date}`}
+                  />
+                  <Legend />
+                  <Line
+                    type="monotone"
+                    dataKey="keletihan"
+                    stroke="#8884d8"
+                    name="Keletihan (%)"
+                    strokeWidth={2}
+                  />
+                </LineChart>
+              </ResponsiveContainer>
+            </div>
+          </div>
+
+          {/* Grafik Detail Emosi */}
+          <div>
+            <h3 className="text-xl font-semibold mb-4">Grafik Suasana Hati</h3>
+            <div className="h-64">
+              <ResponsiveContainer width="100%" height="100%">
+                <BarChart data={profilingChartData}>
+                  <CartesianGrid strokeDasharray="3 3" />
+                  <XAxis
+                    dataKey="date"
+                    tickFormatter={(value) => value.slice(0, 5)}
+                  />
+                  <YAxis />
+                  <Tooltip
+                    formatter={(value, name) => [`${value}%`, name]}
+                    labelFormatter={(date) => `Tanggal: ${date}`}
+                  />
+                  <Legend />
+                  <Bar dataKey="bahagia" stackId="a" fill="#22c55e" name="Bahagia" />
+                  <Bar dataKey="netral" stackId="a" fill="#3b82f6" name="Netral" />
+                  <Bar dataKey="sedih" stackId="a" fill="#facc15" name="Sedih" />
+                  <Bar dataKey="marah" stackId="a" fill="#ef4444" name="Marah" />
+                </BarChart>
+              </ResponsiveContainer>
+            </div>
+          </div>
+        </div>
+
+        <div className="flex justify-end mt-4">
+          <button
+            onClick={onClose}
+            className="px-4 py-2 bg-gray-300 rounded hover:bg-gray-400"
+          >
+            Tutup
+          </button>
+        </div>
+      </div>
+    </div>
+  );
+}
+
+export default UserDetailModal;
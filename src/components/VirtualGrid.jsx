@@ -0,0 +1,57 @@
+import { useState, useEffect } from "react";
+import { useVirtualRows } from "./useVirtualRows";
+import { useRenderTiming } from "./useRenderTiming";
+
+// Jumlah kolom mengikuti breakpoint Tailwind yang dipakai grid lama
+// (grid-cols-1 md:grid-cols-2 lg:grid-cols-5)
+const columnsForWidth = (width) => (width >= 1024 ? 5 : width >= 768 ? 2 : 1);
+
+const useColumnCount = () => {
+  const [columns, setColumns] = useState(() =>
+    typeof window === "undefined" ? 5 : columnsForWidth(window.innerWidth)
+  );
+  useEffect(() => {
+    const onResize = () => setColumns(columnsForWidth(window.innerWidth));
+    window.addEventListener("resize", onResize);
+    return () => window.removeEventListener("resize", onResize);
+  }, []);
+  return columns;
+};
+
+// Grid kartu yang hanya merender baris kartu yang terlihat
+function VirtualGrid({ items, renderItem, getKey, estimateRowHeight = 360, className = "", height = "75vh" }) {
+  useRenderTiming("VirtualGrid");
+  const columns = useColumnCount();
+  const rowCount = Math.ceil(items.length / columns);
+  const { containerRef, onScroll, start, end, paddingTop, paddingBottom, measureRef } = useVirtualRows({
+    count: rowCount,
+    estimateHeight: estimateRowHeight,
+    overscan: 2,
+  });
+
+  const rows = [];
+  for (let row = start; row < end; row++) {
+    const rowItems = items.slice(row * columns, (row + 1) * columns);
+    rows.push(
+      <div
+        key={row}
+        ref={measureRef(row)}
+        className="grid gap-4 pb-4"
+        style={{ gridTemplateColumns: `repeat(${columns}, minmax(0, 1fr))` }}
+      >
+        {rowItems.map((item, i) => {
+          const index = row * columns + i;
+          return <div key={getKey ? getKey(item, index) : index}>{renderItem(item, index)}</div>;
+        })}
+      </div>
+    );
+  }
+
+  return (
+    <div ref={containerRef} onScroll={onScroll} className={`overflow-y-auto ${className}`} style={{ maxHeight: height }}>
+      <div style={{ paddingTop, paddingBottom }}>{rows}</div>
+    </div>
+  );
+}
+
+export default VirtualGrid;
@@ -0,0 +1,40 @@
+import { useVirtualRows } from "./useVirtualRows";
+import { useRenderTiming } from "./useRenderTiming";
+
+// Tabel dengan body yang di-window: baris di luar layar diganti spacer <tr>
+function VirtualTable({ items, header, renderRow, getKey, estimateRowHeight = 42, className = "", height = "70vh" }) {
+  useRenderTiming("VirtualTable");
+  const { containerRef, onScroll, start, end, paddingTop, paddingBottom, measureRef } = useVirtualRows({
+    count: items.length,
+    estimateHeight: estimateRowHeight,
+  });
+
+  const rows = [];
+  for (let index = start; index < end; index++) {
+    const item = items[index];
+    rows.push(renderRow(item, index, { key: getKey ? getKey(item, index) : index, ref: measureRef(index) }));
+  }
+
+  return (
+    <div ref={containerRef} onScroll={onScroll} className={`overflow-auto ${className}`} style={{ maxHeight: height }}>
+      <table className="w-full table-auto border border-gray-300">
+        <thead className="sticky top-0">{header}</thead>
+        <tbody>
+          {paddingTop > 0 && (
+            <tr aria-hidden="true">
+              <td style={{ height: paddingTop, padding: 0, border: 0 }} />
+            </tr>
+          )}
+          {rows}
+          {paddingBottom > 0 && (
+            <tr aria-hidden="true">
+              <td style={{ height: paddingBottom, padding: 0, border: 0 }} />
+            </tr>
+          )}
+        </tbody>
+      </table>
+    </div>
+  );
+}
+
+export default VirtualTable;
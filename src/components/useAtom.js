@@ -0,0 +1,4 @@
+import { useSyncExternalStore } from "react";
+
+// Nilai atom (lihat ui_state.js); komponen render ulang hanya saat atom ini berubah
+export const useAtom = (atom) => useSyncExternalStore(atom.subscribe, atom.get);
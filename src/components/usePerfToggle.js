@@ -0,0 +1,23 @@
+import { useState, useEffect } from "react";
+
+// Flag panel debug performa: ?debug=perf di URL, lalu Ctrl+Shift+P untuk buka/tutup.
+// Dipisah dari PerfPanel agar panel (beserta tabelnya) baru dimuat saat flag aktif.
+const isEnabledByUrl = () =>
+  typeof window !== "undefined" && new URLSearchParams(window.location.search).get("debug") === "perf";
+
+export const usePerfToggle = () => {
+  const [open, setOpen] = useState(isEnabledByUrl);
+
+  useEffect(() => {
+    const onKeyDown = (event) => {
+      if (event.ctrlKey && event.shiftKey && event.key.toLowerCase() === "p") {
+        event.preventDefault();
+        setOpen((value) => !value);
+      }
+    };
+    window.addEventListener("keydown", onKeyDown);
+    return () => window.removeEventListener("keydown", onKeyDown);
+  }, []);
+
+  return [open, setOpen];
+};
@@ -0,0 +1,13 @@
+import { useLayoutEffect } from "react";
+import { perf } from "../perf";
+
+const now = () => (typeof performance !== "undefined" ? performance.now() : Date.now());
+
+// Jumlah & durasi render komponen (render + commit subtree) ke recorder perf.
+// Pengganti <Profiler>, yang tidak tersedia di preact/compat.
+export const useRenderTiming = (name) => {
+  const start = now();
+  useLayoutEffect(() => {
+    perf.recordRender(name, now() - start);
+  });
+};
@@ -0,0 +1,95 @@
+import { useState, useRef, useEffect, useCallback } from "react";
+
+// Windowing untuk list panjang: hanya baris yang terlihat (+ overscan) yang
+// dirender. Tinggi baris diukur dengan ResizeObserver dan disimpan per index,
+// sehingga saat baris yang sama muncul lagi posisinya tidak perlu ditebak.
+export const useVirtualRows = ({ count, estimateHeight = 60, overscan = 4 }) => {
+  const containerRef = useRef(null);
+  const heightsRef = useRef(new Map());
+  const observerRef = useRef(null);
+  const elementsRef = useRef(new Map());
+  const [scrollTop, setScrollTop] = useState(0);
+  const [viewportHeight, setViewportHeight] = useState(600);
+  const [, setMeasureVersion] = useState(0);
+
+  useEffect(() => {
+    if (typeof ResizeObserver === "undefined") return;
+    const observer = new ResizeObserver((entries) => {
+      let changed = false;
+      for (const entry of entries) {
+        const index = Number(entry.target.dataset.virtualIndex);
+        const height = entry.borderBoxSize?.[0]?.blockSize ?? entry.contentRect.height;
+        if (height > 0 && heightsRef.current.get(index) !== height) {
+          heightsRef.current.set(index, height);
+          changed = true;
+        }
+      }
+      if (changed) setMeasureVersion((version) => version + 1);
+    });
+    observerRef.current = observer;
+    for (const element of elementsRef.current.values()) observer.observe(element);
+
+    const container = containerRef.current;
+    const containerObserver = new ResizeObserver(() => {
+      if (container) setViewportHeight(container.clientHeight);
+    });
+    if (container) containerObserver.observe(container);
+
+    return () => {
+      observer.disconnect();
+      containerObserver.disconnect();
+      observerRef.current = null;
+    };
+  }, []);
+
+  // Data berganti total (mis. filter baru): ukuran lama tidak relevan lagi
+  useEffect(() => {
+    if (heightsRef.current.size > count) heightsRef.current.clear();
+  }, [count]);
+
+  // Offset kumulatif tiap baris (tinggi terukur, atau estimasi jika belum)
+  const offsets = new Float64Array(count + 1);
+  for (let i = 0; i < count; i++) {
+    offsets[i + 1] = offsets[i] + (heightsRef.current.get(i) ?? estimateHeight);
+  }
+  const totalHeight = offsets[count];
+
+  // Binary search baris pertama yang terlihat
+  let low = 0;
+  let high = count;
+  while (low < high) {
+    const mid = (low + high) >> 1;
+    if (offsets[mid + 1] <= scrollTop) low = mid + 1;
+    else high = mid;
+  }
+  const start = Math.max(0, low - overscan);
+  let end = low;
+  while (end < count && offsets[end] < scrollTop + viewportHeight) end++;
+  end = Math.min(count, end + overscan);
+
+  const onScroll = useCallback((event) => setScrollTop(event.currentTarget.scrollTop), []);
+
+  // Callback ref untuk elemen baris ke-`index` agar tingginya diukur
+  const measureRef = (index) => (element) => {
+    const previous = elementsRef.current.get(index);
+    if (previous && previous !== element) {
+      observerRef.current?.unobserve(previous);
+      elementsRef.current.delete(index);
+    }
+    if (element) {
+      element.dataset.virtualIndex = index;
+      elementsRef.current.set(index, element);
+      observerRef.current?.observe(element);
+    }
+  };
+
+  return {
+    containerRef,
+    onScroll,
+    start,
+    end,
+    paddingTop: offsets[start],
+    paddingBottom: totalHeight - offsets[end],
+    measureRef,
+  };
+};
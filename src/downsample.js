@@ -0,0 +1,162 @@
+// Data grafik keletihan untuk rentang panjang.
+//
+// Record dikelompokkan per hari / minggu / bulan (otomatis mengikuti panjang
+// rentang), lalu jika jumlah bucket masih melebihi `maxPoints` dipilih
+// ulang dengan LTTB (Largest-Triangle-Three-Buckets) agar bentuk kurva
+// (puncak & lembah) tetap terlihat. Setiap titik yang tampil membawa
+// agregat persis bucket-nya (rata-rata, min, max, jumlah, mood) untuk tooltip.
+
+import { toDateKey } from "./record_store.js";
+import { normalizeMood, moodCategory, MOOD_CATEGORIES, capitalize } from "./aggregates.js";
+
+export const GRANULARITIES = ["day", "week", "month"];
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+const toUtcMs = (dateKey) => Date.UTC(Number(dateKey.slice(0, 4)), Number(dateKey.slice(5, 7)) - 1, Number(dateKey.slice(8, 10)));
+
+const toDateString = (ms) => new Date(ms).toISOString().slice(0, 10);
+
+// Rentang <= 2 bulan per hari, <= 1 tahun per minggu, selebihnya per bulan
+export const chooseGranularity = (firstDate, lastDate) => {
+  const days = (toUtcMs(lastDate) - toUtcMs(firstDate)) / DAY_MS;
+  if (days <= 62) return "day";
+  if (days <= 366) return "week";
+  return "month";
+};
+
+// Kunci bucket: hari "YYYY-MM-DD", minggu = tanggal Senin "YYYY-MM-DD", bulan "YYYY-MM"
+export const bucketKey = (dateKey, granularity) => {
+  if (granularity === "month") return dateKey.slice(0, 7);
+  if (granularity === "week") {
+    const ms = toUtcMs(dateKey);
+    const weekday = (new Date(ms).getUTCDay() + 6) % 7;
+    return toDateString(ms - weekday * DAY_MS);
+  }
+  return dateKey;
+};
+
+// Agregat per bucket, urut waktu: [{ bucket, x, mean, min, max, count, moods, dominantMood }]
+export const bucketSeries = (records, granularity) => {
+  const buckets = new Map();
+  for (const record of records) {
+    const date = toDateKey(record.datetime);
+    if (!date) continue;
+    const key = bucketKey(date, granularity);
+    let bucket = buckets.get(key);
+    if (!bucket) {
+      bucket = { bucket: key, sum: 0, min: Infinity, max: -Infinity, count: 0, moods: {} };
+      buckets.set(key, bucket);
+    }
+    const fatigue = parseFloat(record.keletihan);
+    if (!Number.isNaN(fatigue)) {
+      bucket.sum += fatigue;
+      bucket.count++;
+      if (fatigue < bucket.min) bucket.min = fatigue;
+      if (fatigue > bucket.max) bucket.max = fatigue;
+    }
+    const mood = moodCategory(normalizeMood(record.mood) || "tidak terdeteksi");
+    bucket.moods[mood] = (bucket.moods[mood] || 0) + 1;
+  }
+
+  return [...buckets.values()]
+    .filter((bucket) => bucket.count > 0)
+    .sort((a, b) => (a.bucket < b.bucket ? -1 : 1))
+    .map(({ bucket, sum, min, max, count, moods }) => {
+      const dominantMood = MOOD_CATEGORIES.reduce(
+        (best, mood) => ((moods[mood] || 0) > (moods[best] || 0) ? mood : best),
+        MOOD_CATEGORIES[0]
+      );
+      return {
+        bucket,
+        x: toUtcMs(bucket.length === 7 ? `${bucket}-01` : bucket),
+        mean: Number((sum / count).toFixed(1)),
+        min,
+        max,
+        count,
+        moods,
+        dominantMood,
+      };
+    });
+};
+
+// LTTB: pilih `threshold` titik dari `points` ({ x, [yKey] }) yang paling
+// mempertahankan bentuk kurva. Titik pertama & terakhir selalu ikut.
+export const lttb = (points, threshold, yKey = "mean") => {
+  if (threshold >= points.length || threshold < 3) return points;
+  const sampled = [points[0]];
+  const bucketSize = (points.length - 2) / (threshold - 2);
+  let previous = 0;
+
+  for (let i = 0; i < threshold - 2; i++) {
+    // Rata-rata bucket berikutnya sebagai titik ketiga segitiga
+    const nextStart = Math.floor((i + 1) * bucketSize) + 1;
+    const nextEnd = Math.min(Math.floor((i + 2) * bucketSize) + 1, points.length);
+    let avgX = 0;
+    let avgY = 0;
+    for (let j = nextStart; j < nextEnd; j++) {
+      avgX += points[j].x;
+      avgY += points[j][yKey];
+    }
+    const nextCount = Math.max(1, nextEnd - nextStart);
+    avgX /= nextCount;
+    avgY /= nextCount;
+
+    const start = Math.floor(i * bucketSize) + 1;
+    const end = Math.floor((i + 1) * bucketSize) + 1;
+    const anchor = points[previous];
+    let maxArea = -1;
+    let chosen = start;
+    for (let j = start; j < end; j++) {
+      const area = Math.abs(
+        (anchor.x - avgX) * (points[j][yKey] - anchor[yKey]) - (anchor.x - points[j].x) * (avgY - anchor[yKey])
+      );
+      if (area > maxArea) {
+        maxArea = area;
+        chosen = j;
+      }
+    }
+    sampled.push(points[chosen]);
+    previous = chosen;
+  }
+
+  sampled.push(points[points.length - 1]);
+  return sampled;
+};
+
+// Jumlah deteksi per kategori mood untuk seluruh record (kategori sama dengan
+// bucket grafik keletihan): [{ mood, label, count }], kategori kosong dilewati
+export const moodHistogram = (records) => {
+  const counts = Object.fromEntries(MOOD_CATEGORIES.map((category) => [category, 0]));
+  for (const record of records) {
+    counts[moodCategory(normalizeMood(record.mood) || "tidak terdeteksi")]++;
+  }
+  return MOOD_CATEGORIES.filter((mood) => counts[mood] > 0).map((mood) => ({
+    mood,
+    label: capitalize(mood),
+    count: counts[mood],
+  }));
+};
+
+// Series keletihan siap pakai untuk recharts.
+// `granularity`: "auto" | "day" | "week" | "month".
+export const buildFatigueSeries = (records, { granularity = "auto", maxPoints = 120 } = {}) => {
+  let resolved = granularity;
+  if (resolved === "auto") {
+    let first = null;
+    let last = null;
+    for (const record of records) {
+      const date = toDateKey(record.datetime);
+      if (!date) continue;
+      if (first === null || date < first) first = date;
+      if (last === null || date > last) last = date;
+    }
+    resolved = first ? chooseGranularity(first, last) : "day";
+  }
+  const buckets = bucketSeries(records, resolved);
+  return {
+    granularity: resolved,
+    totalBuckets: buckets.length,
+    points: lttb(buckets, maxPoints),
+  };
+};
@@ -0,0 +1,144 @@
+// Export history per halaman (dipakai oleh workers/dashboard.worker.js).
+//
+// `streamSourcePages` mengambil halaman satu per satu langsung dari API,
+// sehingga history mentah yang ada di memori hanya satu halaman. Setiap
+// halaman difilter lalu ditulis ke writer:
+//
+// - csv  : setiap chunk menjadi Blob kecil; file akhir = Blob dari potongan
+//          tsb. Hanya format ini yang memakai memori datar.
+// - xlsx : baris ditambahkan ke sheet per chunk (sheet_add_aoa). Sheet baru
+//          dibuat setiap MAX_SHEET_ROWS baris (batas baris Excel).
+// - pdf  : setiap chunk menjadi lanjutan tabel autoTable di halaman berikutnya.
+//
+// xlsx dan jsPDF menyusun seluruh workbook / dokumen di memori sampai
+// `finish()`, jadi memori export xlsx / pdf tetap tumbuh sebanding jumlah
+// baris; untuk data sangat besar gunakan CSV. Keduanya di-import dinamis saat
+// format tersebut pertama dipakai, jadi export CSV tidak ikut mengunduh
+// library xlsx / pdf.
+
+import { recordId } from "./record_store.js";
+import { readPageMeta } from "./page_window.js";
+import { decodeHistoryBody } from "./columnar.js";
+import { EXPORT_COLUMNS } from "./worker_messages.js";
+
+export const EXPORT_FORMATS = {
+  csv: { extension: "csv", mime: "text/csv;charset=utf-8" },
+  xlsx: { extension: "xlsx", mime: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet" },
+  pdf: { extension: "pdf", mime: "application/pdf" },
+};
+
+const MAX_SHEET_ROWS = 1_000_000;
+
+const HEADER = EXPORT_COLUMNS.map(({ label }) => label);
+
+export const toExportRow = (record) => EXPORT_COLUMNS.map(({ key }) => record[key] ?? "-");
+
+const csvCell = (value) => {
+  const text = String(value);
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+};
+
+const createCsvWriter = () => {
+  // BOM agar Excel membaca UTF-8 dengan benar
+  const parts = ["\uFEFF" + HEADER.map(csvCell).join(",") + "\r\n"];
+  return {
+    write: (rows) => {
+      let chunk = "";
+      for (const row of rows) chunk += row.map(csvCell).join(",") + "\r\n";
+      parts.push(new Blob([chunk]));
+    },
+    finish: () => new Blob(parts, { type: EXPORT_FORMATS.csv.mime }),
+  };
+};
+
+const createXlsxWriter = async () => {
+  const XLSX = await import("xlsx");
+  const workbook = XLSX.utils.book_new();
+  let worksheet = null;
+  let sheetRows = 0;
+
+  const newSheet = () => {
+    worksheet = XLSX.utils.aoa_to_sheet([HEADER]);
+    sheetRows = 0;
+    const index = workbook.SheetNames.length;
+    XLSX.utils.book_append_sheet(workbook, worksheet, index === 0 ? "Data Kamera" : `Data Kamera ${index + 1}`);
+  };
+
+  return {
+    write: (rows) => {
+      let offset = 0;
+      while (offset < rows.length) {
+        if (!worksheet || sheetRows >= MAX_SHEET_ROWS) newSheet();
+        const slice = rows.slice(offset, offset + (MAX_SHEET_ROWS - sheetRows));
+        XLSX.utils.sheet_add_aoa(worksheet, slice, { origin: -1 });
+        sheetRows += slice.length;
+        offset += slice.length;
+      }
+    },
+    finish: () => {
+      if (!worksheet) newSheet();
+      return XLSX.write(workbook, { bookType: "xlsx", type: "array" });
+    },
+  };
+};
+
+const createPdfWriter = async () => {
+  const [{ default: jsPDF }, { autoTable }] = await Promise.all([import("jspdf"), import("jspdf-autotable")]);
+  const doc = new jsPDF();
+  let first = true;
+  return {
+    write: (rows) => {
+      if (rows.length === 0) return;
+      autoTable(doc, {
+        head: [HEADER],
+        body: rows,
+        startY: first ? undefined : doc.lastAutoTable.finalY,
+        showHead: first ? "everyPage" : "never",
+      });
+      first = false;
+    },
+    finish: () => {
+      if (first) autoTable(doc, { head: [HEADER], body: [] });
+      return doc.output("arraybuffer");
+    },
+  };
+};
+
+// Async: writer xlsx / pdf memuat library-nya lebih dulu
+export const createExportWriter = async (format) => {
+  if (format === "csv") return createCsvWriter();
+  if (format === "pdf") return createPdfWriter();
+  return createXlsxWriter();
+};
+
+// Iterasi halaman `source` ({ url, params }) sampai halaman terakhir.
+// Menghasilkan hasil `readPageMeta` per halaman. `hasNext` hanya dipercaya
+// jika server mengirim total halaman; tanpa metadata, halaman berikutnya
+// tetap diminta sampai halaman kosong atau halaman yang tidak menambah record
+// baru (server yang mengabaikan `page` terus mengembalikan data yang sama).
+export async function* streamSourcePages({ url, params = {} }, { signal, maxPages = 10000, fetchImpl = fetch } = {}) {
+  let cursor = null;
+  const seen = new Set();
+  for (let page = 1; page <= maxPages; page++) {
+    const query = new URLSearchParams({ ...params, page: String(page) });
+    if (cursor) query.set("cursor", cursor);
+    const response = await fetchImpl(`${url}?${query}`, { signal });
+    if (!response.ok) throw new Error(`Halaman ${page} gagal diambil (${response.status})`);
+    const meta = readPageMeta(decodeHistoryBody(await response.json()), page);
+    if (meta.items.length === 0) return;
+    let added = 0;
+    for (const item of meta.items) {
+      const id = recordId(item);
+      if (id === undefined || id === null) {
+        added++;
+      } else if (!seen.has(id)) {
+        seen.add(id);
+        added++;
+      }
+    }
+    if (added === 0) return;
+    yield meta;
+    if (meta.totalPages !== null && !meta.hasNext) return;
+    cursor = meta.nextCursor;
+  }
+}
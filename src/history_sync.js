@@ -0,0 +1,164 @@
+// Sinkronisasi inkremental ("since") untuk history kamera / AI.
+//
+// Setelah satu kali full load (`seed`), `sync()` hanya meminta record yang
+// lebih baru dari cursor terakhir (`timestamp` atau `id`), menggabungkannya
+// ke record store (lihat record_store.js) berdasarkan `id`, dan menerapkan
+// tombstone untuk data yang dihapus. Full load dibandingkan dengan record
+// milik sync ini, sehingga record yang tidak lagi dikirim server ikut dibuang
+// walaupun server tidak mengirim tombstone. `startPolling` menjalankan sync
+// otomatis dengan backoff.
+//
+// `fetchSince(cursor)` harus mengembalikan { items, deleted } dimana
+// `deleted` adalah daftar id yang sudah dihapus di server. `isHeld(id)`
+// (opsional) menandai record yang masih ditampilkan sumber lain: record
+// tersebut tidak dibuang dari store saat tidak lagi ada di full load.
+
+import { createRecordStore, recordId } from "./record_store.js";
+
+// Record dianggap tombstone jika ditandai terhapus oleh server
+const isTombstone = (item) => Boolean(item?.deleted || item?.isDeleted || item?._deleted);
+
+// Nilai pembanding cursor: angka (epoch / id numerik) atau string apa adanya
+const toComparable = (value) => {
+  const number = Number(value);
+  return Number.isFinite(number) ? number : String(value);
+};
+
+export const createHistorySync = ({
+  fetchSince,
+  key = "id",
+  cursorField = "timestamp",
+  store = createRecordStore({ key }),
+  onChange,
+  isHeld = () => false,
+}) => {
+  let cursor = null;
+  // true hanya setelah `seed` (full load); apply dari live feed / resume dari
+  // IndexedDB menggeser cursor tetapi tidak menggantikan full load
+  let seeded = false;
+  // Id record yang masuk lewat sync ini (store bisa dipakai bersama sumber lain)
+  const owned = new Set();
+
+  const advanceCursor = (item) => {
+    const value = item?.[cursorField] ?? item?.[key];
+    if (value === undefined || value === null) return;
+    if (cursor === null || toComparable(value) > toComparable(cursor)) {
+      cursor = value;
+    }
+  };
+
+  const removeOwned = (id, changes) => {
+    owned.delete(id);
+    if (store.remove(id)) changes.removed++;
+  };
+
+  const merge = (items, deleted, changes) => {
+    for (const item of items) {
+      const id = recordId(item, key);
+      if (id === undefined || id === null) continue;
+      advanceCursor(item);
+      if (isTombstone(item)) {
+        removeOwned(id, changes);
+        continue;
+      }
+      owned.add(id);
+      const result = store.upsert(item);
+      if (result) changes[result]++;
+    }
+    for (const id of deleted) removeOwned(id, changes);
+    return changes;
+  };
+
+  const notify = (changes) => {
+    if (changes.added || changes.updated || changes.removed) {
+      onChange?.(changes);
+    }
+    return changes;
+  };
+
+  const apply = (items = [], deleted = []) => notify(merge(items, deleted, { added: 0, updated: 0, removed: 0 }));
+
+  // Full load awal (atau reload penuh): record milik sync ini yang tidak ada
+  // di respons dibuang, sisanya digabung ke store dan cursor dihitung ulang.
+  const seed = (items = []) => {
+    const changes = { added: 0, updated: 0, removed: 0 };
+    const present = new Set();
+    for (const item of items) {
+      const id = recordId(item, key);
+      if (id !== undefined && id !== null && !isTombstone(item)) present.add(id);
+    }
+    for (const id of [...owned]) {
+      if (present.has(id)) continue;
+      if (isHeld(id)) owned.delete(id);
+      else removeOwned(id, changes);
+    }
+    cursor = null;
+    seeded = true;
+    return notify(merge(items, [], changes));
+  };
+
+  // Lanjutkan dari cursor tersimpan (mis. setelah store diisi dari IndexedDB).
+  // `savedIds` = id milik sync ini saat disimpan, agar full load berikutnya
+  // bisa membuang record yang sudah tidak ada di server.
+  const resume = (savedCursor, savedIds = []) => {
+    if (savedCursor !== undefined && savedCursor !== null) cursor = savedCursor;
+    for (const id of savedIds) owned.add(id);
+  };
+
+  let syncing = null;
+  const sync = () => {
+    // Gabungkan pemanggilan sync yang bersamaan
+    if (syncing) return syncing;
+    syncing = fetchSince(cursor)
+      .then(({ items = [], deleted = [] } = {}) => apply(items, deleted))
+      .finally(() => {
+        syncing = null;
+      });
+    return syncing;
+  };
+
+  // Polling otomatis. Interval kembali ke `interval` saat ada perubahan,
+  // dan dilipatgandakan (maks `maxInterval`) saat kosong atau error.
+  const startPolling = ({ interval = 15 * 1000, maxInterval = 5 * 60 * 1000 } = {}) => {
+    let delay = interval;
+    let timer = null;
+    let stopped = false;
+
+    const tick = async () => {
+      if (stopped) return;
+      // Tab browser tidak terlihat: tunda tanpa request
+      if (typeof document !== "undefined" && document.hidden) {
+        timer = setTimeout(tick, delay);
+        return;
+      }
+      try {
+        const changes = await sync();
+        const changed = changes.added || changes.updated || changes.removed;
+        delay = changed ? interval : Math.min(delay * 2, maxInterval);
+      } catch (error) {
+        console.error("Gagal sinkronisasi history:", error);
+        delay = Math.min(delay * 2, maxInterval);
+      }
+      if (!stopped) timer = setTimeout(tick, delay);
+    };
+
+    timer = setTimeout(tick, delay);
+    return () => {
+      stopped = true;
+      clearTimeout(timer);
+    };
+  };
+
+  return {
+    seed,
+    resume,
+    sync,
+    apply,
+    startPolling,
+    getRecords: () => store.values(),
+    getCursor: () => cursor,
+    getOwnedIds: () => [...owned],
+    owns: (id) => owned.has(id),
+    isSeeded: () => seeded,
+  };
+};
@@ -0,0 +1,153 @@
+// Live feed (push) untuk record `history` dan `history_ai` baru.
+//
+// Transport default adalah Server-Sent Events; WebSocket juga didukung dengan
+// format pesan yang sama: { id, type: "history" | "history_ai", data }.
+// Record yang masuk dikumpulkan lalu dikirim ke `onBatch` sekali per
+// animation frame, sehingga burst deteksi tidak memicu render berkali-kali.
+// Saat koneksi putus, feed tersambung ulang (dengan backoff) dan melanjutkan
+// dari event id terakhir.
+
+const CHANNELS = ["history", "history_ai"];
+
+const scheduleFrame = (callback) =>
+  typeof requestAnimationFrame === "function"
+    ? requestAnimationFrame(callback)
+    : setTimeout(callback, 16);
+
+const withLastEventId = (url, lastEventId) => {
+  if (lastEventId === null || lastEventId === undefined) return url;
+  const separator = url.includes("?") ? "&" : "?";
+  return `${url}${separator}lastEventId=${encodeURIComponent(lastEventId)}`;
+};
+
+export const subscribeHistoryFeed = ({
+  url,
+  onBatch,
+  onStatus,
+  transport = "sse",
+  lastEventId = null,
+  minRetry = 1000,
+  maxRetry = 30 * 1000,
+}) => {
+  let queue = { history: [], history_ai: [] };
+  let frameScheduled = false;
+  let source = null;
+  let retryDelay = minRetry;
+  let retryTimer = null;
+  let closed = false;
+
+  const flush = () => {
+    frameScheduled = false;
+    const batch = queue;
+    queue = { history: [], history_ai: [] };
+    if (batch.history.length || batch.history_ai.length) {
+      onBatch(batch);
+    }
+  };
+
+  const enqueue = (type, data, id) => {
+    if (!CHANNELS.includes(type)) return;
+    if (id !== undefined && id !== null && id !== "") lastEventId = id;
+    const records = Array.isArray(data) ? data : [data];
+    queue[type].push(...records);
+    if (!frameScheduled) {
+      frameScheduled = true;
+      scheduleFrame(flush);
+    }
+  };
+
+  const parse = (raw) => {
+    try {
+      return JSON.parse(raw);
+    } catch (error) {
+      console.error("Pesan live feed tidak valid:", error);
+      return null;
+    }
+  };
+
+  const scheduleReconnect = () => {
+    if (closed) return;
+    onStatus?.("reconnecting");
+    retryTimer = setTimeout(connect, retryDelay);
+    retryDelay = Math.min(retryDelay * 2, maxRetry);
+  };
+
+  const onOpen = () => {
+    retryDelay = minRetry;
+    onStatus?.("open");
+  };
+
+  function connect() {
+    if (closed) return;
+    const target = withLastEventId(url, lastEventId);
+
+    if (transport === "ws") {
+      const socket = new WebSocket(target);
+      socket.onopen = onOpen;
+      socket.onmessage = (event) => {
+        const message = parse(event.data);
+        if (message) enqueue(message.type, message.data, message.id);
+      };
+      socket.onclose = () => {
+        source = null;
+        scheduleReconnect();
+      };
+      source = socket;
+      return;
+    }
+
+    const eventSource = new EventSource(target);
+    eventSource.onopen = onOpen;
+    for (const type of CHANNELS) {
+      eventSource.addEventListener(type, (event) => {
+        const data = parse(event.data);
+        if (data) enqueue(type, data, event.lastEventId);
+      });
+    }
+    eventSource.onerror = () => {
+      // EventSource menyambung ulang sendiri selama masih CONNECTING;
+      // jika sudah CLOSED, sambung ulang manual dengan lastEventId.
+      if (eventSource.readyState === EventSource.CLOSED) {
+        source = null;
+        scheduleReconnect();
+      }
+    };
+    source = eventSource;
+  }
+
+  connect();
+
+  return {
+    close: () => {
+      closed = true;
+      clearTimeout(retryTimer);
+      source?.close();
+      onStatus?.("closed");
+    },
+    getLastEventId: () => lastEventId,
+  };
+};
+
+// Gabungkan record baru ke list yang sedang tampil (terbaru di depan).
+// Record dengan id yang sudah ada diganti di tempat, bukan diduplikasi.
+// Dengan `limit`, record paling lama dibuang (pindah ke halaman berikutnya).
+export const prependRecords = (incoming, current, { key = "id", limit = Infinity } = {}) => {
+  const updates = new Map();
+  for (const record of incoming) updates.set(record[key], record);
+
+  const currentIds = new Set(current.map((item) => item[key]));
+
+  const merged = [];
+  // Event datang berurutan kronologis, jadi dibalik agar yang terbaru di atas
+  for (let i = incoming.length - 1; i >= 0; i--) {
+    const record = incoming[i];
+    if (updates.get(record[key]) !== record) continue;
+    if (!currentIds.has(record[key])) merged.push(record);
+  }
+  for (const item of current) {
+    if (merged.length >= limit) break;
+    merged.push(updates.has(item[key]) ? { ...item, ...updates.get(item[key]) } : item);
+  }
+  if (merged.length > limit) merged.length = limit;
+  return merged;
+};
@@ -0,0 +1,132 @@
+// Lapisan pagination berbasis server: membaca total & cursor dari respons
+// `/history/get` dan `/history_ai/get`, menyimpan hanya beberapa halaman di
+// memori (window) dan mengambil halaman berikutnya di latar belakang.
+
+import { PRIORITY } from "./request_scheduler.js";
+
+const firstDefined = (...values) => values.find((value) => value !== undefined && value !== null);
+
+// Normalisasi berbagai bentuk respons pagination dari backend:
+// { data, total, totalPages, next, nextCursor, pagination: {...}, meta: {...} }
+export const readPageMeta = (body, page, pageSize) => {
+  const items = Array.isArray(body) ? body : body?.data || [];
+  const info = { ...(body?.meta || {}), ...(body?.pagination || {}), ...(Array.isArray(body) ? {} : body) };
+
+  const total = firstDefined(info.total, info.totalData, info.total_data, info.count);
+  const limit = firstDefined(info.limit, info.perPage, info.per_page, pageSize);
+  let totalPages = firstDefined(info.totalPages, info.total_pages, info.lastPage, info.last_page);
+  if (totalPages === undefined && total !== undefined && limit > 0) {
+    totalPages = Math.max(1, Math.ceil(total / limit));
+  }
+
+  const nextCursor = firstDefined(info.nextCursor, info.next_cursor, info.cursor, info.next) ?? null;
+  let hasNext;
+  if (totalPages !== undefined) {
+    hasNext = page < totalPages;
+  } else if (nextCursor !== null) {
+    hasNext = true;
+  } else if (limit > 0) {
+    // Tanpa total: anggap masih ada halaman selama halaman ini penuh
+    hasNext = items.length >= limit;
+  } else {
+    // Tanpa metadata sama sekali ukuran halaman tidak diketahui; jangan
+    // menebak ada halaman berikutnya (server tanpa pagination)
+    hasNext = false;
+  }
+
+  return {
+    items,
+    page,
+    total: total ?? null,
+    totalPages: totalPages ?? null,
+    nextCursor,
+    hasNext,
+  };
+};
+
+// Membuat window halaman. `fetchPage(page, { cursor, force, priority })` harus
+// mengembalikan hasil `readPageMeta`; `priority` bernilai PRIORITY.prefetch
+// untuk halaman yang diambil di latar belakang. Halaman di luar jarak `windowSize`
+// dari halaman aktif dibuang agar memori tetap stabil.
+export const createPageWindow = ({ fetchPage, windowSize = 2, prefetch = true }) => {
+  const pages = new Map();
+  const pending = new Map();
+  const cursors = new Map();
+  // Halaman yang harus melewati cache request setelah refresh manual
+  const forced = new Set();
+  let forceAll = false;
+  let meta = { total: null, totalPages: null };
+
+  const evict = (current) => {
+    for (const page of pages.keys()) {
+      if (Math.abs(page - current) > windowSize) {
+        pages.delete(page);
+      }
+    }
+  };
+
+  const request = (page, priority = PRIORITY.interactive) => {
+    if (pages.has(page)) return Promise.resolve(pages.get(page));
+    // Halaman yang sedang di-prefetch lalu dibuka user diminta ulang sebagai
+    // interactive; request identik digabung oleh cache request dan dinaikkan
+    // prioritasnya (plus key supersede) di scheduler
+    const running = pending.get(page);
+    if (running && (running.priority === priority || priority !== PRIORITY.interactive)) {
+      return running.promise;
+    }
+
+    const force = forceAll && !forced.has(page);
+    if (force) forced.add(page);
+    const promise = fetchPage(page, { cursor: cursors.get(page) ?? null, force, priority })
+      .then((result) => {
+        pages.set(page, result);
+        if (result.nextCursor !== null) {
+          cursors.set(page + 1, result.nextCursor);
+        }
+        if (result.total !== null || result.totalPages !== null) {
+          meta = { total: result.total, totalPages: result.totalPages };
+        }
+        return result;
+      })
+      .finally(() => {
+        if (pending.get(page)?.promise === promise) pending.delete(page);
+      });
+
+    pending.set(page, { promise, priority });
+    return promise;
+  };
+
+  const load = async (page) => {
+    const result = await request(page);
+    evict(page);
+    if (prefetch && result.hasNext) {
+      // Prefetch di latar belakang, error diabaikan (akan dicoba lagi saat dibuka)
+      request(page + 1, PRIORITY.prefetch).catch(() => {});
+    }
+    return result;
+  };
+
+  return {
+    load,
+    // Kosongkan window (mis. setelah data dihapus/diubah). Dengan `force`,
+    // halaman berikutnya diambil langsung dari server, bukan dari cache request.
+    reset: ({ force = false } = {}) => {
+      pages.clear();
+      cursors.clear();
+      forced.clear();
+      forceAll = force;
+    },
+    getMeta: () => meta,
+    cachedPages: () => [...pages.keys()],
+  };
+};
+
+// Nomor halaman yang ditampilkan di navigasi: maksimal `span` tombol di
+// sekitar halaman aktif, tidak lagi hardcode [1..5].
+export const getPageNumbers = (current, totalPages, span = 5) => {
+  const total = Math.max(1, totalPages || 1);
+  const count = Math.min(span, total);
+  let start = Math.max(1, current - Math.floor(count / 2));
+  start = Math.min(start, total - count + 1);
+  return Array.from({ length: count }, (_, i) => start + i);
+};
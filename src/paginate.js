@@ -0,0 +1,110 @@
+// Mesin pengambilan data berhalaman (paginated fetch) secara paralel.
+//
+// `fetchPage(page, { signal })` harus mengembalikan array item untuk halaman
+// tersebut. Array kosong (atau null) dianggap sebagai akhir data: halaman
+// setelahnya tidak akan diminta lagi dan hasil yang sudah terlanjur datang
+// dari halaman sesudahnya dibuang.
+
+import { recordId } from "./record_store.js";
+
+// Ambil semua halaman mulai `startPage` dengan maksimal `concurrency` request
+// berjalan bersamaan. Hasil digabung ke satu buffer tanpa `concat` berulang.
+// Error per halaman tidak menghentikan proses, tapi dikumpulkan di `errors`.
+export const fetchPagesParallel = async (fetchPage, options = {}) => {
+  const {
+    concurrency = 4,
+    startPage = 1,
+    maxPages = 50,
+    signal,
+  } = options;
+
+  const pages = [];
+  const errors = [];
+  let nextPage = startPage;
+  // Batas atas (eksklusif), diturunkan saat halaman kosong pertama ditemukan
+  let stopAt = startPage + maxPages;
+
+  const worker = async () => {
+    while (nextPage < stopAt && !signal?.aborted) {
+      const page = nextPage++;
+      try {
+        const items = await fetchPage(page, { signal });
+        if (!items || items.length === 0) {
+          stopAt = Math.min(stopAt, page);
+          continue;
+        }
+        pages[page - startPage] = items;
+      } catch (error) {
+        if (signal?.aborted) return;
+        errors.push({ page, error });
+      }
+    }
+  };
+
+  const workerCount = Math.max(1, Math.min(concurrency, maxPages));
+  await Promise.all(Array.from({ length: workerCount }, worker));
+
+  // Hitung ukuran akhir dulu, lalu isi satu buffer secara in-place
+  const lastIndex = stopAt - startPage;
+  let total = 0;
+  for (let i = 0; i < lastIndex; i++) {
+    total += pages[i] ? pages[i].length : 0;
+  }
+
+  const data = new Array(total);
+  let offset = 0;
+  for (let i = 0; i < lastIndex; i++) {
+    const items = pages[i];
+    if (!items) continue;
+    for (let j = 0; j < items.length; j++) {
+      data[offset++] = items[j];
+    }
+  }
+
+  return {
+    data,
+    errors: errors
+      .filter((item) => item.page < stopAt)
+      .sort((a, b) => a.page - b.page),
+    // true jika berhenti karena halaman kosong (bukan karena batas maxPages)
+    complete: stopAt < startPage + maxPages,
+    lastPage: stopAt - 1,
+    aborted: Boolean(signal?.aborted),
+  };
+};
+
+// Ambil semua halaman dari sumber yang mengembalikan hasil `readPageMeta`
+// (lihat page_window.js). Halaman pertama menentukan apakah ada halaman
+// berikutnya; sisanya diambil paralel lewat fetchPagesParallel sampai
+// totalPages atau halaman kosong pertama. Halaman yang hanya mengulang isi
+// halaman pertama (server yang mengabaikan `page`) dianggap kosong, dan record
+// yang bergeser antar halaman selama load hanya diambil sekali.
+export const fetchAllPages = async (fetchPage, { concurrency = 4, maxPages = 50, signal, key = "id" } = {}) => {
+  const first = await fetchPage(1, { signal });
+  if (!first.hasNext || maxPages <= 1) {
+    return { data: first.items, errors: [], complete: !first.hasNext, lastPage: 1, aborted: false };
+  }
+
+  const firstIds = new Set(first.items.map((item) => recordId(item, key)));
+  const rest = await fetchPagesParallel(
+    async (page, options) => {
+      const { items } = await fetchPage(page, options);
+      return items.some((item) => !firstIds.has(recordId(item, key))) ? items : [];
+    },
+    { startPage: 2, maxPages: Math.min(first.totalPages ?? maxPages, maxPages) - 1, concurrency, signal }
+  );
+
+  const seen = new Set();
+  const data = [];
+  for (const items of [first.items, rest.data]) {
+    for (const item of items) {
+      const id = recordId(item, key);
+      if (id !== undefined && id !== null) {
+        if (seen.has(id)) continue;
+        seen.add(id);
+      }
+      data.push(item);
+    }
+  }
+  return { ...rest, data };
+};
@@ -0,0 +1,168 @@
+// Instrumentasi performa dashboard: latency & ukuran payload per endpoint,
+// durasi tahap (filter, agregasi, export, grafik) dan jumlah / durasi render
+// per komponen. Semua data disimpan di memori (ring buffer per metrik) dan
+// bisa dilihat di PerfPanel atau diekspor sebagai JSON.
+
+const now = () => (globalThis.performance?.now ? performance.now() : Date.now());
+
+const percentile = (sorted, p) => {
+  if (sorted.length === 0) return 0;
+  return sorted[Math.min(sorted.length - 1, Math.floor((p / 100) * sorted.length))];
+};
+
+// Statistik satu metrik: count / total / max + sampel terakhir untuk p50 & p95
+const createMetric = (maxSamples) => ({
+  count: 0,
+  total: 0,
+  max: 0,
+  samples: [],
+  add(value) {
+    this.count++;
+    this.total += value;
+    if (value > this.max) this.max = value;
+    this.samples.push(value);
+    if (this.samples.length > maxSamples) this.samples.shift();
+  },
+  summary() {
+    const sorted = [...this.samples].sort((a, b) => a - b);
+    return {
+      count: this.count,
+      avg: this.count ? this.total / this.count : 0,
+      p50: percentile(sorted, 50),
+      p95: percentile(sorted, 95),
+      max: this.max,
+    };
+  },
+});
+
+// "GET host/path"; segmen path berupa id (angka, ObjectId, uuid) diganti ":id"
+// agar request ke endpoint yang sama masuk satu baris
+export const endpointLabel = (method, url = "", baseURL) => {
+  let host = "";
+  let path = url;
+  try {
+    const parsed = new URL(url, baseURL || globalThis.location?.href);
+    host = parsed.host;
+    path = parsed.pathname;
+  } catch {
+    path = url.split("?")[0];
+  }
+  const normalized = path
+    .split("/")
+    .filter(Boolean)
+    .map((segment) => (/^\d+$|^[0-9a-f]{24,}$|^[0-9a-f-]{32,36}$/i.test(segment) ? ":id" : segment))
+    .join("/");
+  return `${(method || "get").toUpperCase()} ${host}/${normalized}`;
+};
+
+export const createPerfRecorder = ({ maxSamples = 200 } = {}) => {
+  const requests = new Map();
+  const stages = new Map();
+  const renders = new Map();
+  const startedAt = new Date().toISOString();
+
+  const getEntry = (map, name, create) => {
+    let entry = map.get(name);
+    if (!entry) {
+      entry = create();
+      map.set(name, entry);
+    }
+    return entry;
+  };
+
+  const recordRequest = ({ endpoint, duration, bytes = 0, ok = true }) => {
+    const entry = getEntry(requests, endpoint, () => ({
+      latency: createMetric(maxSamples),
+      bytes: 0,
+      errors: 0,
+    }));
+    entry.latency.add(duration);
+    entry.bytes += bytes;
+    if (!ok) entry.errors++;
+  };
+
+  const recordStage = (stage, duration) => {
+    getEntry(stages, stage, () => createMetric(maxSamples)).add(duration);
+  };
+
+  // Ukur `fn` (sinkron maupun Promise) sebagai tahap `stage`
+  const time = (stage, fn) => {
+    const start = now();
+    const result = fn();
+    if (result && typeof result.then === "function") {
+      return result.finally(() => recordStage(stage, now() - start));
+    }
+    recordStage(stage, now() - start);
+    return result;
+  };
+
+  const recordRender = (component, duration) => {
+    getEntry(renders, component, () => createMetric(maxSamples)).add(duration);
+  };
+
+  const snapshot = () => ({
+    startedAt,
+    capturedAt: new Date().toISOString(),
+    userAgent: globalThis.navigator?.userAgent,
+    requests: Object.fromEntries(
+      [...requests].map(([endpoint, { latency, bytes, errors }]) => [
+        endpoint,
+        { ...latency.summary(), errors, bytes, avgBytes: latency.count ? bytes / latency.count : 0 },
+      ])
+    ),
+    stages: Object.fromEntries([...stages].map(([stage, metric]) => [stage, metric.summary()])),
+    renders: Object.fromEntries([...renders].map(([component, metric]) => [component, metric.summary()])),
+  });
+
+  return {
+    recordRequest,
+    recordStage,
+    recordRender,
+    time,
+    snapshot,
+    exportJson: () => JSON.stringify(snapshot(), null, 2),
+    reset: () => {
+      requests.clear();
+      stages.clear();
+      renders.clear();
+    },
+  };
+};
+
+// Recorder bersama untuk seluruh aplikasi
+export const perf = createPerfRecorder();
+
+const payloadBytes = (response) => {
+  const header = response?.headers?.["content-length"];
+  if (header) return Number(header) || 0;
+  const text = response?.request?.responseText;
+  return typeof text === "string" ? text.length : 0;
+};
+
+// Pasang interceptor timing ke instance axios
+export const instrumentAxios = (instance, recorder = perf) => {
+  instance.interceptors.request.use((config) => {
+    config.perfStart = now();
+    return config;
+  });
+  const finish = (config, response, ok) => {
+    if (!config?.perfStart) return;
+    recorder.recordRequest({
+      endpoint: endpointLabel(config.method, config.url, config.baseURL),
+      duration: now() - config.perfStart,
+      bytes: payloadBytes(response),
+      ok,
+    });
+  };
+  instance.interceptors.response.use(
+    (response) => {
+      finish(response.config, response, true);
+      return response;
+    },
+    (error) => {
+      finish(error?.config, error?.response, false);
+      return Promise.reject(error);
+    }
+  );
+  return instance;
+};
@@ -0,0 +1,219 @@
+// Penyimpanan offline record history (kamera + AI) di IndexedDB.
+//
+// Saat aplikasi dibuka, `hydrate()` mengisi record store dari IndexedDB
+// sehingga dashboard langsung menampilkan kondisi terakhir, lalu sync ke
+// server berjalan di belakang. Setiap perubahan store dicatat dan ditulis
+// dalam satu transaksi (debounce `flushDelay`). Jika perkiraan ukuran record
+// tersimpan melewati `maxBytes`, record yang paling lama tersimpan dihapus
+// lebih dulu.
+//
+// Schema diberi versi (DB_VERSION); perubahan bentuk data cukup menambah
+// langkah di MIGRATIONS. Foto tidak disimpan di sini, melainkan di Cache
+// Storage oleh service worker (public/sw.js).
+
+import { recordId } from "./record_store.js";
+
+const DB_NAME = "presensi-history";
+const DB_VERSION = 1;
+const RECORDS = "records";
+const META = "meta";
+
+// MIGRATIONS[n] menaikkan schema dari versi n ke n + 1
+const MIGRATIONS = [
+  (db) => {
+    const records = db.createObjectStore(RECORDS, { keyPath: "id" });
+    records.createIndex("storedAt", "storedAt");
+    db.createObjectStore(META);
+  },
+];
+
+// Perkiraan ukuran satu record (panjang JSON ~ byte untuk teks ASCII)
+const estimateSize = (record) => {
+  try {
+    return JSON.stringify(record).length;
+  } catch {
+    return 0;
+  }
+};
+
+const promisify = (request) =>
+  new Promise((resolve, reject) => {
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+
+const transactionDone = (transaction) =>
+  new Promise((resolve, reject) => {
+    transaction.oncomplete = () => resolve();
+    transaction.onerror = () => reject(transaction.error);
+    transaction.onabort = () => reject(transaction.error);
+  });
+
+export const openHistoryDb = ({ name = DB_NAME } = {}) =>
+  new Promise((resolve, reject) => {
+    const request = indexedDB.open(name, DB_VERSION);
+    request.onupgradeneeded = (event) => {
+      for (let version = event.oldVersion; version < DB_VERSION; version++) {
+        MIGRATIONS[version](request.result, request.transaction);
+      }
+    };
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+    request.onblocked = () => reject(new Error("IndexedDB diblokir oleh tab lain"));
+  });
+
+export const isPersistenceSupported = () => typeof indexedDB !== "undefined";
+
+export const createHistoryPersistence = ({
+  store,
+  key = "id",
+  name = DB_NAME,
+  maxBytes = 20 * 1024 * 1024,
+  flushDelay = 1000,
+  // Data tambahan yang ikut disimpan setiap flush (mis. cursor sync)
+  getMeta = () => ({}),
+}) => {
+  if (!isPersistenceSupported()) {
+    return {
+      hydrate: async () => ({ count: 0, meta: {} }),
+      flush: async () => {},
+      clear: async () => {},
+      dispose: () => {},
+    };
+  }
+
+  let dbPromise = null;
+  const getDb = () => {
+    if (!dbPromise) dbPromise = openHistoryDb({ name });
+    return dbPromise;
+  };
+
+  // id -> record (upsert) atau null (hapus), menunggu flush berikutnya
+  const pending = new Map();
+  // id -> perkiraan ukuran record tersimpan, dan totalnya (diisi saat hydrate)
+  const sizes = new Map();
+  let totalBytes = 0;
+
+  const setSize = (id, size) => {
+    totalBytes += size - (sizes.get(id) || 0);
+    if (size > 0) sizes.set(id, size);
+    else sizes.delete(id);
+  };
+  let hydrating = false;
+  let timer = null;
+
+  const scheduleFlush = () => {
+    if (timer) return;
+    timer = setTimeout(() => {
+      timer = null;
+      flush().catch((error) => console.error("Gagal menyimpan history offline:", error));
+    }, flushDelay);
+  };
+
+  const unsubscribe = store.subscribe(({ type, record }) => {
+    if (hydrating) return;
+    const id = recordId(record, key);
+    if (id === undefined || id === null) return;
+    pending.set(id, type === "upsert" ? record : null);
+    scheduleFlush();
+  });
+
+  const evict = async (db) => {
+    if (totalBytes <= maxBytes) return;
+    const transaction = db.transaction(RECORDS, "readwrite");
+    const cursorRequest = transaction.objectStore(RECORDS).index("storedAt").openCursor();
+    await new Promise((resolve, reject) => {
+      cursorRequest.onsuccess = () => {
+        const cursor = cursorRequest.result;
+        if (!cursor || totalBytes <= maxBytes) {
+          resolve();
+          return;
+        }
+        const row = cursor.value;
+        setSize(row.id, 0);
+        cursor.delete();
+        cursor.continue();
+      };
+      cursorRequest.onerror = () => reject(cursorRequest.error);
+    });
+    await transactionDone(transaction);
+  };
+
+  const flush = async () => {
+    clearTimeout(timer);
+    timer = null;
+    if (pending.size === 0) return;
+    const changes = [...pending];
+    pending.clear();
+
+    const db = await getDb();
+    const transaction = db.transaction([RECORDS, META], "readwrite");
+    const records = transaction.objectStore(RECORDS);
+    const storedAt = Date.now();
+    for (const [id, record] of changes) {
+      if (record) {
+        const size = estimateSize(record);
+        records.put({ id, storedAt, size, record });
+        setSize(id, size);
+      } else {
+        records.delete(id);
+        setSize(id, 0);
+      }
+    }
+    const meta = transaction.objectStore(META);
+    for (const [name, value] of Object.entries(getMeta())) {
+      if (value !== undefined) meta.put(value, name);
+    }
+    await transactionDone(transaction);
+    await evict(db);
+  };
+
+  // Isi store dari IndexedDB. Record yang sudah ada di store (dari server)
+  // tidak ditimpa data lama.
+  const hydrate = async () => {
+    const db = await getDb();
+    const transaction = db.transaction([RECORDS, META], "readonly");
+    const [rows, metaKeys, metaValues] = await Promise.all([
+      promisify(transaction.objectStore(RECORDS).getAll()),
+      promisify(transaction.objectStore(META).getAllKeys()),
+      promisify(transaction.objectStore(META).getAll()),
+    ]);
+    for (const row of rows) setSize(row.id, row.size ?? estimateSize(row.record));
+    hydrating = true;
+    try {
+      store.upsertMany(rows.map((row) => row.record), { overwrite: false });
+    } finally {
+      hydrating = false;
+    }
+    const meta = Object.fromEntries(metaKeys.map((name, i) => [name, metaValues[i]]));
+    return { count: rows.length, meta };
+  };
+
+  const clear = async () => {
+    pending.clear();
+    const db = await getDb();
+    const transaction = db.transaction([RECORDS, META], "readwrite");
+    transaction.objectStore(RECORDS).clear();
+    transaction.objectStore(META).clear();
+    await transactionDone(transaction);
+    sizes.clear();
+    totalBytes = 0;
+  };
+
+  // Tulis perubahan yang tertunda sebelum tab ditutup / disembunyikan
+  const onHidden = () => {
+    if (document.visibilityState === "hidden") flush().catch(() => {});
+  };
+  if (typeof document !== "undefined") document.addEventListener("visibilitychange", onHidden);
+
+  return {
+    hydrate,
+    flush,
+    clear,
+    dispose: () => {
+      unsubscribe();
+      clearTimeout(timer);
+      if (typeof document !== "undefined") document.removeEventListener("visibilitychange", onHidden);
+    },
+  };
+};
@@ -0,0 +1,70 @@
+// Rollup profiling (keletihan & suasana hati per hari) yang dihitung di luar
+// browser oleh src/ai_worker.py. File JSON-nya berisi series berbentuk kolom
+// per user (guid_device) dan per hari untuk semua karyawan; modul ini hanya
+// memuat file tsb dan mengubahnya ke bentuk data grafik profiling.
+
+export const PROFILING_ROLLUP_VERSION = 1;
+
+// Bisa diarahkan ke lokasi lain lewat VITE_PROFILING_URL
+export const PROFILING_URL = import.meta.env?.VITE_PROFILING_URL || "/rollups/profiling.json";
+
+const DEVICE_FIELDS = ["guid_device", "guidDevice", "deviceId", "device_id"];
+
+// null jika rollup belum pernah dibuat (404, atau fallback SPA yang membalas
+// 200 dengan index.html), error untuk kegagalan lain
+export const loadProfilingRollup = async (url = PROFILING_URL, { signal, fetchImpl = fetch } = {}) => {
+  const response = await fetchImpl(url, { signal });
+  if (response.status === 404) return null;
+  if (!response.ok) throw new Error(`Rollup profiling gagal dimuat (${response.status})`);
+  const contentType = response.headers?.get?.("content-type") || "";
+  if (contentType && !contentType.includes("json")) return null;
+  let rollup;
+  try {
+    rollup = await response.json();
+  } catch {
+    return null;
+  }
+  if (rollup?.version !== PROFILING_ROLLUP_VERSION) {
+    throw new Error(`Versi rollup profiling ${rollup?.version} tidak didukung`);
+  }
+  return rollup;
+};
+
+// Series milik user (dicocokkan lewat guid_device, lalu nama); tanpa user -> semua karyawan
+export const findProfilingSeries = (rollup, user = null) => {
+  if (!rollup) return null;
+  if (!user) return rollup.daily;
+  for (const field of DEVICE_FIELDS) {
+    const series = user[field] && rollup.users[user[field]];
+    if (series) return series;
+  }
+  const name = (user.name || "").toLowerCase();
+  if (!name) return null;
+  return Object.values(rollup.users).find((series) => (series.nama || "").toLowerCase() === name) || null;
+};
+
+const percent = (count, total) => (total > 0 ? Math.round((count / total) * 1000) / 10 : 0);
+
+// "YYYY-MM-DD" -> "DD-MM-YYYY" (format tanggal grafik profiling)
+const displayDate = (date) => `${date.slice(8, 10)}-${date.slice(5, 7)}-${date.slice(0, 4)}`;
+
+// Data grafik profiling: [{ date, keletihan, bahagia, sedih, marah, netral }] untuk
+// `days` hari terakhir yang ada datanya; mood dalam persen dari record hari itu
+export const profilingChartSeries = (rollup, user = null, { days = 30 } = {}) => {
+  const series = findProfilingSeries(rollup, user);
+  if (!series) return [];
+  const from = Math.max(0, series.day.length - days);
+  const rows = [];
+  for (let i = from; i < series.day.length; i++) {
+    const total = series.total[i];
+    rows.push({
+      date: displayDate(rollup.days[series.day[i]]),
+      keletihan: series.keletihan.mean[i] ?? 0,
+      bahagia: percent(series.mood.bahagia[i], total),
+      sedih: percent(series.mood.sedih[i], total),
+      marah: percent(series.mood.marah[i], total),
+      netral: percent(series.mood.netral[i], total),
+    });
+  }
+  return rows;
+};
@@ -0,0 +1,52 @@
+// Retensi record di store bersama (lihat record_store.js).
+//
+// Setiap tampilan (halaman kamera yang dibuka, halaman / bulan tab AI, record
+// live feed terbaru) memegang id record yang sedang ia tampilkan lewat
+// `hold(owner, records)`. Record yang tidak lagi dipegang tampilan mana pun
+// dibuang dari store, kecuali `isPinned(id)` (mis. record milik sync AI
+// dashboard). Ukuran store jadi mengikuti data yang terlihat, bukan semua
+// halaman yang pernah dibuka.
+
+import { recordId } from "./record_store.js";
+
+export const createRecordRetention = ({ store, key = "id", isPinned = () => false }) => {
+  // owner -> Set id yang dipegang
+  const owners = new Map();
+  // id -> jumlah owner yang memegang
+  const counts = new Map();
+
+  const release = (id) => {
+    const count = counts.get(id) - 1;
+    if (count > 0) {
+      counts.set(id, count);
+      return;
+    }
+    counts.delete(id);
+    if (!isPinned(id)) store.remove(id);
+  };
+
+  // Ganti isi yang dipegang `owner` dengan `records` (sekaligus di-upsert ke store)
+  const hold = (owner, records = []) => {
+    const previous = owners.get(owner) || new Set();
+    const next = new Set();
+    for (const record of records) {
+      const id = recordId(record, key);
+      if (id === undefined || id === null || next.has(id)) continue;
+      next.add(id);
+      if (!previous.has(id)) counts.set(id, (counts.get(id) || 0) + 1);
+    }
+    store.upsertMany(records);
+    for (const id of previous) {
+      if (!next.has(id)) release(id);
+    }
+    if (next.size > 0) owners.set(owner, next);
+    else owners.delete(owner);
+  };
+
+  return {
+    hold,
+    release: (owner) => hold(owner, []),
+    isHeld: (id) => counts.has(id),
+    size: () => counts.size,
+  };
+};
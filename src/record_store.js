@@ -0,0 +1,147 @@
+// Store record history (kamera + AI) yang dinormalisasi dengan index Map.
+//
+// - byId      : id -> record (merge / dedup O(1))
+// - guid_device, nama (lowercase), tanggal (YYYY-MM-DD), bulan (YYYY-MM)
+//               -> Set id, untuk lookup tanpa scan seluruh array
+//
+// Listener (`subscribe`) menerima setiap perubahan per record:
+// { type: "upsert", record, previous } atau { type: "remove", record }.
+
+// Normalisasi `datetime` ke "YYYY-MM-DD". Mendukung "YYYY-MM-DD..." dan
+// "DD-MM-YYYY..." (keduanya dipakai di data lama).
+export const toDateKey = (datetime) => {
+  if (!datetime || typeof datetime !== "string") return null;
+  if (/^\d{4}-\d{2}-\d{2}/.test(datetime)) return datetime.slice(0, 10);
+  const match = /^(\d{2})-(\d{2})-(\d{4})/.exec(datetime);
+  return match ? `${match[3]}-${match[2]}-${match[1]}` : null;
+};
+
+export const recordId = (record, key = "id") => record?.[key] ?? record?._id;
+
+const addToIndex = (index, value, id) => {
+  if (value === undefined || value === null || value === "") return;
+  let ids = index.get(value);
+  if (!ids) {
+    ids = new Set();
+    index.set(value, ids);
+  }
+  ids.add(id);
+};
+
+const removeFromIndex = (index, value, id) => {
+  const ids = index.get(value);
+  if (!ids) return;
+  ids.delete(id);
+  if (ids.size === 0) index.delete(value);
+};
+
+export const createRecordStore = ({ key = "id" } = {}) => {
+  const byId = new Map();
+  const indexes = {
+    device: new Map(),
+    name: new Map(),
+    date: new Map(),
+    month: new Map(),
+  };
+  const listeners = new Set();
+  let version = 0;
+  let cachedValues = [];
+  let cachedVersion = 0;
+
+  const indexValues = (record) => {
+    const date = toDateKey(record.datetime);
+    return {
+      device: record.guid_device,
+      name: record.nama ? record.nama.toLowerCase() : null,
+      date,
+      month: date ? date.slice(0, 7) : null,
+    };
+  };
+
+  const index = (record, id) => {
+    const values = indexValues(record);
+    for (const name in indexes) addToIndex(indexes[name], values[name], id);
+  };
+
+  const unindex = (record, id) => {
+    const values = indexValues(record);
+    for (const name in indexes) removeFromIndex(indexes[name], values[name], id);
+  };
+
+  const emit = (change) => {
+    version++;
+    for (const listener of listeners) listener(change);
+  };
+
+  // Tambah atau gabungkan record. Dengan `overwrite: false`, record yang
+  // sudah ada dibiarkan (dipakai agar data kamera menang atas duplikat AI).
+  const upsert = (record, { overwrite = true } = {}) => {
+    const id = recordId(record, key);
+    if (id === undefined || id === null) return null;
+    const previous = byId.get(id);
+    if (previous && !overwrite) return null;
+    const next = previous ? { ...previous, ...record } : record;
+    if (previous) unindex(previous, id);
+    byId.set(id, next);
+    index(next, id);
+    emit({ type: "upsert", record: next, previous });
+    return previous ? "updated" : "added";
+  };
+
+  const remove = (id) => {
+    const record = byId.get(id);
+    if (!record) return false;
+    unindex(record, id);
+    byId.delete(id);
+    emit({ type: "remove", record });
+    return true;
+  };
+
+  const lookup = (indexName, value) => {
+    const ids = indexes[indexName].get(value);
+    if (!ids) return [];
+    const result = new Array(ids.size);
+    let i = 0;
+    for (const id of ids) result[i++] = byId.get(id);
+    return result;
+  };
+
+  return {
+    upsert,
+    upsertMany: (records, options) => {
+      const changes = { added: 0, updated: 0 };
+      for (const record of records) {
+        const result = upsert(record, options);
+        if (result) changes[result]++;
+      }
+      return changes;
+    },
+    remove,
+    get: (id) => byId.get(id),
+    has: (id) => byId.has(id),
+    size: () => byId.size,
+    // Array semua record; dibuat ulang hanya jika ada perubahan sejak panggilan terakhir
+    values: () => {
+      if (cachedVersion !== version) {
+        cachedValues = [...byId.values()];
+        cachedVersion = version;
+      }
+      return cachedValues;
+    },
+    byDevice: (guid) => lookup("device", guid),
+    byName: (nama) => lookup("name", (nama || "").toLowerCase()),
+    byDate: (dateKey) => lookup("date", dateKey),
+    byMonth: (monthKey) => lookup("month", monthKey),
+    devices: () => [...indexes.device.keys()],
+    deviceCount: () => indexes.device.size,
+    dates: () => [...indexes.date.keys()].sort(),
+    clear: () => {
+      for (const record of [...byId.values()]) remove(recordId(record, key));
+    },
+    subscribe: (listener) => {
+      listeners.add(listener);
+      return () => listeners.delete(listener);
+    },
+    getVersion: () => version,
+  };
+};
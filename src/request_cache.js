@@ -0,0 +1,201 @@
+// Cache request GET bersama untuk semua instance axios (api.js, ai.js,
+// user_api.js).
+//
+// - key   : baseURL + url + params (urutan key params tidak berpengaruh)
+// - fresh : umur < ttl -> langsung dari cache, tanpa network
+// - stale : umur < ttl + staleTtl -> data lama dikembalikan langsung, lalu
+//           divalidasi ulang di latar belakang (stale-while-revalidate)
+// - request identik yang sedang berjalan digabung menjadi satu (in-flight dedup);
+//   pemanggil yang bergabung dengan `priority` lebih tinggi / `supersede`
+//   menaikkan request bersama di scheduler (mis. klik pada halaman yang sedang
+//   di-prefetch). Request bersama yang disupersede menolak semua pemanggilnya
+//   dengan AbortError.
+// - eviction LRU berdasarkan jumlah entry dan perkiraan ukuran (byte)
+
+import { requestScheduler, isAbortError } from "./request_scheduler.js";
+
+const stableStringify = (value) => {
+  if (value === null || typeof value !== "object") return JSON.stringify(value);
+  if (Array.isArray(value)) return `[${value.map(stableStringify).join(",")}]`;
+  const keys = Object.keys(value).filter((key) => value[key] !== undefined).sort();
+  return `{${keys.map((key) => `${JSON.stringify(key)}:${stableStringify(value[key])}`).join(",")}}`;
+};
+
+const SIZE_SAMPLE = 3;
+
+const stringLength = (value) => {
+  try {
+    return JSON.stringify(value ?? null).length;
+  } catch {
+    return 0;
+  }
+};
+
+// Perkiraan ukuran response: header content-length, atau untuk list record
+// (array / { data: [...] }) rata-rata beberapa record x jumlah record, agar
+// response besar tidak di-stringify seluruhnya
+const estimateSize = (response) => {
+  const header = Number(response?.headers?.["content-length"]);
+  if (header > 0) return header;
+  const body = response?.data;
+  const items = Array.isArray(body) ? body : body?.data;
+  if (!Array.isArray(items) || items.length <= SIZE_SAMPLE) return stringLength(body);
+  let sampled = 0;
+  for (let i = 0; i < SIZE_SAMPLE; i++) sampled += stringLength(items[i]);
+  return Math.round((sampled / SIZE_SAMPLE) * items.length);
+};
+
+// Tolak promise milik pemanggil saat signal-nya abort, tanpa membatalkan
+// request bersama yang mungkin dipakai pemanggil lain.
+const withSignal = (promise, signal) => {
+  if (!signal) return promise;
+  if (signal.aborted) return Promise.reject(signal.reason ?? new DOMException("Aborted", "AbortError"));
+  return new Promise((resolve, reject) => {
+    const onAbort = () => reject(signal.reason ?? new DOMException("Aborted", "AbortError"));
+    signal.addEventListener("abort", onAbort, { once: true });
+    promise.then(resolve, reject).finally(() => signal.removeEventListener("abort", onAbort));
+  });
+};
+
+export const createRequestCache = ({
+  ttl = 30 * 1000,
+  staleTtl = 5 * 60 * 1000,
+  maxEntries = 200,
+  maxBytes = 20 * 1024 * 1024,
+  scheduler = null,
+} = {}) => {
+  const entries = new Map();
+  // key -> { promise, ticket, meta, stale, matchers }. Invalidasi yang cocok
+  // dengan request yang masih berjalan menandainya `stale` (atau menyimpan
+  // `match` untuk dicek pada response) agar hasilnya tidak disimpan; request
+  // lain tidak terpengaruh.
+  const inflight = new Map();
+  let totalBytes = 0;
+
+  const remove = (key) => {
+    const entry = entries.get(key);
+    if (!entry) return;
+    totalBytes -= entry.size;
+    entries.delete(key);
+  };
+
+  const store = (key, meta, response) => {
+    remove(key);
+    const size = estimateSize(response);
+    entries.set(key, { ...meta, response, size, storedAt: Date.now() });
+    totalBytes += size;
+    // Map menyimpan urutan insert: entry paling awal = paling lama tidak dipakai
+    for (const oldest of entries.keys()) {
+      if (entries.size <= maxEntries && totalBytes <= maxBytes) break;
+      if (oldest === key) continue;
+      remove(oldest);
+    }
+  };
+
+  const touch = (key, entry) => {
+    entries.delete(key);
+    entries.set(key, entry);
+  };
+
+  const fetchShared = (key, meta, fetcher, { priority, supersede } = {}) => {
+    const running = inflight.get(key);
+    if (running) {
+      scheduler?.promote(running.ticket, { priority, key: supersede });
+      return running.promise;
+    }
+    // Pegangan request di scheduler (lihat requestScheduler.promote); primitif
+    // agar tidak disalin saat axios menggabungkan config
+    const shared = { ticket: Symbol(key), meta, stale: false, matchers: [] };
+    shared.promise = fetcher(shared.ticket)
+      .then((response) => {
+        // Simpan hanya jika belum diinvalidasi / digantikan refresh manual
+        if (
+          inflight.get(key) === shared &&
+          !shared.stale &&
+          !shared.matchers.some((match) => match(response?.data))
+        ) {
+          store(key, meta, response);
+        }
+        return response;
+      })
+      .finally(() => {
+        if (inflight.get(key) === shared) inflight.delete(key);
+      });
+    inflight.set(key, shared);
+    return shared.promise;
+  };
+
+  // Bungkus `api.get` milik sebuah instance axios
+  const wrap = (api) => async (url, config = {}) => {
+    const { cache: cacheOptions = {}, signal, ...axiosConfig } = config;
+    const { force = false, onUpdate } = cacheOptions;
+    const entryTtl = cacheOptions.ttl ?? ttl;
+    const baseURL = axiosConfig.baseURL ?? api.defaults.baseURL ?? "";
+    const key = `${baseURL}|${url}|${stableStringify(axiosConfig.params || {})}`;
+    const meta = { baseURL, url, params: axiosConfig.params || {} };
+    const fetcher = (ticket) => api.get(url, { ...axiosConfig, ticket });
+    const { priority, supersede } = axiosConfig;
+
+    const entry = entries.get(key);
+    if (entry && !force) {
+      const age = Date.now() - entry.storedAt;
+      if (age < entryTtl) {
+        touch(key, entry);
+        return entry.response;
+      }
+      if (age < entryTtl + staleTtl) {
+        touch(key, entry);
+        fetchShared(key, meta, fetcher)
+          .then((response) => onUpdate?.(response))
+          .catch((error) => {
+            if (!isAbortError(error)) console.error("Gagal revalidasi cache:", error);
+          });
+        return entry.response;
+      }
+    }
+
+    if (force) {
+      // Refresh manual: jangan ikut request lama yang mungkin sudah basi
+      inflight.delete(key);
+      remove(key);
+    }
+    return withSignal(fetchShared(key, meta, fetcher, { priority, supersede }), signal);
+  };
+
+  // Hapus entry yang cocok. `url` dicocokkan sebagai prefix path, `match`
+  // (opsional) menerima data response untuk invalidasi yang lebih presisi.
+  const invalidate = ({ url, baseURL, match } = {}) => {
+    const matchesMeta = (meta) =>
+      (baseURL === undefined || meta.baseURL === baseURL) && (url === undefined || meta.url.startsWith(url));
+    for (const [key, entry] of [...entries]) {
+      if (!matchesMeta(entry)) continue;
+      if (match && !match(entry.response?.data)) continue;
+      remove(key);
+    }
+    for (const shared of inflight.values()) {
+      if (!matchesMeta(shared.meta)) continue;
+      if (match) shared.matchers.push(match);
+      else shared.stale = true;
+    }
+  };
+
+  return {
+    wrap,
+    invalidate,
+    clear: () => {
+      for (const shared of inflight.values()) shared.stale = true;
+      entries.clear();
+      totalBytes = 0;
+    },
+    stats: () => ({ entries: entries.size, bytes: totalBytes, inflight: inflight.size }),
+  };
+};
+
+// Cache bersama yang dipakai oleh semua modul API
+export const requestCache = createRequestCache({ scheduler: requestScheduler });
+
+// Cek apakah data response (bentuk { data: [...] } atau array) memuat record dengan id tertentu
+export const containsRecord = (id) => (body) => {
+  const items = Array.isArray(body) ? body : body?.data;
+  return Array.isArray(items) && items.some((item) => item?.id === id || item?._id === id);
+};
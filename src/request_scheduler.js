@@ -0,0 +1,272 @@
+// Penjadwal request bersama untuk semua instance axios (api.js, ai.js,
+// user_api.js) dan foto kartu.
+//
+// - kelas prioritas: interactive (data yang sedang dilihat) > prefetch
+//   (halaman berikutnya) > thumbnail (foto kartu). Slot kosong selalu diisi
+//   kelas tertinggi yang antri lebih dulu.
+// - batas request bersamaan per host dan total; kelas selain interactive tidak
+//   boleh memakai `reserve` slot terakhir, jadi klik user tidak menunggu
+//   puluhan foto selesai diunduh.
+// - `key` (supersede): request baru dengan key yang sama membatalkan request
+//   lama (AbortController), baik yang masih antri maupun yang sedang berjalan.
+// - `ticket` (opsional): pegangan untuk `promote`, mis. request bersama di
+//   request_cache.js yang kemudian dibutuhkan oleh klik user.
+// - metrik antrian per kelas & host untuk PerfPanel.
+
+export const PRIORITY = {
+  interactive: "interactive",
+  prefetch: "prefetch",
+  thumbnail: "thumbnail",
+};
+
+// Urutan kelas dari prioritas tertinggi
+const CLASSES = [PRIORITY.interactive, PRIORITY.prefetch, PRIORITY.thumbnail];
+
+const now = () => (globalThis.performance?.now ? performance.now() : Date.now());
+
+const abortError = (message) => new DOMException(message, "AbortError");
+
+// Error pembatalan dari scheduler (AbortError) maupun dari axios (CanceledError)
+export const isAbortError = (error) =>
+  error?.name === "AbortError" || error?.name === "CanceledError" || error?.code === "ERR_CANCELED";
+
+// Host dari URL (relatif terhadap `base`); "" jika tidak bisa di-parse
+export const hostOf = (url = "", base) => {
+  try {
+    return new URL(url, base || globalThis.location?.href).host;
+  } catch {
+    return "";
+  }
+};
+
+export const createRequestScheduler = ({ perHost = 4, maxActive = 8, reserve = 1 } = {}) => {
+  // host -> { active, queues: { [kelas]: job[] } }
+  const hosts = new Map();
+  // key supersede -> job terakhir dengan key tersebut
+  const keyed = new Map();
+  // ticket -> job (lihat promote)
+  const tickets = new Map();
+  const stats = Object.fromEntries(
+    CLASSES.map((name) => [name, { active: 0, started: 0, canceled: 0, superseded: 0, waitTotal: 0, waitMax: 0 }])
+  );
+  let active = 0;
+
+  const getHost = (host) => {
+    let entry = hosts.get(host);
+    if (!entry) {
+      entry = { active: 0, queues: Object.fromEntries(CLASSES.map((name) => [name, []])) };
+      hosts.set(host, entry);
+    }
+    return entry;
+  };
+
+  // Kelas non-interactive berhenti `reserve` slot sebelum batas
+  const limitFor = (priority, limit) =>
+    priority === PRIORITY.interactive ? limit : Math.max(1, limit - reserve);
+
+  const start = (job) => {
+    const entry = getHost(job.host);
+    entry.active++;
+    active++;
+    job.state = "active";
+    const wait = now() - job.queuedAt;
+    const stat = stats[job.priority];
+    stat.active++;
+    stat.started++;
+    stat.waitTotal += wait;
+    if (wait > stat.waitMax) stat.waitMax = wait;
+    job.resolve({ signal: job.controller.signal, release: job.release });
+  };
+
+  const pump = () => {
+    for (const priority of CLASSES) {
+      for (const entry of hosts.values()) {
+        const queue = entry.queues[priority];
+        while (
+          queue.length > 0 &&
+          entry.active < limitFor(priority, perHost) &&
+          active < limitFor(priority, maxActive)
+        ) {
+          start(queue.shift());
+        }
+      }
+    }
+  };
+
+  const finish = (job) => {
+    if (job.state === "done") return;
+    const wasActive = job.state === "active";
+    job.state = "done";
+    job.cleanup();
+    if (keyed.get(job.key) === job) keyed.delete(job.key);
+    if (tickets.get(job.ticket) === job) tickets.delete(job.ticket);
+    if (wasActive) {
+      getHost(job.host).active--;
+      stats[job.priority].active--;
+      active--;
+      pump();
+    } else {
+      const queue = getHost(job.host).queues[job.priority];
+      queue.splice(queue.indexOf(job), 1);
+    }
+  };
+
+  const cancelJob = (job, reason, counter = "canceled") => {
+    if (job.state === "done") return;
+    stats[job.priority][counter]++;
+    const queued = job.state === "queued";
+    job.controller.abort(reason);
+    finish(job);
+    if (queued) job.reject(reason);
+  };
+
+  // Tunggu slot. Hasilnya `{ signal, release }`: `signal` dipakai untuk request
+  // (abort saat disupersede / `signal` pemanggil abort), `release` wajib
+  // dipanggil setelah request selesai.
+  const acquire = ({ priority = PRIORITY.interactive, host = "", key, signal, ticket } = {}) => {
+    if (!CLASSES.includes(priority)) priority = PRIORITY.interactive;
+    if (signal?.aborted) return Promise.reject(signal.reason ?? abortError("Aborted"));
+
+    return new Promise((resolve, reject) => {
+      const controller = new AbortController();
+      const onAbort = () => cancelJob(job, signal.reason ?? abortError("Aborted"));
+      const job = {
+        priority,
+        host,
+        key,
+        ticket,
+        controller,
+        resolve,
+        reject,
+        state: "queued",
+        queuedAt: now(),
+        cleanup: () => signal?.removeEventListener("abort", onAbort),
+      };
+      job.release = () => finish(job);
+      signal?.addEventListener("abort", onAbort, { once: true });
+
+      if (ticket !== undefined) tickets.set(ticket, job);
+      if (key !== undefined && key !== null) {
+        const previous = keyed.get(key);
+        if (previous) cancelJob(previous, abortError(`Superseded: ${key}`), "superseded");
+        keyed.set(key, job);
+      }
+      getHost(host).queues[priority].push(job);
+      pump();
+    });
+  };
+
+  // Jalankan `task({ signal })` di dalam slot; slot dilepas saat task selesai
+  const schedule = async (task, options) => {
+    const { signal, release } = await acquire(options);
+    try {
+      // Bisa sudah disupersede sebelum task sempat berjalan
+      if (signal.aborted) throw signal.reason;
+      return await task({ signal });
+    } finally {
+      release();
+    }
+  };
+
+  // Naikkan prioritas request yang masih antri / berjalan (prioritas tidak
+  // pernah diturunkan) dan/atau pasang key supersede baru, yang membatalkan
+  // request lama dengan key tersebut. false jika request sudah selesai.
+  const promote = (ticket, { priority, key } = {}) => {
+    const job = tickets.get(ticket);
+    if (!job) return false;
+    if (key !== undefined && key !== null && job.key !== key) {
+      const previous = keyed.get(key);
+      if (previous) cancelJob(previous, abortError(`Superseded: ${key}`), "superseded");
+      if (keyed.get(job.key) === job) keyed.delete(job.key);
+      job.key = key;
+      keyed.set(key, job);
+    }
+    if (CLASSES.includes(priority) && CLASSES.indexOf(priority) < CLASSES.indexOf(job.priority)) {
+      if (job.state === "queued") {
+        const queues = getHost(job.host).queues;
+        queues[job.priority].splice(queues[job.priority].indexOf(job), 1);
+        queues[priority].push(job);
+      } else {
+        stats[job.priority].active--;
+        stats[priority].active++;
+      }
+      job.priority = priority;
+      pump();
+    }
+    return true;
+  };
+
+  // Batalkan request dengan key tertentu (mis. saat tab ditutup)
+  const cancel = (key, reason = abortError(`Canceled: ${key}`)) => {
+    const job = keyed.get(key);
+    if (job) cancelJob(job, reason);
+  };
+
+  const metrics = () => {
+    const classes = Object.fromEntries(
+      CLASSES.map((name) => [name, { ...stats[name], queued: 0 }])
+    );
+    const perHostMetrics = {};
+    let queued = 0;
+    for (const [host, entry] of hosts) {
+      let hostQueued = 0;
+      for (const name of CLASSES) {
+        const length = entry.queues[name].length;
+        classes[name].queued += length;
+        hostQueued += length;
+      }
+      queued += hostQueued;
+      if (entry.active > 0 || hostQueued > 0) {
+        perHostMetrics[host || "(lokal)"] = { active: entry.active, queued: hostQueued };
+      }
+    }
+    return {
+      active,
+      queued,
+      limits: { perHost, maxActive, reserve },
+      classes: Object.fromEntries(
+        Object.entries(classes).map(([name, { waitTotal, ...rest }]) => [
+          name,
+          { ...rest, waitAvg: rest.started ? waitTotal / rest.started : 0 },
+        ])
+      ),
+      hosts: perHostMetrics,
+    };
+  };
+
+  return { acquire, schedule, promote, cancel, metrics };
+};
+
+// Scheduler bersama untuk seluruh aplikasi
+export const requestScheduler = createRequestScheduler();
+
+// Pasang scheduler ke instance axios. Config request boleh berisi
+// `priority` (lihat PRIORITY, default interactive), `supersede` (key) dan
+// `ticket` (pegangan untuk promote).
+// Dipasang setelah instrumentAxios agar latency di PerfPanel tidak termasuk
+// waktu antri.
+export const scheduleAxios = (instance, scheduler = requestScheduler) => {
+  instance.interceptors.request.use(async (config) => {
+    const { signal, release } = await scheduler.acquire({
+      priority: config.priority,
+      host: hostOf(config.url, config.baseURL),
+      key: config.supersede,
+      signal: config.signal,
+      ticket: config.ticket,
+    });
+    config.signal = signal;
+    config.releaseSlot = release;
+    return config;
+  });
+  instance.interceptors.response.use(
+    (response) => {
+      response.config?.releaseSlot?.();
+      return response;
+    },
+    (error) => {
+      error?.config?.releaseSlot?.();
+      return Promise.reject(error);
+    }
+  );
+  return instance;
+};
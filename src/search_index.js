@@ -0,0 +1,305 @@
+// Index pencarian untuk record history (nama, guid_device, tanggal, bulan).
+//
+// Setiap record dipecah sekali menjadi token ternormalisasi (lowercase, tanpa
+// aksen). Record diberi nomor slot (urutan masuk); token disimpan di `postings`
+// (token -> Map slot -> bobot) dan di kosakata terurut, sehingga pencarian
+// prefix cukup binary search + iterasi posting ke typed array skor, tanpa scan
+// seluruh data per ketikan.
+//
+// - Beberapa kata di query digabung AND ("budi 2024-05" = Budi di Mei 2024).
+// - Kata yang bukan prefix token tetap cocok jika muncul di tengah nama /
+//   guid_device (semantik `includes` seperti filter lama). Nama dan device
+//   sangat berulang, jadi cukup scan teks unik, bukan seluruh record.
+// - Skor: token sama persis > prefix > substring, dikali bobot field
+//   (nama > device > tanggal).
+// - Dengan `store`, index mengikuti upsert/remove di record store (inkremental).
+
+import { toDateKey, recordId } from "./record_store.js";
+
+const FIELD_WEIGHTS = { name: 3, device: 2, date: 1, month: 1 };
+
+export const normalizeText = (value) => {
+  const text = String(value ?? "");
+  // Jalur cepat untuk teks ASCII (mayoritas nama & guid)
+  const plain = /^[\x00-\x7f]*$/.test(text) ? text : text.normalize("NFD").replace(/[\u0300-\u036f]/g, "");
+  return plain.toLowerCase().trim();
+};
+
+const splitWords = (text) => text.split(/[^\p{L}\p{N}-]+/u).filter(Boolean);
+
+// Nama dan guid_device berulang di banyak record; hasil normalisasinya di-cache
+const MAX_TEXT_CACHE = 10000;
+const textCache = new Map();
+const normalizedWords = (value) => {
+  let words = textCache.get(value);
+  if (!words) {
+    const text = normalizeText(value);
+    words = text ? [text, ...splitWords(text).filter((word) => word !== text)] : [];
+    if (textCache.size >= MAX_TEXT_CACHE) textCache.clear();
+    textCache.set(value, words);
+  }
+  return words;
+};
+
+// Token per field untuk satu record: [[token, bobot], ...]
+const recordTokens = (record) => {
+  const tokens = new Map();
+  const add = (token, weight) => {
+    if (!token) return;
+    if ((tokens.get(token) || 0) < weight) tokens.set(token, weight);
+  };
+  if (record.nama) {
+    for (const word of normalizedWords(record.nama)) add(word, FIELD_WEIGHTS.name);
+  }
+  if (record.guid_device !== undefined && record.guid_device !== null) {
+    // GUID utuh + potongan dengan pemisah yang sama seperti query
+    for (const word of normalizedWords(record.guid_device)) add(word, FIELD_WEIGHTS.device);
+  }
+  const date = toDateKey(record.datetime);
+  if (date) {
+    add(date, FIELD_WEIGHTS.date);
+    add(date.slice(0, 7), FIELD_WEIGHTS.month);
+  }
+  return tokens;
+};
+
+// Token record di-cache per objek (record di store immutable: upsert membuat objek baru)
+const tokenCache = new WeakMap();
+const cachedTokens = (record) => {
+  let tokens = tokenCache.get(record);
+  if (!tokens) {
+    tokens = recordTokens(record);
+    tokenCache.set(record, tokens);
+  }
+  return tokens;
+};
+
+// Teks utuh ternormalisasi nama & guid_device untuk pencocokan substring:
+// [[teks, bobot], ...]
+const recordTexts = (record) => {
+  const texts = [];
+  if (record.nama) {
+    const [text] = normalizedWords(record.nama);
+    if (text) texts.push([text, FIELD_WEIGHTS.name]);
+  }
+  if (record.guid_device !== undefined && record.guid_device !== null) {
+    const [text] = normalizedWords(record.guid_device);
+    if (text) texts.push([text, FIELD_WEIGHTS.device]);
+  }
+  return texts;
+};
+
+const queryWords = (term) => splitWords(normalizeText(term));
+
+// Predicate untuk list kecil (mis. satu halaman) dengan aturan yang sama
+// seperti index: setiap kata query harus menjadi prefix salah satu token
+// atau muncul di dalam nama / guid_device.
+export const compileQuery = (term) => {
+  const words = queryWords(term);
+  if (words.length === 0) return () => true;
+  return (record) => {
+    const tokens = cachedTokens(record);
+    const texts = recordTexts(record);
+    return words.every((word) => {
+      for (const token of tokens.keys()) {
+        if (token.startsWith(word)) return true;
+      }
+      return texts.some(([text]) => text.includes(word));
+    });
+  };
+};
+
+export const createSearchIndex = ({ store = null, key = "id" } = {}) => {
+  const postings = new Map();
+  // Teks nama / guid unik -> { words, slots: Map slot -> bobot } (fallback substring)
+  const textPostings = new Map();
+  // id -> slot, dan slot -> { id, tokens, texts }; slot record yang dihapus
+  // dikosongkan lalu dipadatkan ulang (lihat `compact`)
+  const slotById = new Map();
+  let entries = [];
+  let freeCount = 0;
+  let vocabulary = [];
+  let vocabularyDirty = false;
+  let version = 0;
+  let lastQuery = null;
+
+  const unpost = (slot, { tokens, texts }) => {
+    for (const token of tokens.keys()) {
+      const slots = postings.get(token);
+      if (!slots) continue;
+      slots.delete(slot);
+      if (slots.size === 0) {
+        postings.delete(token);
+        vocabularyDirty = true;
+      }
+    }
+    for (const [text] of texts) {
+      const posting = textPostings.get(text);
+      if (!posting) continue;
+      posting.slots.delete(slot);
+      if (posting.slots.size === 0) textPostings.delete(text);
+    }
+  };
+
+  const post = (slot, { tokens, texts }) => {
+    for (const [token, weight] of tokens) {
+      let slots = postings.get(token);
+      if (!slots) {
+        slots = new Map();
+        postings.set(token, slots);
+        vocabularyDirty = true;
+      }
+      slots.set(slot, weight);
+    }
+    for (const [text, weight] of texts) {
+      let posting = textPostings.get(text);
+      if (!posting) {
+        posting = { words: splitWords(text), slots: new Map() };
+        textPostings.set(text, posting);
+      }
+      if ((posting.slots.get(slot) || 0) < weight) posting.slots.set(slot, weight);
+    }
+  };
+
+  // Padatkan slot setelah banyak record dihapus (urutan masuk tetap), agar
+  // `entries` dan typed array skor tidak tumbuh terus saat data berganti
+  const compact = () => {
+    const live = entries.filter(Boolean);
+    entries = live;
+    freeCount = 0;
+    postings.clear();
+    textPostings.clear();
+    slotById.clear();
+    vocabularyDirty = true;
+    live.forEach((entry, slot) => {
+      slotById.set(entry.id, slot);
+      post(slot, entry);
+    });
+  };
+
+  const add = (record) => {
+    const id = recordId(record, key);
+    if (id === undefined || id === null) return;
+    let slot = slotById.get(id);
+    if (slot === undefined) {
+      slot = entries.length;
+      entries.push(null);
+      slotById.set(id, slot);
+    } else {
+      unpost(slot, entries[slot]);
+    }
+    const entry = { id, tokens: cachedTokens(record), texts: recordTexts(record) };
+    post(slot, entry);
+    entries[slot] = entry;
+    version++;
+  };
+
+  const remove = (id) => {
+    const slot = slotById.get(id);
+    if (slot === undefined) return;
+    unpost(slot, entries[slot]);
+    entries[slot] = null;
+    slotById.delete(id);
+    freeCount++;
+    if (freeCount > 1024 && freeCount * 2 > entries.length) compact();
+    version++;
+  };
+
+  const sortedVocabulary = () => {
+    if (vocabularyDirty) {
+      vocabulary = [...postings.keys()].sort();
+      vocabularyDirty = false;
+    }
+    return vocabulary;
+  };
+
+  // Range token di kosakata yang diawali `word`: [from, to)
+  const prefixRange = (word) => {
+    const tokens = sortedVocabulary();
+    let low = 0;
+    let high = tokens.length;
+    while (low < high) {
+      const mid = (low + high) >> 1;
+      if (tokens[mid] < word) low = mid + 1;
+      else high = mid;
+    }
+    let end = low;
+    while (end < tokens.length && tokens[end].startsWith(word)) end++;
+    return [low, end];
+  };
+
+  const postingSize = ([from, to]) => {
+    let size = 0;
+    for (let i = from; i < to; i++) size += postings.get(vocabulary[i]).size;
+    return size;
+  };
+
+  // Id record yang cocok, urut skor tertinggi lalu urutan masuk.
+  // Query kosong -> null (artinya: tidak difilter).
+  const search = (term) => {
+    const words = queryWords(term);
+    if (words.length === 0) return null;
+    const cacheKey = words.join(" ");
+    if (lastQuery && lastQuery.key === cacheKey && lastQuery.version === version) {
+      return lastQuery.ids;
+    }
+
+    // Kata dengan posting paling sedikit diproses dulu; slot yang tidak cocok
+    // dengan kata sebelumnya langsung dilewati (AND)
+    const ranges = words
+      .map((word) => ({ word, range: prefixRange(word) }))
+      .map((entry) => ({ ...entry, size: postingSize(entry.range) }))
+      .sort((a, b) => a.size - b.size);
+    const hits = new Uint8Array(entries.length);
+    const scores = new Uint16Array(entries.length);
+    let candidates = [];
+    ranges.forEach(({ word, range: [from, to] }, step) => {
+      const matched = [];
+      // Kosakata terurut: token yang sama persis selalu datang pertama
+      for (let i = from; i < to; i++) {
+        const exact = vocabulary[i] === word ? 4 : 2;
+        for (const [slot, weight] of postings.get(vocabulary[i])) {
+          if (hits[slot] !== step) continue;
+          hits[slot] = step + 1;
+          scores[slot] += exact * weight;
+          matched.push(slot);
+        }
+      }
+      // Fallback substring di teks nama / guid unik (mis. potongan di tengah GUID);
+      // teks yang salah satu katanya sudah cocok sebagai prefix dilewati
+      for (const [text, { words: textWords, slots }] of textPostings) {
+        if (!text.includes(word) || textWords.some((textWord) => textWord.startsWith(word))) continue;
+        for (const [slot, weight] of slots) {
+          if (hits[slot] !== step) continue;
+          hits[slot] = step + 1;
+          scores[slot] += weight;
+          matched.push(slot);
+        }
+      }
+      candidates = matched;
+    });
+
+    candidates.sort((a, b) => scores[b] - scores[a] || a - b);
+    const ids = candidates.map((slot) => entries[slot].id);
+    lastQuery = { key: cacheKey, version, ids };
+    return ids;
+  };
+
+  let unsubscribe = () => {};
+  if (store) {
+    for (const record of store.values()) add(record);
+    unsubscribe = store.subscribe(({ type, record }) => {
+      if (type === "upsert") add(record);
+      else remove(recordId(record, key));
+    });
+  }
+
+  return {
+    add,
+    remove,
+    search,
+    size: () => slotById.size,
+    getVersion: () => version,
+    dispose: unsubscribe,
+  };
+};
@@ -0,0 +1,186 @@
+import VirtualGrid from "../components/VirtualGrid";
+import LazyImage from "../components/LazyImage";
+import Pagination from "../components/Pagination";
+import AtomInput from "../components/AtomInput";
+import { photoUrl, FALLBACK_IMAGE } from "../thumbnail";
+
+const MOOD_COLORS = {
+  senang: "bg-green-500",
+  bahagia: "bg-green-500",
+  sedih: "bg-yellow-400",
+  netral: "bg-blue-500",
+  marah: "bg-red-500",
+};
+
+// Tab Data AI: grid per halaman server atau per bulan + modal edit unit
+function AiTab({
+  searchAtom,
+  month,
+  onMonthChange,
+  onRefresh,
+  selectionBar,
+  loading,
+  empty,
+  items,
+  selectedIds,
+  onToggleSelected,
+  onOpen,
+  onDelete,
+  page,
+  totalPages,
+  onPageChange,
+  selectedPhoto,
+  editUnitAtom,
+  onClose,
+  onSave,
+}) {
+  return (
+    <>
+      {/* Filter dan Refresh Data */}
+      <div className="flex items-center justify-between mb-4 gap-2">
+        <AtomInput
+          atom={searchAtom}
+          placeholder="Cari berdasarkan nama..."
+          className="px-4 py-2 border rounded w-1/3"
+        />
+        <input
+          type="month"
+          value={month}
+          onChange={(e) => onMonthChange(e.target.value)}
+          className="px-4 py-2 border rounded w-1/3"
+        />
+        {month && (
+          <button
+            onClick={() => onMonthChange("")}
+            className="px-4 py-2 bg-gray-300 hover:bg-gray-400 rounded whitespace-nowrap"
+          >
+            Semua Bulan
+          </button>
+        )}
+        <button
+          onClick={onRefresh}
+          className="px-4 py-2 bg-blue-500 hover:bg-blue-600 text-white rounded whitespace-nowrap"
+        >
+          Refresh Data
+        </button>
+      </div>
+
+      {selectionBar}
+
+      {loading ? (
+        <div className="text-center text-gray-500 mt-10">Loading data...</div>
+      ) : empty ? (
+        <div className="text-center text-gray-500 mt-10">Data Belum Tersedia</div>
+      ) : (
+        <>
+          <VirtualGrid
+            items={items}
+            getKey={(data, index) => data.id ?? index}
+            renderItem={(data) => {
+              const moodLower = data.mood?.toLowerCase() || "";
+              return (
+                <div className="bg-white rounded-xl p-4 shadow hover:shadow-lg transition relative cursor-pointer">
+                  <LazyImage
+                    gambar={data.gambar}
+                    alt="Preview"
+                    className="w-full h-52 object-cover rounded mb-4"
+                    onClick={() => onOpen(data)}
+                  />
+                  <p><strong>Nama:</strong> {data.nama}</p>
+                  <p><strong>Tanggal:</strong> {data.datetime?.slice(0, 10)}</p>
+                  <p><strong>Masuk :</strong> {data.jam_masuk_actual}</p>
+                  <p><strong>Keluar :</strong> {data.jam_keluar_actual}</p>
+                  <p><strong>Telat :</strong> {data.jumlah_telat}</p>
+                  <p><strong>Status Kehadiran:</strong> {data.status_absen}</p>
+                  <p><strong>Keletihan:</strong> {data.keletihan}%</p>
+                  <p>
+                    <strong>Suasana Hati:</strong>{" "}
+                    <span
+                      className={`inline-block px-2 py-1 rounded text-white text-xs ${
+                        MOOD_COLORS[moodLower] || "bg-gray-400"
+                      }`}
+                    >
+                      {data.mood}
+                    </span>
+                  </p>
+
+                  {/* Tombol Edit & Delete di kanan bawah */}
+                  <div className="absolute bottom-2 right-2 flex gap-1 items-center">
+                    <input
+                      type="checkbox"
+                      checked={selectedIds.has(data.id)}
+                      onChange={() => onToggleSelected(data.id)}
+                      title="Pilih"
+                    />
+                    <button
+                      onClick={() => onOpen(data)}
+                      className="bg-blue-600 text-white text-xs px-2 py-1 rounded hover:bg-blue-700"
+                      title="Edit Detail"
+                    >
+                      Detail
+                    </button>
+                    <button
+                      onClick={() => onDelete(data.id)}
+                      className="bg-red-600 text-white text-xs px-2 py-1 rounded hover:bg-red-700"
+                      title="Delete Data"
+                    >
+                      Delete
+                    </button>
+                  </div>
+                </div>
+              );
+            }}
+          />
+
+          {/* Pagination AI */}
+          {!month && <Pagination page={page} totalPages={totalPages} onChange={onPageChange} />}
+        </>
+      )}
+
+      {/* Modal Detail untuk Edit di Tab AI*/}
+      {selectedPhoto && (
+        <div className="fixed inset-0 bg-black bg-opacity-50 flex justify-center items-center z-50">
+          <div className="bg-white p-6 rounded w-full max-w-md max-h-[90vh] overflow-y-auto">
+            <h2 className="text-xl font-bold mb-4">Detail Gambar</h2>
+            <img
+              src={photoUrl(selectedPhoto.gambar)}
+              alt="Preview"
+              className="w-full h-64 object-cover rounded mb-4"
+              onError={(e) => {
+                e.target.onerror = null;
+                e.target.src = FALLBACK_IMAGE;
+              }}
+            />
+            <p><strong>Nama:</strong> {selectedPhoto.nama}</p>
+            <p><strong>Mood:</strong> {selectedPhoto.mood}</p>
+            <p><strong>Keletihan:</strong> {selectedPhoto.keletihan}%</p>
+            <p><strong>Status:</strong> {selectedPhoto.status_absen || "-"}</p>
+            <p><strong>GUID:</strong> {selectedPhoto.guid}</p>
+            <p><strong>GUID Device:</strong> {selectedPhoto.guid_device}</p>
+            <p><strong>DateTime:</strong> {selectedPhoto.datetime}</p>
+            <p><strong>Timestamp:</strong> {selectedPhoto.timestamp}</p>
+            <p><strong>Unit:</strong></p>
+            <AtomInput atom={editUnitAtom} className="border px-2 py-1 w-full mb-4" />
+            <p><strong>Proses:</strong> {selectedPhoto.process || "-"}</p>
+            <div className="flex justify-between gap-2">
+              <button onClick={onClose} className="px-4 py-2 bg-gray-300 rounded">
+                Batal
+              </button>
+              <button onClick={onSave} className="px-4 py-2 bg-blue-600 text-white rounded">
+                Simpan
+              </button>
+              <button
+                onClick={() => onDelete(selectedPhoto.id)}
+                className="px-4 py-2 bg-red-600 text-white rounded"
+              >
+                Delete
+              </button>
+            </div>
+          </div>
+        </div>
+      )}
+    </>
+  );
+}
+
+export default AiTab;
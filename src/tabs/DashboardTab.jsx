@@ -0,0 +1,119 @@
+import VirtualTable from "../components/VirtualTable";
+import Pagination from "../components/Pagination";
+import AtomInput from "../components/AtomInput";
+import { useAtom } from "../components/useAtom";
+
+const ITEMS_PER_PAGE = 10;
+
+// Tab Dashboard: tabel seluruh history (kamera + AI) dari store, export & aksi massal
+function DashboardTab({
+  searchAtom,
+  exportProgress,
+  onExport,
+  onCancelExport,
+  renderSelectionBar,
+  scrollAll,
+  onScrollAllChange,
+  items,
+  pageAtom,
+  selectedIds,
+  onToggleSelected,
+  resolveName,
+  onOpen,
+}) {
+  // Halaman dibaca dari atom: pindah halaman hanya me-render tab ini, bukan App
+  const page = useAtom(pageAtom);
+  const totalPages = Math.max(1, Math.ceil(items.length / ITEMS_PER_PAGE));
+  const rows = scrollAll ? items : items.slice((page - 1) * ITEMS_PER_PAGE, page * ITEMS_PER_PAGE);
+
+  return (
+    <>
+      <h2 className="text-2xl font-bold mb-4">Dashboard</h2>
+      <div className="flex items-center justify-between mb-4">
+        <AtomInput
+          atom={searchAtom}
+          placeholder="Cari berdasarkan nama atau guid_device..."
+          className="px-4 py-2 border rounded w-full mr-4"
+        />
+        <div className="flex gap-2">
+          {exportProgress ? (
+            <>
+              <span className="px-2 py-2 text-sm text-gray-500 whitespace-nowrap">
+                Export {exportProgress.done}{exportProgress.total ? `/${exportProgress.total}` : ` baris (${exportProgress.pages} halaman)`}
+              </span>
+              <button onClick={onCancelExport} className="px-4 py-2 bg-gray-300 hover:bg-gray-400 rounded">Batal</button>
+            </>
+          ) : (
+            <>
+              <button onClick={() => onExport("xlsx")} className="px-4 py-2 bg-green-500 hover:bg-green-600 text-white rounded">Export Excel</button>
+              <button onClick={() => onExport("pdf")} className="px-4 py-2 bg-red-500 hover:bg-red-600 text-white rounded">Export PDF</button>
+              <button onClick={() => onExport("csv")} className="px-4 py-2 bg-gray-500 hover:bg-gray-600 text-white rounded">Export CSV</button>
+            </>
+          )}
+        </div>
+      </div>
+
+      {renderSelectionBar(rows)}
+
+      <label className="flex items-center gap-2 mb-2 text-sm text-gray-600">
+        <input
+          type="checkbox"
+          checked={scrollAll}
+          onChange={(e) => onScrollAllChange(e.target.checked)}
+        />
+        Tampilkan semua data (scroll tanpa halaman)
+      </label>
+
+      {/* Tabel Data */}
+      {rows.length === 0 ? (
+        <div className="text-center text-gray-500 mt-10">Data Belum Tersedia</div>
+      ) : (
+        <VirtualTable
+          items={rows}
+          getKey={(item, index) => item.id ?? index}
+          header={
+            <tr className="bg-gray-100 text-left">
+              <th className="p-2 border"></th>
+              <th className="p-2 border">Nama</th>
+              <th className="p-2 border">GUID Device</th>
+              <th className="p-2 border">Tanggal</th>
+              <th className="p-2 border">Unit</th>
+              <th className="p-2 border">Status</th>
+              <th className="p-2 border">Keletihan</th>
+              <th className="p-2 border">Suasana Hati</th>
+              <th className="p-2 border">Detail</th>
+            </tr>
+          }
+          renderRow={(item, index, row) => (
+            <tr key={row.key} ref={row.ref} className="border-t hover:bg-gray-50">
+              <td className="p-2 border">
+                <input
+                  type="checkbox"
+                  checked={selectedIds.has(item.id)}
+                  onChange={() => onToggleSelected(item.id)}
+                />
+              </td>
+              <td className="p-2 border">{item.nama || resolveName(item) || "-"}</td>
+              <td className="p-2 border">{item.guid_device}</td>
+              <td className="p-2 border">{item.datetime}</td>
+              <td className="p-2 border">{item.unit || "-"}</td>
+              <td className="p-2 border">{item.status_absen}</td>
+              <td className="p-2 border">{item.keletihan || "-"} %</td>
+              <td className="p-2 border">{item.mood || "-"}</td>
+              <td className="p-2 border">
+                <button onClick={() => onOpen(item)} className="text-xs text-blue-600 underline">
+                  Detail
+                </button>
+              </td>
+            </tr>
+          )}
+        />
+      )}
+
+      {/* Navigasi Dashboard */}
+      {!scrollAll && <Pagination page={page} totalPages={totalPages} onChange={pageAtom.set} />}
+    </>
+  );
+}
+
+export default DashboardTab;
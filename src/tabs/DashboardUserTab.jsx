@@ -0,0 +1,74 @@
+import AtomInput from "../components/AtomInput";
+
+// Tab Dashboard User: direktori user institusi (dari user registry)
+function DashboardUserTab({ searchAtom, onRefresh, hasUsers, users, onSelectUser }) {
+  return (
+    <>
+      <h2 className="text-2xl font-bold mb-4">Dashboard User</h2>
+      <div className="flex items-center justify-between mb-4">
+        <AtomInput
+          atom={searchAtom}
+          placeholder="Cari berdasarkan nama dan unit..."
+          className="px-4 py-2 border rounded w-full mr-4"
+        />
+        <button
+          onClick={onRefresh}
+          className="px-4 py-2 bg-blue-500 hover:bg-blue-600 text-white rounded"
+        >
+          Refresh Data
+        </button>
+      </div>
+
+      {!hasUsers ? (
+        <p className="text-gray-500">Tidak ada data user tersedia.</p>
+      ) : (
+        <div className="overflow-x-auto">
+          <table className="w-full table-auto border border-gray-300">
+            <thead>
+              <tr className="bg-gray-100 text-left">
+                <th className="p-2 border">No</th>
+                <th className="p-2 border">Foto</th>
+                <th className="p-2 border">Nama</th>
+                <th className="p-2 border">Unit</th>
+                <th className="p-2 border">Detail</th>
+              </tr>
+            </thead>
+            <tbody>
+              {users.map((user, index) => (
+                <tr key={index} className="border-t hover:bg-gray-50">
+                  <td className="p-2 border">{index + 1}</td>
+                  <td className="p-2 border">
+                    {user.photo ? (
+                      <img
+                        src={user.photo}
+                        alt={user.name}
+                        className="w-10 h-10 rounded-full object-cover"
+                        onError={(e) => {
+                          e.target.onerror = null;
+                          e.target.src = "https://via.placeholder.com/150";
+                        }}
+                      />
+                    ) : (
+                      <div className="w-10 h-10 rounded-full bg-gray-200 flex items-center justify-center">
+                        <span className="text-xs">No Photo</span>
+                      </div>
+                    )}
+                  </td>
+                  <td className="p-2 border">{user.name}</td>
+                  <td className="p-2 border">{user.unit}</td>
+                  <td className="p-2 border">
+                    <button onClick={() => onSelectUser(user)} className="text-xs text-blue-600 underline">
+                      Detail
+                    </button>
+                  </td>
+                </tr>
+              ))}
+            </tbody>
+          </table>
+        </div>
+      )}
+    </>
+  );
+}
+
+export default DashboardUserTab;
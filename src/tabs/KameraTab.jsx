@@ -0,0 +1,119 @@
+import VirtualGrid from "../components/VirtualGrid";
+import LazyImage from "../components/LazyImage";
+import Pagination from "../components/Pagination";
+import AtomInput from "../components/AtomInput";
+import { photoUrl, FALLBACK_IMAGE } from "../thumbnail";
+
+// Tab Data Kamera: grid foto satu halaman server + modal detail.
+// Tab default, jadi ikut bundle awal (tab lain dimuat saat dibuka).
+function KameraTab({
+  searchAtom,
+  onRefresh,
+  selectionBar,
+  loading,
+  items,
+  selectedIds,
+  onToggleSelected,
+  onOpen,
+  onDelete,
+  page,
+  totalPages,
+  onPageChange,
+  selectedPhoto,
+  searchGrafikAtom,
+  onClose,
+  onSave,
+}) {
+  return (
+    <>
+      <div className="flex items-center justify-between mb-4 gap-2">
+        <AtomInput
+          atom={searchAtom}
+          placeholder="Cari berdasarkan guid_device..."
+          className="px-4 py-2 border rounded w-full"
+        />
+        <button onClick={onRefresh} className="px-4 py-2 bg-blue-500 hover:bg-blue-600 text-white rounded whitespace-nowrap">
+          Refresh Data
+        </button>
+      </div>
+
+      {selectionBar}
+
+      {loading ? (
+        <div className="text-center text-gray-500">Loading data...</div>
+      ) : items.length === 0 ? (
+        <div className="text-center text-gray-500">File/Gambar Belum Tersedia</div>
+      ) : (
+        <VirtualGrid
+          items={items}
+          getKey={(history, index) => history.id ?? index}
+          renderItem={(history, index) => (
+            <div className="bg-white rounded-xl p-4 flex flex-col gap-4 hover:shadow-xl transition-all">
+              <LazyImage
+                gambar={history.gambar}
+                alt={`Image ${index}`}
+                className="w-full h-52 object-cover rounded-lg cursor-pointer"
+                onClick={() => onOpen(history)}
+              />
+              <div>
+                <h1 className="font-bold">{history.guid_device}</h1>
+                <h2 className="text-xs mb-2">{history.datetime}</h2>
+                <div className="flex gap-2 items-center">
+                  <input
+                    type="checkbox"
+                    checked={selectedIds.has(history.id)}
+                    onChange={() => onToggleSelected(history.id)}
+                    title="Pilih"
+                  />
+                  <button onClick={() => onOpen(history)} className="bg-green-500 hover:bg-green-600 text-white text-xs px-3 py-1 rounded">Detail</button>
+                  <button onClick={() => onDelete(history.id)} className="bg-red-500 hover:bg-red-600 text-white text-xs px-3 py-1 rounded">Delete</button>
+                </div>
+              </div>
+            </div>
+          )}
+        />
+      )}
+
+      {/* Navigasi Kamera */}
+      <Pagination page={page} totalPages={totalPages} onChange={onPageChange} />
+
+      {selectedPhoto && (
+        <div className="fixed inset-0 bg-black bg-opacity-50 flex justify-center items-center z-50">
+          <div className="bg-white p-6 rounded w-full max-w-md max-h-[90vh] overflow-y-auto">
+            <h2 className="text-xl font-bold mb-4">Detail Gambar</h2>
+            <img
+              src={photoUrl(selectedPhoto.gambar)}
+              alt="Preview"
+              className="w-full h-64 object-cover rounded mb-4"
+              onError={(e) => {
+                e.target.onerror = null;
+                e.target.src = FALLBACK_IMAGE;
+              }}
+            />
+            <p><strong>Nama:</strong> {selectedPhoto.nama || "-"}</p>
+            <p><strong>GUID Device:</strong> {selectedPhoto.guid_device || "-"}</p>
+            <p><strong>Datetime:</strong> {selectedPhoto.datetime || "-"}</p>
+            <p><strong>Filter Nama/Tanggal/Bulan:</strong></p>
+            <AtomInput
+              atom={searchGrafikAtom}
+              className="border px-2 py-1 w-full mb-4"
+              placeholder="Contoh: ikbal / 2025-06 / 2025-06-10"
+            />
+            <div className="flex justify-between gap-2">
+              <button onClick={onClose} className="px-4 py-2 bg-gray-300 rounded">Batal</button>
+              <button onClick={onSave} className="px-4 py-2 bg-blue-600 text-white rounded">Simpan</button>
+              <button
+                onClick={() => onDelete(selectedPhoto.id)}
+                className="px-4 py-2 bg-red-600 text-white rounded"
+              >
+                Delete
+              </button>
+            </div>
+          </div>
+        </div>
+      )}
+    </>
+  );
+}
+
+export default KameraTab;
@@ -0,0 +1,149 @@
+// Thumbnail foto presensi.
+//
+// Foto asli di monja-file berukuran penuh (JPEG besar), sedangkan kartu hanya
+// menampilkan ~320px. Ada dua sumber thumbnail:
+//
+// - VITE_THUMBNAIL_BASE diset: layanan resize di server, dipanggil dengan
+//   `${base}?path=presensi/<gambar>&w=<lebar>&format=webp` dan dipakai lewat srcset.
+// - Tanpa layanan: thumbnail dibuat di browser (createImageBitmap + OffscreenCanvas
+//   -> WebP) lalu disimpan di Cache Storage, sehingga foto asli hanya diunduh
+//   sekali per perangkat, berikutnya langsung thumbnail kecil dari cache.
+//
+// Resolusi penuh hanya dipakai di modal detail (`photoUrl`).
+//
+// Unduhan foto berjalan di kelas prioritas thumbnail pada request scheduler,
+// jadi tidak berebut slot dengan request data yang sedang ditunggu user.
+
+import { PRIORITY, requestScheduler, hostOf, isAbortError } from "./request_scheduler.js";
+
+export const PHOTO_BASE_URL = "https://monja-file.pptik.id/v1/view?path=presensi/";
+export const FALLBACK_IMAGE = "/images/fallback.jpg";
+export const THUMBNAIL_BASE = import.meta.env?.VITE_THUMBNAIL_BASE || "";
+
+// Lebar rendition yang tersedia; permintaan dibulatkan ke atas agar cache kecil
+export const THUMBNAIL_WIDTHS = [160, 320, 640];
+
+const CACHE_NAME = "presensi-thumbnails-v1";
+const MAX_OBJECT_URLS = 300;
+
+export const photoUrl = (gambar) => `${PHOTO_BASE_URL}${gambar}`;
+
+export const snapWidth = (width) =>
+  THUMBNAIL_WIDTHS.find((candidate) => candidate >= width) ?? THUMBNAIL_WIDTHS[THUMBNAIL_WIDTHS.length - 1];
+
+export const thumbnailUrl = (gambar, width) =>
+  `${THUMBNAIL_BASE}?path=presensi/${encodeURIComponent(gambar)}&w=${snapWidth(width)}&format=webp`;
+
+// srcset untuk layanan thumbnail server; null jika layanan tidak dikonfigurasi
+export const thumbnailSrcSet = (gambar) =>
+  THUMBNAIL_BASE
+    ? THUMBNAIL_WIDTHS.map((width) => `${thumbnailUrl(gambar, width)} ${width}w`).join(", ")
+    : null;
+
+const PHOTO_HOST = hostOf(PHOTO_BASE_URL);
+
+// Host foto yang gagal diambil lewat fetch CORS selama sesi ini; kartu
+// berikutnya langsung memakai foto asli tanpa mencoba lagi
+const blockedHosts = new Set();
+
+export const canGenerateThumbnails = () =>
+  typeof createImageBitmap === "function" &&
+  typeof OffscreenCanvas === "function" &&
+  !blockedHosts.has(PHOTO_HOST);
+
+// Object URL per rendition (LRU sederhana: Map menjaga urutan masuk)
+const objectUrls = new Map();
+// key -> { promise, controller, users }: unduhan dibatalkan saat semua pemakai abort
+const inflight = new Map();
+
+const rememberObjectUrl = (key, blob) => {
+  const url = URL.createObjectURL(blob);
+  objectUrls.set(key, url);
+  if (objectUrls.size > MAX_OBJECT_URLS) {
+    const [oldestKey, oldestUrl] = objectUrls.entries().next().value;
+    objectUrls.delete(oldestKey);
+    URL.revokeObjectURL(oldestUrl);
+  }
+  return url;
+};
+
+// Slot scheduler juga membatasi decode foto besar agar tidak berjalan puluhan sekaligus
+const withSlot = (task, signal) =>
+  requestScheduler.schedule(task, { priority: PRIORITY.thumbnail, host: PHOTO_HOST, signal });
+
+// Ikuti unduhan bersama; `signal` pemanggil hanya menolak promise pemanggil,
+// unduhan baru dibatalkan jika tidak ada pemakai lain yang masih menunggu
+const follow = (entry, signal) => {
+  entry.users++;
+  if (!signal) return entry.promise;
+  return new Promise((resolve, reject) => {
+    const onAbort = () => {
+      reject(signal.reason ?? new DOMException("Aborted", "AbortError"));
+      if (--entry.users === 0) entry.controller.abort();
+    };
+    if (signal.aborted) {
+      onAbort();
+      return;
+    }
+    signal.addEventListener("abort", onAbort, { once: true });
+    entry.promise.then(resolve, reject).finally(() => signal.removeEventListener("abort", onAbort));
+  });
+};
+
+const openCache = () => (typeof caches !== "undefined" ? caches.open(CACHE_NAME).catch(() => null) : null);
+
+const renderThumbnail = async (blob, width) => {
+  const bitmap = await createImageBitmap(blob);
+  const scale = Math.min(1, width / bitmap.width);
+  const canvas = new OffscreenCanvas(Math.round(bitmap.width * scale), Math.round(bitmap.height * scale));
+  const context = canvas.getContext("2d");
+  context.imageSmoothingQuality = "high";
+  context.drawImage(bitmap, 0, 0, canvas.width, canvas.height);
+  bitmap.close();
+  return canvas.convertToBlob({ type: "image/webp", quality: 0.75 });
+};
+
+// Object URL thumbnail WebP untuk `gambar`; melempar error jika foto tidak
+// bisa diambil (mis. CORS / 404), pemanggil lalu memakai fallback. Dengan
+// `signal` (mis. kartu dilepas), unduhan yang tidak ditunggu lagi dibatalkan.
+export const getThumbnail = (gambar, width, { signal } = {}) => {
+  const snapped = snapWidth(width);
+  const key = `${gambar}@${snapped}`;
+  if (objectUrls.has(key)) return Promise.resolve(objectUrls.get(key));
+
+  let entry = inflight.get(key);
+  if (!entry) {
+    const cacheKey = `/thumbnails/${snapped}/${encodeURIComponent(gambar)}`;
+    const controller = new AbortController();
+    const promise = withSlot(async ({ signal: slotSignal }) => {
+      const cache = await openCache();
+      const cached = await cache?.match(cacheKey);
+      if (cached) return rememberObjectUrl(key, await cached.blob());
+
+      let response;
+      try {
+        response = await fetch(photoUrl(gambar), { mode: "cors", signal: slotSignal });
+      } catch (error) {
+        // fetch hanya melempar TypeError untuk CORS / jaringan, bukan 404.
+        // Service worker tidak melayani request mode cors (public/sw.js), jadi
+        // error ini berasal dari host foto, bukan dari response opaque di cache
+        if (!isAbortError(error)) blockedHosts.add(PHOTO_HOST);
+        throw error;
+      }
+      if (!response.ok) throw new Error(`Foto ${gambar} gagal diambil (${response.status})`);
+      const thumbnail = await renderThumbnail(await response.blob(), snapped);
+      await cache?.put(cacheKey, new Response(thumbnail, { headers: { "Content-Type": "image/webp" } }));
+      return rememberObjectUrl(key, thumbnail);
+    }, controller.signal).finally(() => inflight.delete(key));
+    entry = { promise, controller, users: 0 };
+    inflight.set(key, entry);
+  }
+  return follow(entry, signal);
+};
+
+// Hapus seluruh thumbnail buatan browser (mis. setelah foto diganti di server)
+export const clearThumbnailCache = async () => {
+  for (const url of objectUrls.values()) URL.revokeObjectURL(url);
+  objectUrls.clear();
+  if (typeof caches !== "undefined") await caches.delete(CACHE_NAME);
+};
@@ -0,0 +1,63 @@
+// Helper rentang waktu untuk query history per bulan.
+//
+// Tanggal memakai string "YYYY-MM-DD" (sama dengan `toDateKey` di
+// record_store.js) agar bisa dibandingkan langsung sebagai string.
+
+import { toDateKey } from "./record_store.js";
+
+const pad = (value) => String(value).padStart(2, "0");
+
+// "YYYY-MM" -> { start: "YYYY-MM-01", end: "YYYY-MM-<hari terakhir>" }
+export const monthRange = (month) => {
+  const [year, monthIndex] = month.split("-").map(Number);
+  const lastDay = new Date(Date.UTC(year, monthIndex, 0)).getUTCDate();
+  return { start: `${month}-01`, end: `${month}-${pad(lastDay)}` };
+};
+
+// Daftar bulan ("YYYY-MM") yang disentuh rentang [start, end]
+export const monthBuckets = (start, end) => {
+  const buckets = [];
+  let [year, month] = start.slice(0, 7).split("-").map(Number);
+  const last = end.slice(0, 7);
+  for (;;) {
+    const bucket = `${year}-${pad(month)}`;
+    if (bucket > last) break;
+    buckets.push(bucket);
+    month++;
+    if (month > 12) {
+      month = 1;
+      year++;
+    }
+  }
+  return buckets;
+};
+
+export const currentMonth = (now = new Date()) => `${now.getFullYear()}-${pad(now.getMonth() + 1)}`;
+
+// Rentang `count` bulan terakhir (termasuk bulan ini): { start, end }
+export const recentMonthsRange = (count = 1, now = new Date()) => {
+  const first = new Date(now.getFullYear(), now.getMonth() - (count - 1), 1);
+  return {
+    start: monthRange(currentMonth(first)).start,
+    end: monthRange(currentMonth(now)).end,
+  };
+};
+
+// Filter lokal dengan aturan yang sama seperti parameter query server;
+// dipakai untuk memotong bucket bulan ke rentang yang diminta dan sebagai
+// pengaman jika server mengabaikan parameter filter.
+export const matchesRange = (record, { start, end, device, person } = {}) => {
+  const date = toDateKey(record.datetime);
+  if (start && (!date || date < start)) return false;
+  if (end && (!date || date > end)) return false;
+  if (device && record.guid_device !== device) return false;
+  if (person && (record.nama || "").toLowerCase() !== person.toLowerCase()) return false;
+  return true;
+};
+
+// Ambil rentang [start, end] per bucket bulan (paralel) lewat
+// `fetchMonth(month)`, lalu potong ke rentang & filter yang diminta
+export const fetchByMonth = async (fetchMonth, filter) => {
+  const perMonth = await Promise.all(monthBuckets(filter.start, filter.end).map((month) => fetchMonth(month)));
+  return perMonth.flat().filter((item) => matchesRange(item, filter));
+};
@@ -0,0 +1,51 @@
+// State UI granular: nilai kecil (teks input, filter) disimpan di atom yang
+// bisa di-subscribe sendiri-sendiri, bukan di useState App. Komponen yang
+// membaca atom (lihat components/useAtom.js) hanya komponen itu yang render
+// ulang saat nilainya berubah; App cukup membaca nilai turunan yang sudah
+// di-debounce atau membaca `get()` saat aksi dijalankan.
+
+export const createAtom = (initial) => {
+  let value = initial;
+  const listeners = new Set();
+
+  const get = () => value;
+
+  // `next` boleh berupa fungsi (prev) => next seperti setState
+  const set = (next) => {
+    const resolved = typeof next === "function" ? next(value) : next;
+    if (Object.is(resolved, value)) return;
+    value = resolved;
+    for (const listener of listeners) listener(value);
+  };
+
+  const subscribe = (listener) => {
+    listeners.add(listener);
+    return () => listeners.delete(listener);
+  };
+
+  return { get, set, subscribe };
+};
+
+// Atom yang mengikuti `source` setelah `delay` ms tanpa perubahan baru
+// (untuk teks pencarian: filter tidak dijalankan di setiap ketikan)
+export const createDebouncedAtom = (source, delay = 150) => {
+  const atom = createAtom(source.get());
+  let timer = null;
+  const unsubscribe = source.subscribe((value) => {
+    clearTimeout(timer);
+    timer = setTimeout(() => atom.set(value), delay);
+  });
+  return {
+    get: atom.get,
+    subscribe: atom.subscribe,
+    // Terapkan nilai terakhir sekarang juga (mis. saat Enter / reset)
+    flush: () => {
+      clearTimeout(timer);
+      atom.set(source.get());
+    },
+    dispose: () => {
+      clearTimeout(timer);
+      unsubscribe();
+    },
+  };
+};
@@ -1,8 +1,21 @@
 import axios from "axios";
+import { requestCache, containsRecord } from "./request_cache";
+import { fetchAllPages } from "./paginate";
+import { readPageMeta } from "./page_window";
+import { instrumentAxios } from "./perf";
+import { scheduleAxios } from "./request_scheduler";
+
+export const PRESENSI_ORIGIN = import.meta.env?.VITE_PRESENSI_ORIGIN || "https://presensi-api.lskk.co.id";
+export const DEFAULT_INSTITUTION = "CMb80a";
 
 const api = axios.create({
-    baseURL: "https://presensi-api.lskk.co.id/api/v1/user/public?id-institution=CMb80a&isDeleted=false/"
+    baseURL: `${PRESENSI_ORIGIN}/api/v1/`,
 });
+instrumentAxios(api);
+scheduleAxios(api);
+
+// GET lewat cache bersama (TTL, stale-while-revalidate, dedup in-flight)
+const cachedGet = requestCache.wrap(api);
 
 // GET semua data dari semua halaman (misalnya 3 halaman)
 export const getDataAI = async () => {
@@ -10,36 +23,37 @@ export const getDataAI = async () => {
   return response.data;
 };
 
-export const getUserData = async (totalPages = 3) => {
-  let allData = [];
+// GET direktori user satu institusi. Halaman pertama menentukan total
+// halaman; sisanya (jika ada) diambil paralel, bukan satu per satu.
+export const getInstitutionUsers = async ({ institution = DEFAULT_INSTITUTION, force = false, signal } = {}) => {
+  const params = { "id-institution": institution, isDeleted: false };
+  const fetchPage = async (page) => {
+    const response = await cachedGet("/user/public", {
+      params: page === 1 ? params : { ...params, page },
+      signal,
+      cache: { force },
+    });
+    return readPageMeta(response.data, page);
+  };
 
-  for (let page = 1; page <= totalPages; page++) {
-    const response = await api.get("/history/get", { params: { page } });
-    if (response.data && response.data.data) {
-      allData = allData.concat(response.data.data);
-    }
+  const { data, errors } = await fetchAllPages(fetchPage, { maxPages: Infinity, signal });
+  if (errors.length > 0) {
+    console.error("Sebagian halaman user gagal diambil:", errors);
   }
-
-  return allData;
-}
-
-// GET data per halaman (jika kamu ingin tetap pakai pagination manual)
-export const getAllUserData = async (page) => {
-  const response = await api.get("/history/get", {
-    params: { page },
-  });
-  return response.data; 
+  return data;
 };
 
 // DELETE data by ID
 export const deleteUserData = async (id) => {
   const response = await api.delete(`/history/delete/${id}`);
+  requestCache.invalidate({ baseURL: api.defaults.baseURL, url: "/history/get" });
   return response.data;
 };
 
 // UPDATE data by ID
 export const updateUserData = async (id, data) => {
   const response = await api.put(`/history/update/${id}`, data);
+  requestCache.invalidate({ baseURL: api.defaults.baseURL, match: containsRecord(id) });
   return response.data;
 };
 
@@ -0,0 +1,108 @@
+// Registry user institusi: direktori dimuat sekali, dinormalisasi (URL foto,
+// teks pencarian) dan di-index per guid / nama / device, sehingga join
+// history -> user cukup lookup Map, bukan scan array atau request baru.
+//
+// `load()` hanya ke network jika data sudah lebih tua dari `ttl` (atau
+// `force`); pemanggilan bersamaan memakai request yang sama.
+
+import { normalizeText } from "./search_index.js";
+
+// Field id / device yang mungkin dipakai backend presensi untuk user
+const USER_ID_FIELDS = ["guid", "_id", "id"];
+const USER_DEVICE_FIELDS = ["guid_device", "guidDevice", "deviceId", "device_id"];
+
+const resolvePhoto = (photo, photoBase) => {
+  if (!photo) return null;
+  return photo.startsWith("http") ? photo : `${photoBase}${photo}`;
+};
+
+const firstValue = (user, fields) => {
+  for (const field of fields) {
+    if (user[field] !== undefined && user[field] !== null && user[field] !== "") return user[field];
+  }
+  return null;
+};
+
+export const createUserRegistry = ({ fetchUsers, ttl = 10 * 60 * 1000, photoBase = "" }) => {
+  let users = [];
+  let loadedAt = 0;
+  let inflight = null;
+  let version = 0;
+  const byGuid = new Map();
+  const byName = new Map();
+  const byDevice = new Map();
+  const listeners = new Set();
+
+  const index = (rawUsers) => {
+    byGuid.clear();
+    byName.clear();
+    byDevice.clear();
+    users = rawUsers.map((raw) => {
+      const user = {
+        ...raw,
+        photo: resolvePhoto(raw.photo, photoBase),
+        searchText: normalizeText([raw.name, raw.unit, raw.detail].filter(Boolean).join(" ")),
+      };
+      const guid = firstValue(raw, USER_ID_FIELDS);
+      if (guid !== null) byGuid.set(String(guid), user);
+      const name = normalizeText(raw.name);
+      if (name && !byName.has(name)) byName.set(name, user);
+      const device = firstValue(raw, USER_DEVICE_FIELDS);
+      if (device !== null) byDevice.set(String(device), user);
+      return user;
+    });
+    version++;
+    for (const listener of listeners) listener(users);
+  };
+
+  const isStale = () => Date.now() - loadedAt > ttl;
+
+  const load = ({ force = false } = {}) => {
+    if (!force && loadedAt > 0 && !isStale()) return Promise.resolve(users);
+    if (inflight) return inflight;
+    inflight = fetchUsers({ force })
+      .then((rawUsers) => {
+        index(rawUsers || []);
+        loadedAt = Date.now();
+        return users;
+      })
+      .finally(() => {
+        inflight = null;
+      });
+    return inflight;
+  };
+
+  const getByGuid = (guid) => (guid === undefined || guid === null ? null : byGuid.get(String(guid)) || null);
+  const getByDevice = (device) => (device === undefined || device === null ? null : byDevice.get(String(device)) || null);
+  const getByName = (name) => byName.get(normalizeText(name)) || null;
+
+  // User pemilik record history: lewat guid_device, lalu nama
+  const joinRecord = (record) => {
+    if (!record) return null;
+    return getByDevice(record.guid_device) || getByGuid(record.guid_device) || getByName(record.nama);
+  };
+
+  // Filter nama / unit / detail; setiap kata query harus ada di teks user
+  const search = (term) => {
+    const words = normalizeText(term).split(/\s+/).filter(Boolean);
+    if (words.length === 0) return users;
+    return users.filter((user) => words.every((word) => user.searchText.includes(word)));
+  };
+
+  return {
+    load,
+    isStale,
+    getUsers: () => users,
+    getByGuid,
+    getByName,
+    getByDevice,
+    joinRecord,
+    search,
+    size: () => users.length,
+    getVersion: () => version,
+    subscribe: (listener) => {
+      listeners.add(listener);
+      return () => listeners.delete(listener);
+    },
+  };
+};
@@ -0,0 +1,32 @@
+// Tipe pesan antara main thread dan worker dashboard (lihat worker_pool.js
+// dan workers/dashboard.worker.js).
+//
+// Request  : { id, type, payload }
+// Response : { id, ok: true, result } | { id, ok: false, error }
+// Progress : { id, progress: { done, total } }
+// Cancel   : { id, type: TASK.CANCEL }
+
+export const TASK = {
+  // payload : { format: "csv" | "xlsx" | "pdf", sources: [{ url, params? }], query?, fileName }
+  // progress: { done, pages, total }   (total null jika server tidak memberi total)
+  // result  : { buffer: ArrayBuffer | blob: Blob, mime, fileName, rows }
+  EXPORT: "export",
+  CANCEL: "cancel",
+};
+
+// Kolom yang diekspor ke Excel / PDF
+export const EXPORT_COLUMNS = [
+  { key: "nama", label: "Nama" },
+  { key: "guid_device", label: "GUID Device" },
+  { key: "datetime", label: "Tanggal" },
+  { key: "unit", label: "Unit" },
+  { key: "keletihan", label: "Keletihan" },
+  { key: "mood", label: "Suasana Hati" },
+];
+
+export class TaskCancelledError extends Error {
+  constructor() {
+    super("Task dibatalkan");
+    this.name = "AbortError";
+  }
+}
@@ -0,0 +1,92 @@
+// Pool Web Worker untuk task berat dashboard (export).
+//
+// `run(type, payload, { signal, onProgress, transfer })` mengirim task ke
+// worker yang paling sedikit antriannya; `signal` membatalkan task (export
+// baru membatalkan export lama lewat AbortController di App).
+
+import { TASK, TaskCancelledError } from "./worker_messages.js";
+
+const createDashboardWorker = () =>
+  new Worker(new URL("./workers/dashboard.worker.js", import.meta.url), { type: "module" });
+
+export const createWorkerPool = ({
+  create = createDashboardWorker,
+  size = Math.max(1, Math.min(2, (globalThis.navigator?.hardwareConcurrency || 2) - 1)),
+} = {}) => {
+  let nextId = 1;
+  const pending = new Map();
+
+  const workers = Array.from({ length: size }, () => {
+    const worker = create();
+    const slot = { worker, busy: 0 };
+    worker.onmessage = (event) => {
+      const { id, ok, result, error, progress } = event.data;
+      const task = pending.get(id);
+      if (!task) return;
+      if (progress) {
+        task.onProgress?.(progress);
+        return;
+      }
+      finish(id);
+      if (ok) task.resolve(result);
+      else task.reject(Object.assign(new Error(error.message), { name: error.name }));
+    };
+    return slot;
+  });
+
+  function finish(id) {
+    const task = pending.get(id);
+    if (!task) return;
+    pending.delete(id);
+    task.slot.busy--;
+    task.cleanup?.();
+  }
+
+  const cancel = (id) => {
+    const task = pending.get(id);
+    if (!task) return;
+    task.slot.worker.postMessage({ id, type: TASK.CANCEL });
+    finish(id);
+    task.reject(new TaskCancelledError());
+  };
+
+  const post = (slot, type, payload, { signal, onProgress, transfer = [] } = {}) =>
+    new Promise((resolve, reject) => {
+      if (signal?.aborted) {
+        reject(new TaskCancelledError());
+        return;
+      }
+      const id = nextId++;
+      const onAbort = () => cancel(id);
+      signal?.addEventListener("abort", onAbort, { once: true });
+      pending.set(id, {
+        slot,
+        resolve,
+        reject,
+        onProgress,
+        cleanup: () => signal?.removeEventListener("abort", onAbort),
+      });
+      slot.busy++;
+      slot.worker.postMessage({ id, type, payload }, transfer);
+    });
+
+  const leastBusy = () => workers.reduce((best, slot) => (slot.busy < best.busy ? slot : best));
+
+  return {
+    run: (type, payload, options) => post(leastBusy(), type, payload, options),
+    terminate: () => {
+      for (const id of [...pending.keys()]) cancel(id);
+      for (const { worker } of workers) worker.terminate();
+    },
+  };
+};
+
+// Simpan hasil export (ArrayBuffer atau Blob) sebagai file download
+export const downloadBuffer = ({ buffer, blob, mime, fileName }) => {
+  const url = URL.createObjectURL(blob || new Blob([buffer], { type: mime }));
+  const link = document.createElement("a");
+  link.href = url;
+  link.download = fileName;
+  link.click();
+  setTimeout(() => URL.revokeObjectURL(url), 0);
+};
@@ -0,0 +1,104 @@
+// Worker untuk export data dashboard, agar main thread (input, animasi) tetap
+// responsif. Pencarian dan kehadiran tidak dipindah ke sini karena index-nya
+// diperbarui inkremental per record (search_index.js, attendance_matrix.js);
+// grafik modal detail hanya memproses record satu device (downsample.js).
+//
+// Export mengambil data langsung dari API per halaman (lihat export_stream.js),
+// jadi main thread tidak pernah memegang seluruh history.
+
+import { TASK, TaskCancelledError } from "../worker_messages.js";
+import { EXPORT_FORMATS, createExportWriter, streamSourcePages, toExportRow } from "../export_stream.js";
+import { compileQuery } from "../search_index.js";
+import { recordId } from "../record_store.js";
+
+// id task -> AbortController, untuk membatalkan fetch halaman yang sedang berjalan
+const controllers = new Map();
+
+// Jumlah baris per chunk yang ditulis sebelum memberi kesempatan pesan cancel masuk
+const CHUNK_SIZE = 5000;
+
+const yieldToMessages = () => new Promise((resolve) => setTimeout(resolve, 0));
+
+const handlers = {
+  [TASK.EXPORT]: async ({ format = "xlsx", sources = [], query = "", fileName = "data_kamera" }, { id, progress }) => {
+    const controller = new AbortController();
+    controllers.set(id, controller);
+    const checkCancelled = () => {
+      if (controller.signal.aborted) throw new TaskCancelledError();
+    };
+
+    const matches = compileQuery(query);
+    const writer = await createExportWriter(format);
+    // Record yang muncul di lebih dari satu sumber (kamera + AI) hanya ditulis sekali
+    const seen = new Set();
+    let done = 0;
+    let pages = 0;
+    let total = 0;
+    let totalKnown = true;
+
+    try {
+      for (const source of sources) {
+        let sourceCounted = false;
+        for await (const page of streamSourcePages(source, { signal: controller.signal })) {
+          checkCancelled();
+          if (!sourceCounted) {
+            if (page.total === null) totalKnown = false;
+            else total += page.total;
+            sourceCounted = true;
+          }
+
+          const rows = [];
+          for (const record of page.items) {
+            const key = recordId(record);
+            if (key !== undefined && key !== null) {
+              if (seen.has(key)) continue;
+              seen.add(key);
+            }
+            if (matches(record)) rows.push(toExportRow(record));
+          }
+          for (let offset = 0; offset < rows.length; offset += CHUNK_SIZE) {
+            writer.write(rows.slice(offset, offset + CHUNK_SIZE));
+            await yieldToMessages();
+            checkCancelled();
+          }
+
+          done += rows.length;
+          pages++;
+          progress({ done, pages, total: totalKnown ? total : null });
+        }
+      }
+    } catch (error) {
+      if (controller.signal.aborted) throw new TaskCancelledError();
+      throw error;
+    }
+
+    checkCancelled();
+    const { extension, mime } = EXPORT_FORMATS[format] || EXPORT_FORMATS.xlsx;
+    const output = writer.finish();
+    const file = `${fileName}.${extension}`;
+    // CSV berupa Blob (dikirim tanpa menyalin isi); format lain ArrayBuffer yang dipindah
+    if (output instanceof Blob) return { blob: output, mime, fileName: file, rows: done };
+    return { result: { buffer: output, mime, fileName: file, rows: done }, transfer: [output] };
+  },
+};
+
+self.onmessage = async (event) => {
+  const { id, type, payload } = event.data;
+  if (type === TASK.CANCEL) {
+    controllers.get(id)?.abort();
+    return;
+  }
+
+  const progress = (value) => self.postMessage({ id, progress: value });
+  try {
+    const handler = handlers[type];
+    if (!handler) throw new Error(`Task tidak dikenal: ${type}`);
+    const output = await handler(payload, { id, progress });
+    const { result, transfer = [] } = output && "transfer" in output ? output : { result: output };
+    self.postMessage({ id, ok: true, result }, transfer);
+  } catch (error) {
+    self.postMessage({ id, ok: false, error: { name: error.name, message: error.message } });
+  } finally {
+    controllers.delete(id);
+  }
+};
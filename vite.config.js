@@ -1,8 +1,73 @@
 import { defineConfig } from 'vite'
+import { gzipSync } from 'node:zlib'
 import preact from '@preact/preset-vite'
 import tailwindcss from '@tailwindcss/vite'
 
+// Batas ukuran bundle (gzip, KB). "initial" = entry + semua chunk yang di-import
+// statis olehnya, yaitu JS yang harus diunduh sebelum tab kamera tampil.
+const BUNDLE_BUDGET = {
+  initial: 90,
+  chunk: 180,
+}
+
+// Library besar dipisah ke chunk sendiri agar cache-nya tidak ikut berubah
+// setiap kode aplikasi berubah; hanya dimuat oleh modul yang di-import lazy
+const manualChunks = (id) => {
+  if (!id.includes('node_modules')) return undefined
+  if (/node_modules\/(recharts|recharts-scale|react-smooth|victory-vendor|d3-[^/]+)\//.test(id)) return 'charts'
+  if (/node_modules\/(preact|@preact)\//.test(id)) return 'preact'
+  return undefined
+}
+
+// Laporkan ukuran gzip setiap chunk dan gagalkan build jika melewati BUNDLE_BUDGET
+// (set BUNDLE_BUDGET=warn untuk hanya memberi peringatan)
+const bundleBudget = (budget) => ({
+  name: 'bundle-budget',
+  apply: 'build',
+  generateBundle(_, bundle) {
+    const chunks = Object.values(bundle).filter((file) => file.type === 'chunk')
+    const gzipKb = new Map(chunks.map((chunk) => [chunk.fileName, gzipSync(chunk.code).length / 1024]))
+    const byName = new Map(chunks.map((chunk) => [chunk.fileName, chunk]))
+
+    const violations = []
+    for (const entry of chunks.filter((chunk) => chunk.isEntry)) {
+      const seen = new Set()
+      const visit = (fileName) => {
+        if (seen.has(fileName)) return
+        seen.add(fileName)
+        for (const imported of byName.get(fileName)?.imports || []) visit(imported)
+      }
+      visit(entry.fileName)
+      const total = [...seen].reduce((sum, fileName) => sum + (gzipKb.get(fileName) || 0), 0)
+      this.info?.(`initial JS ${entry.fileName}: ${total.toFixed(1)} KB gzip`)
+      if (total > budget.initial) {
+        violations.push(`initial JS ${entry.fileName} ${total.toFixed(1)} KB > ${budget.initial} KB`)
+      }
+    }
+    for (const [fileName, size] of gzipKb) {
+      if (size > budget.chunk) violations.push(`chunk ${fileName} ${size.toFixed(1)} KB > ${budget.chunk} KB`)
+    }
+
+    if (violations.length === 0) return
+    const message = `Bundle melewati batas ukuran (gzip):\n  ${violations.join('\n  ')}`
+    if (process.env.BUNDLE_BUDGET === 'warn') this.warn(message)
+    else this.error(message)
+  },
+})
+
 // https://vite.dev/config/
 export default defineConfig({
-  plugins: [preact(), tailwindcss()],
+  plugins: [preact(), tailwindcss(), bundleBudget(BUNDLE_BUDGET)],
+  // Worker export memakai dynamic import (xlsx / jspdf), perlu format ES
+  worker: {
+    format: 'es',
+  },
+  build: {
+    chunkSizeWarningLimit: 600,
+    rollupOptions: {
+      output: {
+        manualChunks,
+      },
+    },
+  },
 })